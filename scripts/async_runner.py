@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+scripts/async_runner.py
+asyncio 기반 자식 프로세스 실행 코어
+
+스레드를 자식마다 두지 않고 하나의 이벤트 루프에서 여러 풀이 프로세스의 표준 입출력과 종료를 처리합니다.
+- 표준 입력은 파일(메모리 데이터는 memfd)을 그대로 연결하고, 표준 출력은 읽는 즉시 조각 단위로 넘깁니다.
+- 테스트마다 제한 시간이 지나거나, 출력 제한을 넘거나, 작업이 취소되면 프로세스 그룹 전체를 종료합니다.
+
+asyncio.create_subprocess_exec 는 자식 회수를 child watcher 에 맡기기 때문에(3.11 기본값은 자식마다 스레드 하나)
+rusage(CPU 시간, 최대 RSS)를 얻을 수 없습니다. 그래서 Linux 에서는 pidfd 로 종료를 기다린 뒤 os.wait4 로 직접 회수하고,
+pidfd 를 쓸 수 없는 플랫폼에서는 create_subprocess_exec 로 실행하여 벽시계 시간만 측정합니다.
+"""
+
+import asyncio
+import functools
+import os
+import subprocess
+import time
+
+from process_runner import ProcessOutcome, capture_streams, kill_process_tree, open_stdin, rusage_to_kb
+
+# 표준 출력을 한 번에 읽는 크기 (바이트)
+STREAM_CHUNK_BYTES = 1 << 16
+
+# 종료 시그널을 보낸 뒤 프로세스 회수를 기다리는 최대 시간 (초)
+KILL_GRACE_SECONDS = 5
+
+
+@functools.lru_cache(maxsize=None)
+def pidfd_supported():
+    """pidfd 로 자식 종료를 기다릴 수 있는지 확인합니다."""
+    if not hasattr(os, 'pidfd_open') or not hasattr(os, 'wait4'):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False
+    return True
+
+
+async def _pump_output(reader, capture, on_exceed):
+    while True:
+        chunk = await reader.read(STREAM_CHUNK_BYTES)
+        if not chunk:
+            return
+        if capture.exceeded:
+            continue
+        capture.write(chunk)
+        if capture.exceeded:
+            on_exceed()
+
+
+async def _open_reader(loop, pipe):
+    reader = asyncio.StreamReader(limit=STREAM_CHUNK_BYTES, loop=loop)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader, loop=loop), pipe)
+    return reader
+
+
+async def _wait_pidfd(loop, pid):
+    """pidfd 가 읽기 가능해질 때(자식 종료)까지 기다립니다."""
+    pidfd = os.pidfd_open(pid)
+    exited = loop.create_future()
+
+    def on_exit():
+        if not exited.done():
+            exited.set_result(None)
+
+    loop.add_reader(pidfd, on_exit)
+    try:
+        await exited
+    finally:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+
+
+def _stop_on_output_limit(process, outcome):
+    """출력 제한을 넘은 프로세스를 바로 종료합니다. (출력이 계속 쌓이는 것을 제한 시간까지 기다리지 않습니다)"""
+    outcome.output_exceeded = True
+    kill_process_tree(process)
+
+
+def _reap(process, outcome):
+    """종료된 자식을 wait4 로 회수하며 rusage 를 기록합니다."""
+    _, status, rusage = os.wait4(process.pid, 0)
+    # Popen 이 같은 자식을 다시 회수하지 않도록 종료 코드를 직접 기록합니다.
+    process.returncode = os.waitstatus_to_exitcode(status)
+    outcome.user_time = rusage.ru_utime
+    outcome.sys_time = rusage.ru_stime
+    outcome.peak_rss_kb = rusage_to_kb(rusage.ru_maxrss)
+
+
+async def _run_with_pidfd(cmd, stdin_file, timeout, stdout_capture, stderr_capture, outcome):
+    loop = asyncio.get_running_loop()
+    start_time = time.perf_counter()
+    process = subprocess.Popen(cmd, stdin=stdin_file, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               start_new_session=True)
+    on_exceed = functools.partial(_stop_on_output_limit, process, outcome)
+    pumps = [
+        asyncio.ensure_future(_pump_output(await _open_reader(loop, process.stdout), stdout_capture, on_exceed)),
+        asyncio.ensure_future(_pump_output(await _open_reader(loop, process.stderr), stderr_capture, on_exceed)),
+    ]
+    try:
+        try:
+            await asyncio.wait_for(_wait_pidfd(loop, process.pid), timeout)
+        except asyncio.TimeoutError:
+            outcome.timed_out = True
+            kill_process_tree(process)
+            await asyncio.wait_for(_wait_pidfd(loop, process.pid), KILL_GRACE_SECONDS)
+        _reap(process, outcome)
+        outcome.wall_time = time.perf_counter() - start_time
+    except BaseException:
+        # 취소되거나 오류가 나도 자식과 그 자손이 남지 않게 합니다.
+        kill_process_tree(process)
+        if process.returncode is None:
+            _reap(process, outcome)
+        for pump in pumps:
+            pump.cancel()
+        raise
+    # 풀이가 남겨 둔 자손 프로세스가 출력 파이프를 잡고 있지 않도록 정리합니다.
+    kill_process_tree(process)
+    await asyncio.gather(*pumps, return_exceptions=True)
+    outcome.returncode = process.returncode
+
+
+async def _run_with_asyncio(cmd, stdin_file, timeout, stdout_capture, stderr_capture, outcome):
+    start_time = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdin=stdin_file, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True
+    )
+    on_exceed = functools.partial(_stop_on_output_limit, process, outcome)
+    pumps = [
+        asyncio.ensure_future(_pump_output(process.stdout, stdout_capture, on_exceed)),
+        asyncio.ensure_future(_pump_output(process.stderr, stderr_capture, on_exceed)),
+    ]
+    try:
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            outcome.timed_out = True
+            kill_process_tree(process)
+            await process.wait()
+        outcome.wall_time = time.perf_counter() - start_time
+    except BaseException:
+        kill_process_tree(process)
+        for pump in pumps:
+            pump.cancel()
+        raise
+    kill_process_tree(process)
+    await asyncio.gather(*pumps, return_exceptions=True)
+    outcome.returncode = process.returncode
+
+
+async def run_measured_async(cmd, input_data=b'', timeout=5, stdout_sink=None, stdin_path=None, output_limit=None):
+    """process_runner.run_measured 와 같은 ProcessOutcome 을 반환하는 코루틴
+
+    작업이 취소되면(asyncio.CancelledError) 프로세스 그룹을 종료한 뒤 취소를 그대로 전달합니다.
+    """
+    outcome = ProcessOutcome()
+    stdout_capture, stderr_capture = capture_streams(stdout_sink, output_limit)
+    run = _run_with_pidfd if pidfd_supported() else _run_with_asyncio
+    with open_stdin(input_data, stdin_path) as stdin_file:
+        await run(cmd, stdin_file, timeout, stdout_capture, stderr_capture, outcome)
+    outcome.stdout = stdout_capture.getvalue()
+    outcome.stdout_truncated = stdout_capture.truncated
+    outcome.stderr = stderr_capture.getvalue()
+    return outcome
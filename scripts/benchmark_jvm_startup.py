@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+scripts/benchmark_jvm_startup.py
+CDS 아카이브와 시작 시간 위주 JVM 옵션이 실행 한 번의 시간을 얼마나 줄이는지 측정합니다.
+
+풀이가 흔히 쓰는 클래스를 사용하는 워밍업 프로그램(scripts/java/CdsWarmup.java)을
+설정마다 여러 번 실행하여 벽시계 시간의 최소/중앙값/평균을 비교합니다.
+설정 사이의 부하 변화가 결과에 치우치지 않도록 설정을 번갈아 가며 실행합니다.
+
+사용법: python scripts/benchmark_jvm_startup.py [--runs 20] [--cache-dir DIR] [--output FILE]
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from class_cache import DEFAULT_CACHE_DIR
+from jvm_startup import (
+    JVM_FLAGS_STARTUP, WARMUP_CLASS, WARMUP_INPUT, WARMUP_SOURCE,
+    build_cds_archive, cds_options, get_java_version, jvm_flag_profile_options
+)
+from process_runner import percentile, run_measured
+from resource_limits import ResourceProfile
+
+
+def build_configurations(archive):
+    """(이름, 추가 JVM 옵션) 목록"""
+    startup_flags = jvm_flag_profile_options(JVM_FLAGS_STARTUP)
+    return [
+        ('CDS 끔', ['-Xshare:off']),
+        ('JDK 기본', []),
+        ('AppCDS', cds_options(archive)),
+        ('AppCDS + startup 옵션', [*cds_options(archive), *startup_flags]),
+    ]
+
+
+def run_benchmark(classes_dir, configurations, runs):
+    """설정별 실행 시간 목록을 반환합니다."""
+    profile = ResourceProfile(cap_address_space=False)
+    timings = {name: [] for name, _ in configurations}
+    for _ in range(runs):
+        for name, options in configurations:
+            cmd = ['java', *profile.jvm_options(), *options, '-cp', classes_dir, WARMUP_CLASS]
+            outcome = run_measured(cmd, WARMUP_INPUT, timeout=30)
+            if outcome.returncode != 0:
+                raise RuntimeError(f"{name} 실행 실패: {outcome.stderr.decode('utf-8', errors='replace')[:500]}")
+            timings[name].append(outcome.wall_time)
+    return timings
+
+
+def summarize(timings):
+    summary = {}
+    for name, values in timings.items():
+        summary[name] = {
+            'min': min(values), 'median': statistics.median(values),
+            'mean': statistics.mean(values), 'p90': percentile(values, 0.9)
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JVM 시작 시간 벤치마크 (CDS 아카이브 유무 비교)')
+    parser.add_argument('--runs', type=int, default=20, help='설정별 실행 횟수')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='CDS 아카이브를 저장할 캐시 디렉토리')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    args = parser.parse_args()
+
+    java_version = get_java_version()
+    if java_version is None:
+        print("❌ java 를 찾을 수 없습니다.")
+        sys.exit(1)
+    print(f"☕ {java_version.splitlines()[0]}")
+
+    archive = build_cds_archive(args.cache_dir, java_version)
+    print(f"📦 CDS 아카이브: {archive}")
+
+    classes_dir = tempfile.mkdtemp(prefix='startup_bench_')
+    try:
+        subprocess.run(['javac', '-encoding', 'UTF-8', '-d', classes_dir, str(WARMUP_SOURCE)],
+                       check=True, capture_output=True, timeout=60)
+        summary = summarize(run_benchmark(classes_dir, build_configurations(archive), max(1, args.runs)))
+    finally:
+        shutil.rmtree(classes_dir, ignore_errors=True)
+
+    baseline = summary['CDS 끔']['median']
+    print(f"\n⏱️ 실행 {args.runs}회 기준 벽시계 시간 (초)")
+    print(f"{'설정':<24}{'최소':>8}{'중앙값':>8}{'평균':>8}{'p90':>8}{'중앙값 비율':>12}")
+    for name, stats in summary.items():
+        print(f"{name:<24}{stats['min']:>8.3f}{stats['median']:>8.3f}{stats['mean']:>8.3f}{stats['p90']:>8.3f}"
+              f"{stats['median'] / baseline:>11.0%}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'java_version': java_version, 'runs': args.runs, 'results': summary},
+                      f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
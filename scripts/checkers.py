@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+scripts/checkers.py
+문제별로 선택할 수 있는 출력 채점기(checker) 모음
+
+- exact     : 줄 단위 비교 (앞뒤 공백 무시, 기본값)
+- token     : 공백으로 나눈 토큰 단위 비교
+- float     : 토큰 단위 비교 + 실수는 절대/상대 오차 허용
+- unordered : 줄 순서를 무시한 비교
+- custom    : 문제별 채점 프로그램 (입력, 예상 출력, 실제 출력 파일을 인자로 받아 종료 코드 0 이면 정답)
+
+모든 채점기는 open(test_case) 로 테스트 하나를 위한 세션을 만들고,
+세션은 StreamingComparator 와 같은 feed()/finish()/mismatch/describe_mismatch() 를 제공합니다.
+"""
+
+import math
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
+
+from data_store import compression_of, copy_data, iter_data_chunks, open_data
+from output_compare import StreamingComparator, iter_lines_from_bytes, iter_records, preview_bytes
+from process_runner import run_measured
+
+CHECKER_EXACT = 'exact'
+CHECKER_TOKEN = 'token'
+CHECKER_FLOAT = 'float'
+CHECKER_UNORDERED = 'unordered'
+CHECKER_CUSTOM = 'custom'
+
+# 문제 설명에 오차 범위만 있고 값이 없을 때 사용하는 허용 오차
+DEFAULT_FLOAT_EPS = 1e-6
+
+# 채점 프로그램 한 번 실행의 제한 시간 (초)
+CHECKER_TIMEOUT_SECONDS = 10
+
+# 채점 프로그램 메시지를 결과에 남길 최대 길이
+CHECKER_MESSAGE_LIMIT = 500
+
+
+def read_expected_bytes(test_case):
+    """테스트케이스의 예상 출력을 bytes 로 읽습니다."""
+    if test_case.get('output_file'):
+        with open_data(test_case['output_file']) as f:
+            return f.read()
+    return (test_case.get('output') or '').encode('utf-8')
+
+
+def iter_tokens_from_bytes(data):
+    """bytes 에서 공백으로 구분된 토큰을 차례로 만듭니다."""
+    for match in re.finditer(rb'\S+', data):
+        yield match.group()
+
+
+def iter_tokens_from_chunks(chunks):
+    """조각 단위로 들어오는 bytes 에서 토큰을 차례로 만듭니다. (조각 경계에 걸친 토큰은 이어 붙입니다)"""
+    pending = b''
+    for chunk in chunks:
+        data = pending + chunk
+        tokens = data.split()
+        pending = tokens.pop() if tokens and not data[-1:].isspace() else b''
+        yield from tokens
+    if pending:
+        yield pending
+
+
+def iter_tokens_from_file(path):
+    """파일을 메모리 맵으로 열어 토큰을 차례로 만듭니다. 압축된 파일은 조각 단위로 풀면서 읽습니다."""
+    if compression_of(path):
+        yield from iter_tokens_from_chunks(iter_data_chunks(path))
+        return
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 메모리 맵을 만들 수 없습니다.
+            return
+        with mapped:
+            for match in re.finditer(rb'\S+', mapped):
+                yield match.group()
+
+
+def describe_mismatch(mismatch):
+    """채점기가 남긴 불일치 정보를 사람이 읽을 수 있는 문자열로 만듭니다."""
+    if not mismatch:
+        return ""
+    if mismatch.get('message'):
+        return mismatch['message']
+    if 'token' in mismatch:
+        position = f"{mismatch['token']}번째 토큰"
+    elif mismatch.get('line') is not None:
+        position = f"{mismatch['line']}번째 줄"
+    else:
+        position = "출력"
+    expected, actual = mismatch.get('expected'), mismatch.get('actual')
+    if actual is None:
+        return f"출력이 예상보다 짧습니다 ({position} {expected!r} 없음)"
+    if expected is None:
+        return f"출력이 예상보다 깁니다 ({position} {actual!r})"
+    return f"{position} 불일치 (예상 {expected!r}, 실제 {actual!r})"
+
+
+class TokenComparator:
+    """출력 조각을 받을 때마다 토큰 단위로 예상 출력과 비교하고, 처음 다른 토큰에서 멈춥니다."""
+
+    def __init__(self, expected_tokens, token_equal=None):
+        self.expected = iter(expected_tokens)
+        self.token_equal = token_equal or (lambda expected, actual: expected == actual)
+        self.partial = []
+        self.count = 0
+        self.matched = None
+        self.mismatch = None
+
+    def _consume_token(self, token):
+        self.count += 1
+        expected = next(self.expected, None)
+        if expected is None or not self.token_equal(expected, token):
+            self._fail(expected, token)
+
+    def _fail(self, expected, actual):
+        self.matched = False
+        self.mismatch = {
+            'token': self.count + (1 if actual is None else 0),
+            'expected': preview_bytes(expected),
+            'actual': preview_bytes(actual),
+        }
+
+    def feed(self, chunk):
+        """출력 조각을 비교합니다. 이미 불일치가 발견되었으면 무시합니다."""
+        if self.matched is False or not chunk:
+            return
+        pieces = chunk.split()
+        if self.partial:
+            if chunk[:1].isspace():
+                self._consume_token(b''.join(self.partial))
+                self.partial = []
+            elif len(pieces) == 1 and not chunk[-1:].isspace():
+                # 조각 전체가 한 토큰의 일부이면 이어 붙이지 않고 모아 둡니다.
+                self.partial.append(chunk)
+                return
+            else:
+                self.partial.append(pieces[0])
+                pieces[0] = b''.join(self.partial)
+                self.partial = []
+        if pieces and not chunk[-1:].isspace():
+            self.partial = [pieces.pop()]
+        for piece in pieces:
+            if self.matched is False:
+                return
+            self._consume_token(piece)
+
+    def finish(self):
+        """출력이 끝났음을 알리고 최종 일치 여부를 반환합니다."""
+        if self.matched is False:
+            return False
+        if self.partial:
+            token = b''.join(self.partial)
+            self.partial = []
+            self._consume_token(token)
+            if self.matched is False:
+                return False
+        remaining = next(self.expected, None)
+        if remaining is not None:
+            self._fail(remaining, None)
+            return False
+        self.matched = True
+        return True
+
+    def describe_mismatch(self):
+        return describe_mismatch(self.mismatch)
+
+
+class BufferedSession:
+    """출력을 모두 모은 뒤 judge(actual_bytes) -> (일치 여부, 불일치 정보) 로 채점하는 세션"""
+
+    def __init__(self, judge):
+        self.judge = judge
+        self.chunks = []
+        self.matched = None
+        self.mismatch = None
+
+    def feed(self, chunk):
+        if chunk:
+            self.chunks.append(chunk)
+
+    def finish(self):
+        if self.matched is None:
+            actual, self.chunks = b''.join(self.chunks), []
+            self.matched, self.mismatch = self.judge(actual)
+        return self.matched
+
+    def describe_mismatch(self):
+        return describe_mismatch(self.mismatch)
+
+
+class Checker:
+    """채점기 기본 클래스"""
+    name = CHECKER_EXACT
+
+    def open(self, test_case):
+        """테스트 하나를 채점할 세션을 만듭니다."""
+        raise NotImplementedError
+
+    def check(self, expected, actual, input_data=''):
+        """전체 출력 문자열 두 개를 비교합니다."""
+        session = self.open({'input': input_data, 'output': expected})
+        session.feed((actual or '').encode('utf-8'))
+        return session.finish()
+
+    def describe(self):
+        """로그에 표시할 채점 방식 설명"""
+        return self.name
+
+    def close(self):
+        """채점기가 사용한 자원을 정리합니다."""
+
+
+class ExactChecker(Checker):
+    """줄 단위 비교 (기존 normalize_output 규칙)"""
+    name = CHECKER_EXACT
+
+    def open(self, test_case):
+        if test_case.get('output_file'):
+            return StreamingComparator.from_file(test_case['output_file'])
+        return StreamingComparator.from_text(test_case.get('output', ''))
+
+
+class TokenChecker(Checker):
+    """공백 종류와 줄바꿈 위치를 무시하고 토큰만 비교합니다."""
+    name = CHECKER_TOKEN
+
+    def token_equal(self, expected, actual):
+        return expected == actual
+
+    def open(self, test_case):
+        if test_case.get('output_file'):
+            tokens = iter_tokens_from_file(test_case['output_file'])
+        else:
+            tokens = iter_tokens_from_bytes((test_case.get('output') or '').encode('utf-8'))
+        return TokenComparator(tokens, self.token_equal)
+
+
+class FloatChecker(TokenChecker):
+    """실수 토큰은 절대 오차 또는 상대 오차가 허용 범위 이내이면 같은 것으로 봅니다."""
+    name = CHECKER_FLOAT
+
+    def __init__(self, abs_eps=DEFAULT_FLOAT_EPS, rel_eps=DEFAULT_FLOAT_EPS):
+        self.abs_eps = float(abs_eps or 0)
+        self.rel_eps = float(rel_eps or 0)
+
+    def token_equal(self, expected, actual):
+        if expected == actual:
+            return True
+        try:
+            expected_value, actual_value = float(expected), float(actual)
+        except ValueError:
+            return False
+        if not (math.isfinite(expected_value) and math.isfinite(actual_value)):
+            return False
+        diff = abs(expected_value - actual_value)
+        return diff <= self.abs_eps or diff <= self.rel_eps * abs(expected_value)
+
+    def describe(self):
+        return f"{self.name} (절대 오차 {self.abs_eps:g}, 상대 오차 {self.rel_eps:g})"
+
+
+class UnorderedLinesChecker(Checker):
+    """줄의 순서를 무시하고 같은 줄들이 같은 개수만큼 있는지 비교합니다."""
+    name = CHECKER_UNORDERED
+
+    @staticmethod
+    def _lines(data):
+        return Counter(stripped for _, _, stripped in iter_records(iter_lines_from_bytes(data)))
+
+    def open(self, test_case):
+        expected = self._lines(read_expected_bytes(test_case))
+
+        def judge(actual):
+            actual_lines = self._lines(actual)
+            if actual_lines == expected:
+                return True, None
+            missing = sorted((expected - actual_lines).elements())
+            extra = sorted((actual_lines - expected).elements())
+            return False, {
+                'line': None,
+                'expected': preview_bytes(missing[0]) if missing else None,
+                'actual': preview_bytes(extra[0]) if extra else None,
+            }
+
+        return BufferedSession(judge)
+
+
+class CustomChecker(Checker):
+    """문제별 채점 프로그램을 실행합니다. (testlib 과 같이 <입력> <예상 출력> <실제 출력> 순서로 인자를 넘깁니다)"""
+    name = CHECKER_CUSTOM
+
+    def __init__(self, command, timeout=CHECKER_TIMEOUT_SECONDS):
+        self.command = list(command)
+        self.timeout = timeout
+
+    def open(self, test_case):
+        def judge(actual):
+            work_dir = tempfile.mkdtemp(prefix='checker_')
+            try:
+                paths = [os.path.join(work_dir, name) for name in ('input.txt', 'expected.txt', 'actual.txt')]
+                sources = (test_case.get('input_file'), test_case.get('output_file'), None)
+                contents = ((test_case.get('input') or '').encode('utf-8'),
+                            (test_case.get('output') or '').encode('utf-8'), actual)
+                for path, source, data in zip(paths, sources, contents):
+                    if source:
+                        # 압축된 테스트 데이터도 채점 프로그램에는 푼 파일로 넘깁니다.
+                        copy_data(source, path)
+                        continue
+                    with open(path, 'wb') as f:
+                        f.write(data)
+                outcome = run_measured([*self.command, *paths], b'', self.timeout)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            if outcome.timed_out:
+                return False, {'message': f"채점 프로그램 시간 초과 ({self.timeout}초)"}
+            if outcome.returncode == 0:
+                return True, None
+            message = (outcome.stdout + outcome.stderr).decode('utf-8', errors='replace').strip()
+            return False, {'message': message[:CHECKER_MESSAGE_LIMIT] or f"채점 프로그램 종료 코드 {outcome.returncode}"}
+
+        return BufferedSession(judge)
+
+    def describe(self):
+        return f"{self.name} ({' '.join(self.command)})"
+
+
+# 채점기 이름 -> spec(dict) 을 받아 채점기를 만드는 함수
+CHECKER_REGISTRY = {
+    CHECKER_EXACT: lambda spec: ExactChecker(),
+    CHECKER_TOKEN: lambda spec: TokenChecker(),
+    CHECKER_FLOAT: lambda spec: FloatChecker(spec.get('abs_eps', DEFAULT_FLOAT_EPS),
+                                             spec.get('rel_eps', DEFAULT_FLOAT_EPS)),
+    CHECKER_UNORDERED: lambda spec: UnorderedLinesChecker(),
+    CHECKER_CUSTOM: lambda spec: CustomChecker(spec['command'], spec.get('timeout', CHECKER_TIMEOUT_SECONDS)),
+}
+
+
+def register_checker(name, factory):
+    """새 채점기를 등록합니다."""
+    CHECKER_REGISTRY[name] = factory
+
+
+def create_checker(spec=None):
+    """spec("token" 같은 이름 또는 {"type": "float", "abs_eps": 1e-9} 형태)으로 채점기를 만듭니다."""
+    if not spec:
+        return ExactChecker()
+    if isinstance(spec, str):
+        spec = {'type': spec}
+    kind = spec.get('type', CHECKER_EXACT)
+    if kind not in CHECKER_REGISTRY:
+        raise ValueError(f"알 수 없는 채점기: {kind}")
+    return CHECKER_REGISTRY[kind](spec)
+
+
+_SUPERSCRIPTS = str.maketrans('⁻⁰¹²³⁴⁵⁶⁷⁸⁹', '-0123456789')
+_ERROR_PATTERN = re.compile(r'(절대|상대|absolute|relative)[^.\n]{0,40}?(오차|error)', re.IGNORECASE)
+_EPS_PATTERN = re.compile(
+    r'10\s*(?:\^|<sup>|\*\*)?\s*[({]?\s*[-−]\s*(\d+)'
+    r'|(\d+(?:\.\d+)?)\s*[×x*]\s*10\s*(?:\^|<sup>|\*\*)?\s*[({]?\s*[-−]\s*(\d+)'
+    r'|\d(?:\.\d+)?e-(\d+)', re.IGNORECASE
+)
+
+
+def _parse_eps(text):
+    match = _EPS_PATTERN.search(text)
+    if not match:
+        return None
+    if match.group(1):
+        return 10.0 ** -int(match.group(1))
+    if match.group(2):
+        return float(match.group(2)) * 10.0 ** -int(match.group(3))
+    return float(match.group(0).replace('−', '-'))
+
+
+def detect_checker_spec(*texts):
+    """문제 설명에서 "절대/상대 오차 10^-6까지 허용" 같은 문장을 찾아 float 채점기 spec 을 만듭니다.
+
+    찾지 못하면 None 을 반환합니다.
+    """
+    text = '\n'.join(t if isinstance(t, str) else str(t) for t in texts if t).translate(_SUPERSCRIPTS)
+    kinds = set()
+    eps = None
+    for match in _ERROR_PATTERN.finditer(text):
+        phrase = match.group(0).lower()
+        if '절대' in phrase or 'absolute' in phrase:
+            kinds.add('abs')
+        if '상대' in phrase or 'relative' in phrase:
+            kinds.add('rel')
+        if eps is None:
+            eps = _parse_eps(text[match.end():match.end() + 80])
+    if not kinds:
+        return None
+    eps = eps if eps is not None else DEFAULT_FLOAT_EPS
+    return {
+        'type': CHECKER_FLOAT,
+        'abs_eps': eps if 'abs' in kinds else 0.0,
+        'rel_eps': eps if 'rel' in kinds else 0.0,
+    }
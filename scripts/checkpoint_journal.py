@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+scripts/checkpoint_journal.py
+채점 진행 상황을 한 줄에 하나씩 JSON 으로 덧붙여 기록하는 체크포인트 저널 (JSONL)
+
+워크플로 작업이 취소되거나 러너가 중간에 죽어도, --resume 으로 다시 실행하면
+저널에 기록된 문제와 테스트는 다시 실행하지 않고 기록된 결과를 사용합니다.
+
+- run: 저널 첫 줄. 러너 버전이 다르면(러너 소스나 판정에 영향을 주는 옵션 변경) 저널을 사용하지 않습니다.
+- test: 끝난 테스트 하나의 결과. 테스트 내용(입력/예상 출력/생성기/시드)이 같을 때만 다시 사용합니다.
+- test_set: 검색과 테스트 생성을 마친 테스트 세트의 해시. 파일이 그대로이면 검색/생성 단계를 건너뜁니다.
+- problem: 끝난 문제의 최종 결과
+
+문제는 (문제 번호, 작성자, 코드 파일, 정규화한 소스 해시) 로 구분하므로, 소스가 바뀐 문제는 처음부터 다시 채점합니다.
+마지막 줄이 쓰다가 끊긴 경우 그 줄만 무시합니다.
+"""
+
+import hashlib
+import json
+import threading
+
+from result_records import TestRecord, record_to_json
+from verdict_cache import source_digest
+
+DEFAULT_JOURNAL_PATH = 'test_results_checkpoint.jsonl'
+
+# 저널 형식이 바뀌면 올려서 이전 저널을 사용하지 않게 합니다.
+JOURNAL_FORMAT_VERSION = 1
+
+# 다시 실행하면 달라질 수 있는(일시적인 실패일 수 있는) 결과는 완료로 기록하지 않습니다.
+RETRY_RESULTS = ('ERROR',)
+
+
+def problem_key(problem_info):
+    """문제 제출 하나를 구분하는 키"""
+    try:
+        source_hash = source_digest(problem_info['code_file'])
+    except OSError:
+        source_hash = None
+    fields = [problem_info['problem_id'], problem_info.get('author'), problem_info['code_file'], source_hash]
+    return hashlib.sha256(json.dumps(fields, ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+
+def test_entry_key(test_case):
+    """테스트 내용으로 만든 키. 실행할 때마다 바뀌는 입력 파일 경로는 제외합니다."""
+    fields = {name: value for name, value in test_case.items() if name != 'input_file'}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+
+class CheckpointJournal:
+    """resume 이 참이면 기존 저널을 읽어 이어서 기록하고, 아니면 새 저널을 시작합니다."""
+
+    def __init__(self, path, run_version, resume=False):
+        self.path = path
+        self.run_version = run_version
+        self.problems = {}
+        self.tests = {}
+        self.test_sets = {}
+        self.lock = threading.Lock()
+        loaded = self._load() if resume else False
+        self.file = open(path, 'a' if loaded else 'w', encoding='utf-8')
+        if not loaded:
+            self._append({'kind': 'run', 'format': JOURNAL_FORMAT_VERSION, 'runner': run_version})
+
+    def _load(self):
+        """기존 저널을 읽고, 이어서 기록할 수 있으면 True 를 반환합니다."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            lines = []
+        if not lines:
+            print(f"⚠️ 체크포인트 저널이 없어 처음부터 실행합니다: {self.path}")
+            return False
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # 기록 도중 종료되어 끊긴 줄
+                continue
+        header = entries[0] if entries else {}
+        if (header.get('kind') != 'run' or header.get('format') != JOURNAL_FORMAT_VERSION
+                or header.get('runner') != self.run_version):
+            print("⚠️ 러너나 실행 옵션이 바뀌어 이전 체크포인트를 사용하지 않습니다.")
+            return False
+        for entry in entries[1:]:
+            kind = entry.get('kind')
+            if kind == 'problem':
+                self.problems[entry['problem']] = entry['result']
+            elif kind == 'test':
+                self.tests[(entry['problem'], entry['suite'], entry['test'])] = entry['record']
+            elif kind == 'test_set':
+                self.test_sets[entry['problem']] = entry['digest']
+        if not lines[-1].endswith('\n'):
+            # 끊긴 줄 뒤에 이어 쓰지 않도록 줄을 바꿔 둡니다.
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n')
+        print(f"♻️ 체크포인트 불러옴: 완료된 문제 {len(self.problems)}개, 완료된 테스트 {len(self.tests)}개")
+        return True
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False, default=record_to_json)
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(line + '\n')
+            # 프로세스가 강제 종료되어도 기록이 남도록 줄마다 운영체제로 내보냅니다.
+            self.file.flush()
+
+    def for_problem(self, problem_info):
+        """문제 하나에 대한 기록을 읽고 쓰는 ProblemCheckpoint 를 반환합니다."""
+        return ProblemCheckpoint(self, problem_key(problem_info))
+
+    def close(self):
+        with self.lock:
+            file, self.file = self.file, None
+        if file is not None:
+            file.close()
+
+
+class ProblemCheckpoint:
+    """CheckpointJournal 에서 문제 하나에 해당하는 부분"""
+
+    def __init__(self, journal, key):
+        self.journal = journal
+        self.key = key
+
+    def completed_result(self):
+        """완료된 문제 결과. 없으면 None"""
+        return self.journal.problems.get(self.key)
+
+    def record_result(self, result):
+        if result.get('result') in RETRY_RESULTS:
+            return
+        self.journal._append({'kind': 'problem', 'problem': self.key, 'result': result})
+
+    def completed_test(self, suite, test_case):
+        """완료된 테스트 결과(TestRecord). 없으면 None"""
+        data = self.journal.tests.get((self.key, suite, test_entry_key(test_case)))
+        return TestRecord.from_dict(data) if data is not None else None
+
+    def record_test(self, suite, test_case, record):
+        self.journal._append({'kind': 'test', 'problem': self.key, 'suite': suite,
+                              'test': test_entry_key(test_case), 'record': record})
+
+    def test_set_ready(self, digest):
+        """검색/생성을 마친 테스트 세트가 지금 파일과 같은지 확인합니다."""
+        return self.journal.test_sets.get(self.key) == digest
+
+    def record_test_set(self, digest):
+        self.journal._append({'kind': 'test_set', 'problem': self.key, 'digest': digest})
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+scripts/class_cache.py
+소스 해시, javac 버전, 컴파일 옵션을 키로 하는 컴파일된 클래스 캐시
+(같은 소스를 다시 컴파일하지 않고 저장된 .class 파일을 복사해서 사용합니다)
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'JUDGE_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'boj-judge')
+)
+
+
+def get_javac_version():
+    """javac 버전 문자열을 반환합니다. javac 를 찾을 수 없으면 None 을 반환합니다."""
+    try:
+        result = subprocess.run(['javac', '-version'], capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    # JDK 8 은 stderr, 그 이후 버전은 stdout 으로 버전을 출력합니다.
+    return (result.stdout or result.stderr).strip() or None
+
+
+class CompiledClassCache:
+    """캐시 항목은 <캐시 디렉토리>/<키 앞 2자리>/<키>/ 아래에 .class 파일로 저장됩니다."""
+
+    def __init__(self, cache_dir, javac_version, compile_flags):
+        self.root = Path(cache_dir) / 'classes'
+        self.javac_version = javac_version
+        self.compile_flags = list(compile_flags)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def key_for(self, source_file):
+        """소스 내용, javac 버전, 컴파일 옵션으로 캐시 키를 만듭니다."""
+        digest = hashlib.sha256()
+        with open(source_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        digest.update(b'\0' + self.javac_version.encode('utf-8'))
+        digest.update(b'\0' + '\0'.join(self.compile_flags).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_dir(self, key):
+        return self.root / key[:2] / key
+
+    def restore(self, key, output_dir):
+        """캐시된 클래스를 output_dir 에 복사합니다. 캐시에 없으면 False 를 반환합니다."""
+        entry = self._entry_dir(key)
+        found = entry.is_dir()
+        if found:
+            os.makedirs(output_dir, exist_ok=True)
+            try:
+                shutil.copytree(entry, output_dir, dirs_exist_ok=True)
+            except OSError:
+                found = False
+        with self.lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found
+
+    def store(self, key, output_dir):
+        """output_dir 의 .class 파일을 캐시에 저장합니다."""
+        entry = self._entry_dir(key)
+        if entry.is_dir():
+            return
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 디렉토리에 먼저 복사한 뒤 이름을 바꿔서, 동시에 실행되는 러너가 반쯤 복사된 항목을 보지 않게 합니다.
+        staging = tempfile.mkdtemp(prefix=f'.{key[:8]}_', dir=entry.parent)
+        try:
+            for class_file in Path(output_dir).rglob('*.class'):
+                target = Path(staging) / class_file.relative_to(output_dir)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(class_file, target)
+            os.replace(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def stats(self):
+        """캐시 적중/미스 횟수를 반환합니다."""
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses}
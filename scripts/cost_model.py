@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+scripts/cost_model.py
+테스트 실행 시간 기록을 바탕으로 테스트 소요 시간을 예측하고, 오래 걸리는 테스트부터 실행하도록 순서를 정합니다.
+
+테스트를 병렬로 실행할 때 긴 스트레스 테스트가 마지막에 혼자 실행되면 전체 시간이 늘어나므로,
+예측 시간이 긴 테스트부터 빈 실행 슬롯에 넣습니다(LPT: longest processing time first).
+
+- 기록: <캐시 디렉토리>/durations/<문제번호>.json 에 테스트별 소요 시간의 지수 이동 평균을 저장합니다.
+- 기록이 없는 테스트는 입력 크기로 추정합니다 (시작 시간 + 입력 바이트 수 × 바이트당 시간).
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from stress_tests import is_stress_test
+
+# 새 측정값의 가중치 (지수 이동 평균)
+HISTORY_WEIGHT = 0.5
+
+# 기록이 부족할 때 사용하는 입력 크기 추정 값: JVM 시작 시간(초)과 입력 1MB 당 처리 시간(초)
+DEFAULT_BASE_SECONDS = 0.2
+DEFAULT_SECONDS_PER_MB = 0.05
+
+# 입력 크기를 미리 알 수 없는 스트레스 테스트의 기본 추정 시간 (초)
+DEFAULT_STRESS_SECONDS = 2.0
+
+ESTIMATE_HISTORY = 'history'
+ESTIMATE_SIZE = 'size'
+
+
+def test_key(test_case):
+    """설명이나 임시 입력 파일 경로가 바뀌어도 같은 테스트는 같은 키를 갖도록 내용으로 키를 만듭니다."""
+    fields = {name: test_case.get(name) for name in ('type', 'input', 'generator', 'seed')}
+    if test_case.get('data'):
+        # 파일 테스트 데이터는 입력 문자열 대신 데이터 이름으로 구분합니다.
+        fields['data'] = test_case['data']
+    return hashlib.sha256(json.dumps(fields, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+
+def input_size(test_case):
+    """입력 바이트 수. 스트레스 테스트처럼 미리 알 수 없으면 None 을 반환합니다."""
+    if is_stress_test(test_case):
+        return None
+    if test_case.get('input_file'):
+        try:
+            return os.path.getsize(test_case['input_file'])
+        except OSError:
+            pass
+    return len((test_case.get('input') or '').encode('utf-8'))
+
+
+def simulate_makespan(durations, workers):
+    """주어진 순서대로 빈 슬롯에 작업을 넣을 때의 전체 소요 시간"""
+    if not durations:
+        return 0.0
+    slots = [0.0] * max(1, min(workers, len(durations)))
+    for duration in durations:
+        heapq.heapreplace(slots, slots[0] + duration)
+    return max(slots)
+
+
+class TestCostModel:
+    """문제 하나의 테스트 소요 시간 기록
+
+    speed_factor 는 이 머신의 속도 보정 계수입니다. 기록은 기준 머신 시간(소요 시간 / speed_factor)으로 저장하고,
+    예측할 때 다시 곱하므로 러너 머신이 바뀌어도 기록을 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, history_dir, problem_id, speed_factor=1.0):
+        self.path = Path(history_dir) / 'durations' / f'{problem_id}.json' if history_dir else None
+        self.speed_factor = speed_factor or 1.0
+        self.entries = {}
+        self.lock = threading.Lock()
+        if self.path is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('tests', {})
+            except (OSError, ValueError, AttributeError):
+                self.entries = {}
+
+    def _size_model(self):
+        """기록된 (입력 크기, 시간) 쌍으로 시작 시간과 바이트당 시간을 최소제곱으로 구합니다."""
+        points = [(entry['bytes'], entry['seconds']) for entry in self.entries.values()
+                  if entry.get('bytes') is not None]
+        if len(points) >= 2:
+            mean_x = sum(x for x, _ in points) / len(points)
+            mean_y = sum(y for _, y in points) / len(points)
+            var_x = sum((x - mean_x) ** 2 for x, _ in points)
+            if var_x > 0:
+                rate = max(0.0, sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x)
+                return max(0.0, mean_y - rate * mean_x), rate
+        if points:
+            return min(y for _, y in points), DEFAULT_SECONDS_PER_MB / (1 << 20)
+        return DEFAULT_BASE_SECONDS, DEFAULT_SECONDS_PER_MB / (1 << 20)
+
+    def estimate(self, test_case):
+        """(이 머신에서의 예측 시간, 추정 근거) 를 반환합니다."""
+        seconds, source = self._estimate_normalized(test_case)
+        return seconds * self.speed_factor, source
+
+    def _estimate_normalized(self, test_case):
+        entry = self.entries.get(test_key(test_case))
+        if entry is not None:
+            return entry['seconds'], ESTIMATE_HISTORY
+        size = input_size(test_case)
+        if size is None:
+            stress = [e['seconds'] for e in self.entries.values() if e.get('bytes') is None]
+            return (max(stress) if stress else DEFAULT_STRESS_SECONDS), ESTIMATE_SIZE
+        base, rate = self._size_model()
+        return base + rate * size, ESTIMATE_SIZE
+
+    def plan(self, test_cases, workers):
+        """실행 순서(인덱스 목록)와 예측 정보를 반환합니다."""
+        estimates = [self.estimate(test_case) for test_case in test_cases]
+        durations = [seconds for seconds, _ in estimates]
+        order = sorted(range(len(test_cases)), key=lambda i: -durations[i])
+        return order, {
+            'workers': workers,
+            'predicted_makespan': simulate_makespan([durations[i] for i in order], workers),
+            'naive_predicted_makespan': simulate_makespan(durations, workers),
+            'estimated_from_history': sum(1 for _, source in estimates if source == ESTIMATE_HISTORY),
+            'estimated_from_size': sum(1 for _, source in estimates if source == ESTIMATE_SIZE),
+        }
+
+    def record(self, test_case, seconds):
+        """테스트 하나의 (이 머신에서의) 실제 소요 시간을 기록합니다."""
+        key = test_key(test_case)
+        seconds = seconds / self.speed_factor
+        with self.lock:
+            previous = self.entries.get(key)
+            if previous is not None:
+                seconds = previous['seconds'] * (1 - HISTORY_WEIGHT) + seconds * HISTORY_WEIGHT
+            self.entries[key] = {'seconds': seconds, 'bytes': input_size(test_case)}
+
+    def save(self):
+        """기록을 파일에 저장합니다. 임시 파일에 쓴 뒤 이름을 바꿔서 동시에 실행되는 러너와 충돌하지 않게 합니다."""
+        if self.path is None:
+            return
+        with self.lock:
+            data = {'tests': dict(self.entries)}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=f'.{self.path.name}_', dir=self.path.parent)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ 테스트 소요 시간 기록 저장 실패: {e}")
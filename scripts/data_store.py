@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+scripts/data_store.py
+파일로 저장한 테스트 데이터 (testdata/<문제번호>/<이름>.in, <이름>.out)
+
+큰 입력/출력은 JSON 테스트 파일에 넣지 않고 파일로 두며, gzip(.gz) 이나 xz(.xz) 로 압축해 둘 수 있습니다.
+압축된 데이터는 전체를 메모리에 풀지 않습니다.
+- 입력: 이름 있는 파이프(FIFO)를 만들고 스레드가 조각 단위로 풀어 쓰므로, 자식과 웜 JVM 하네스 모두 파일처럼 읽습니다.
+- 예상 출력: 채점기가 open_data() 로 조각 단위로 풀면서 비교합니다.
+
+압축을 푼 바이트 수와 걸린 시간은 파일 경로별로 모아 두었다가 take_decompression_stats() 로 가져갑니다.
+"""
+
+import glob
+import gzip
+import hashlib
+import lzma
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+# 문제별 테스트 데이터 파일을 두는 디렉토리
+TEST_DATA_DIR = 'testdata'
+
+# 파일 테스트 데이터의 테스트케이스 type
+DATA_TEST_TYPE = 'data'
+
+# 압축 확장자 -> 압축 형식
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.xz': 'xz'}
+
+_OPENERS = {'gzip': gzip.open, 'xz': lzma.open}
+
+# 압축을 풀 때 한 번에 읽는 크기 (바이트)
+CHUNK_BYTES = 1 << 16
+
+
+def compression_of(path):
+    """파일 이름의 확장자로 압축 형식('gzip', 'xz')을 반환합니다. 압축 파일이 아니면 None"""
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(path or '')[1])
+
+
+def compression_suffix(path):
+    """압축 확장자(.gz, .xz). 압축 파일이 아니면 빈 문자열"""
+    return os.path.splitext(path)[1] if compression_of(path) else ''
+
+
+class DecompressionStats:
+    """파일 경로별로 압축을 푼 바이트 수와 시간을 모읍니다. (여러 스레드에서 기록합니다)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.files = {}
+
+    def record(self, path, raw_bytes, seconds):
+        with self.lock:
+            entry = self.files.setdefault(path, {'passes': 0, 'raw_bytes': 0, 'seconds': 0.0})
+            entry['passes'] += 1
+            entry['raw_bytes'] = max(entry['raw_bytes'], raw_bytes)
+            entry['seconds'] += seconds
+
+    def take(self, paths):
+        """paths 에 대한 기록을 꺼내 합친 요약을 반환합니다. 압축 파일이 없으면 None"""
+        compressed = sorted({path for path in paths if compression_of(path)})
+        if not compressed:
+            return None
+        with self.lock:
+            entries = [self.files.pop(path, None) for path in compressed]
+        summary = {'files': len(compressed), 'compressed_bytes': 0, 'raw_bytes': 0, 'passes': 0,
+                   'decompress_seconds': 0.0}
+        for path, entry in zip(compressed, entries):
+            try:
+                summary['compressed_bytes'] += os.path.getsize(path)
+            except OSError:
+                pass
+            if entry is not None:
+                summary['raw_bytes'] += entry['raw_bytes']
+                summary['passes'] += entry['passes']
+                summary['decompress_seconds'] += entry['seconds']
+        summary['ratio'] = (summary['raw_bytes'] / summary['compressed_bytes']
+                            if summary['compressed_bytes'] else None)
+        return summary
+
+
+_stats = DecompressionStats()
+
+
+def take_decompression_stats(paths):
+    """paths 중 압축 파일의 압축률과 압축 해제 시간 요약. 압축 파일이 없으면 None"""
+    return _stats.take(paths)
+
+
+class _MeasuredReader:
+    """압축 해제 스트림을 감싸서 푼 바이트 수와 읽기에 걸린 시간을 기록합니다."""
+
+    def __init__(self, path, stream):
+        self.path = path
+        self.stream = stream
+        self.raw_bytes = 0
+        self.seconds = 0.0
+
+    def read(self, size=-1):
+        start = time.perf_counter()
+        chunk = self.stream.read(size)
+        self.seconds += time.perf_counter() - start
+        self.raw_bytes += len(chunk)
+        return chunk
+
+    def close(self):
+        if self.stream is None:
+            return
+        self.stream.close()
+        self.stream = None
+        _stats.record(self.path, self.raw_bytes, self.seconds)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_data(path):
+    """테스트 데이터 파일을 바이너리 읽기용으로 엽니다. 압축 파일은 읽는 만큼만 풀어서 돌려줍니다."""
+    compression = compression_of(path)
+    if compression is None:
+        return open(path, 'rb')
+    return _MeasuredReader(path, _OPENERS[compression](path, 'rb'))
+
+
+def iter_data_chunks(path):
+    """테스트 데이터 파일의 (압축을 푼) 내용을 조각 단위로 만듭니다."""
+    with open_data(path) as f:
+        yield from iter(lambda: f.read(CHUNK_BYTES), b'')
+
+
+def copy_data(path, target_path):
+    """테스트 데이터 파일의 (압축을 푼) 내용을 target_path 에 씁니다."""
+    with open_data(path) as source, open(target_path, 'wb') as target:
+        shutil.copyfileobj(source, target, CHUNK_BYTES)
+
+
+class StreamedInput:
+    """압축된 입력 파일을 FIFO 로 풀어 주는 스트림. path 를 표준 입력 파일처럼 사용합니다.
+
+    FIFO 는 work_dir(없으면 새 임시 디렉토리)에 만들고, 닫을 때 work_dir 를 함께 지웁니다.
+    on_chunk 가 주어지면 푼 조각을 모두 넘깁니다. 풀이가 입력을 다 읽지 않고 끝나도
+    on_chunk 에는 끝까지 넘기므로 입력 전체의 크기와 해시를 계산할 수 있습니다.
+    """
+
+    def __init__(self, source, work_dir=None, on_chunk=None):
+        self.source = source
+        self.on_chunk = on_chunk
+        self.work_dir = work_dir or tempfile.mkdtemp(prefix='stream_')
+        self.path = os.path.join(self.work_dir, 'stdin')
+        self.error = None
+        os.mkfifo(self.path, 0o600)
+        self.thread = threading.Thread(target=self._feed, daemon=True)
+        self.thread.start()
+
+    def _feed(self):
+        fd = None
+        try:
+            with open_data(self.source) as f:
+                # 읽는 쪽(자식이나 하네스)이 FIFO 를 열 때까지 기다립니다.
+                fd = os.open(self.path, os.O_WRONLY)
+                for chunk in iter(lambda: f.read(CHUNK_BYTES), b''):
+                    if self.on_chunk is not None:
+                        self.on_chunk(chunk)
+                    if fd is None:
+                        continue
+                    try:
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[os.write(fd, view):]
+                    except BrokenPipeError:
+                        # 풀이가 입력을 다 읽기 전에 끝났습니다.
+                        os.close(fd)
+                        fd = None
+        except (OSError, EOFError, lzma.LZMAError) as e:
+            self.error = e
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def close(self):
+        """스트림을 끝내고 FIFO 를 지웁니다. 읽는 쪽이 FIFO 를 열지 않았어도 멈추지 않습니다."""
+        while self.thread.is_alive():
+            # 쓰는 스레드가 FIFO 를 여는 데서 기다리고 있으면 깨우고, 읽는 쪽을 바로 닫아 남은 쓰기를 끝냅니다.
+            # (스레드가 아직 FIFO 를 열기 전일 수 있으므로 끝날 때까지 반복합니다)
+            try:
+                os.close(os.open(self.path, os.O_RDONLY | os.O_NONBLOCK))
+            except OSError:
+                pass
+            self.thread.join(0.05)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _strip_data_suffix(path):
+    base = path[:-len(compression_suffix(path))] if compression_of(path) else path
+    return os.path.splitext(base)
+
+
+def find_data_files(problem_id):
+    """문제의 테스트 데이터 파일 경로 목록"""
+    problem_dir = os.path.join(TEST_DATA_DIR, str(problem_id))
+    return sorted(path for path in glob.glob(os.path.join(problem_dir, '*'))
+                  if _strip_data_suffix(path)[1] in ('.in', '.out'))
+
+
+def _files_digest(paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(f'\0{os.path.basename(path)}\0'.encode('utf-8'))
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_BYTES), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_data_tests(problem_id):
+    """testdata/<문제번호> 의 입력/예상 출력 쌍으로 테스트케이스 목록을 만듭니다.
+
+    <이름>.in 에 대응하는 <이름>.out 이 없으면 출력은 확인하지 않고 시간/메모리 제한만 확인합니다.
+    data_sha256 은 (압축된) 파일 내용의 해시로, 같은 이름의 데이터가 바뀌었는지 구분하는 데 씁니다.
+    """
+    inputs, outputs = {}, {}
+    for path in find_data_files(problem_id):
+        name, kind = _strip_data_suffix(path)
+        (inputs if kind == '.in' else outputs)[os.path.basename(name)] = path
+    test_cases = []
+    for name in sorted(inputs):
+        test_case = {'type': DATA_TEST_TYPE, 'description': f'데이터 {name}', 'data': name,
+                     'input_file': inputs[name]}
+        if name in outputs:
+            test_case['output_file'] = outputs[name]
+        else:
+            test_case['output'] = '<예상 출력 파일 없음>'
+            test_case['no_expected'] = True
+        try:
+            test_case['data_sha256'] = _files_digest([inputs[name]] + ([outputs[name]] if name in outputs else []))
+        except OSError as e:
+            print(f"⚠️ 테스트 데이터를 읽을 수 없습니다 ({inputs[name]}): {e}")
+            continue
+        test_cases.append(test_case)
+    return test_cases
@@ -8,7 +8,9 @@ import argparse
 import json
 import requests
 import os
+import re
 import time
+from html.parser import HTMLParser
 
 def get_solved_ac_info(problem_id):
     """solved.ac API에서 문제의 기본 정보(제목, 레벨, 태그)를 가져옵니다."""
@@ -82,7 +84,7 @@ def get_boj_problem_with_google_search(client, types, problem_id):
 1. 문제 설명 (problem_description)
 2. 입력 형식 (input_format) 
 3. 출력 형식 (output_format)
-4. 제한사항 (limits) - 시간 제한, 메모리 제한 등
+4. 제한사항 (limits) - "시간 제한: 1 초, 메모리 제한: 128 MB" 형식 (추가 시간 없음 표시가 있으면 함께 적기)
 5. 예제 입출력 (sample_tests) - 배열 형태로, 각각 input과 output 필드 포함
 6. 힌트 (hint) - 있는 경우만
 
@@ -198,6 +200,146 @@ def parse_gemini_response(response_text):
         print(f"  📄 원본 응답: {response_text[:500]}...")
         return None
 
+class _ProblemInfoTableParser(HTMLParser):
+    """BOJ 문제 페이지의 #problem-info 표에서 행마다 칸(th/td)의 텍스트를 모읍니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.depth = 0
+        self.rows = []
+        self.cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            if self.depth:
+                self.depth += 1
+            elif dict(attrs).get('id') == 'problem-info':
+                self.depth = 1
+        elif self.depth == 1 and tag == 'tr':
+            self.rows.append([])
+        elif self.depth == 1 and tag in ('th', 'td') and self.rows:
+            self.cell = []
+
+    def handle_endtag(self, tag):
+        if not self.depth:
+            return
+        if tag == 'table':
+            self.depth -= 1
+        elif tag in ('th', 'td') and self.cell is not None:
+            self.rows[-1].append(' '.join(''.join(self.cell).split()))
+            self.cell = None
+
+    def handle_data(self, data):
+        if self.cell is not None:
+            self.cell.append(data)
+
+
+def parse_problem_info_table(html):
+    """#problem-info 표를 {머리글: 값} 으로 읽습니다. 표가 없으면 빈 dict 를 반환합니다.
+
+    BOJ 는 머리글 행(시간 제한, 메모리 제한, 제출, ...) 아래 값 행을 두고 칸마다 값 하나를 넣으므로,
+    텍스트로 이어 붙이지 않고 같은 열의 머리글과 값을 짝지어야 합니다.
+    """
+    parser = _ProblemInfoTableParser()
+    parser.feed(html)
+    parser.close()
+    rows = [row for row in parser.rows if row]
+    if len(rows) < 2:
+        return {}
+    return dict(zip(rows[0], rows[1]))
+
+
+# 텍스트 표의 칸 구분자 (탭, 마크다운의 |, 두 칸 이상의 공백)
+_TEXT_TABLE_SEPARATOR = re.compile(r'\t+|\s*\|\s*|\s{2,}')
+
+
+def _split_text_row(line):
+    return [cell for cell in _TEXT_TABLE_SEPARATOR.split(line.strip()) if cell]
+
+
+def parse_text_table(text):
+    """머리글 행 다음 줄에 값 행이 오는 텍스트 표(탭/마크다운)를 {머리글: 값} 으로 읽습니다."""
+    lines = [line for line in text.splitlines() if line.strip() and not re.fullmatch(r'[\s|:-]+', line)]
+    for header_line, value_line in zip(lines, lines[1:]):
+        headers = _split_text_row(header_line)
+        if len(headers) > 1 and any(_limit_kind(header) for header in headers):
+            return dict(zip(headers, _split_text_row(value_line)))
+    return {}
+
+
+def _limit_kind(header):
+    """표 머리글이 시간 제한('time')인지 메모리 제한('memory')인지 판별합니다."""
+    normalized = header.replace(' ', '').lower()
+    if '시간제한' in normalized or 'timelimit' in normalized:
+        return 'time'
+    if '메모리제한' in normalized or 'memorylimit' in normalized:
+        return 'memory'
+    return None
+
+
+def _parse_time_ms(text):
+    match = re.search(r'(\d+(?:\.\d+)?)\s*(초|ms|밀리초|seconds?|secs?|s)(?![a-z])', text, re.IGNORECASE)
+    if not match:
+        return None
+    value, unit = float(match.group(1)), match.group(2).lower()
+    return int(round(value if unit in ('ms', '밀리초') else value * 1000))
+
+
+def _parse_memory_mb(text):
+    match = re.search(r'(\d+(?:\.\d+)?)\s*(MB|KB|GB|메가바이트)', text, re.IGNORECASE)
+    if not match:
+        return None
+    value, unit = float(match.group(1)), match.group(2).upper()
+    scale = {'KB': 1 / 1024, 'GB': 1024}.get(unit, 1)
+    return max(1, int(round(value * scale)))
+
+
+def parse_limits(limits):
+    """제한사항에서 시간 제한(ms)과 메모리 제한(MB)을 추출합니다.
+
+    예: "시간 제한 1 초, 메모리 제한 128 MB" -> {'time_limit_ms': 1000, 'memory_limit_mb': 128}
+    {머리글: 값} dict, #problem-info 표 HTML, 머리글 행과 값 행으로 된 텍스트 표는 열 단위로 읽습니다.
+    "(추가 시간 없음)" 이 붙은 문제는 Java 추가 시간을 주지 않으므로 no_extra_time 을 기록합니다.
+    """
+    if isinstance(limits, list):
+        limits = ' '.join(str(item) for item in limits)
+    if isinstance(limits, dict):
+        columns = {str(key): str(value) for key, value in limits.items()}
+        text = ' '.join(f"{key} {value}" for key, value in columns.items())
+    else:
+        text = str(limits or '')
+        columns = (parse_problem_info_table(text) if '<t' in text else {}) or parse_text_table(text)
+
+    parsed = {}
+    time_text = memory_text = None
+    for header, value in columns.items():
+        kind = _limit_kind(header)
+        if kind == 'time' and time_text is None:
+            time_text = value
+        elif kind == 'memory' and memory_text is None:
+            memory_text = value
+    if time_text is None and memory_text is None:
+        # 표가 아니면 "시간 제한 ... 초", "메모리 제한 ... MB" 형태의 문장에서 찾습니다.
+        # 표의 머리글과 값이 한 줄로 이어 붙은 경우("시간 제한 메모리 제한 ... 1 초 128 MB")에도 찾을 수 있도록
+        # 머리글 뒤의 다른 숫자는 건너뛰고 단위가 맞는 첫 값을 사용합니다.
+        time_match = (re.search(r'시간\s*제한.*?(?<![\d.])(\d+(?:\.\d+)?\s*(?:초|ms|밀리초))', text)
+                      or re.search(r'time\s*limit\D*?(\d+(?:\.\d+)?\s*(?:seconds?|secs?|s|ms)\b)', text,
+                                   re.IGNORECASE))
+        memory_match = (re.search(r'메모리\s*제한.*?(?<![\d.])(\d+(?:\.\d+)?\s*(?:MB|KB|GB|메가바이트))', text, re.IGNORECASE)
+                        or re.search(r'memory\s*limit\D*?(\d+(?:\.\d+)?\s*(?:MB|KB|GB))', text, re.IGNORECASE))
+        time_text = time_match.group(1) if time_match else None
+        memory_text = memory_match.group(1) if memory_match else None
+
+    time_limit_ms = _parse_time_ms(time_text) if time_text else None
+    if time_limit_ms is not None:
+        parsed['time_limit_ms'] = time_limit_ms
+    memory_limit_mb = _parse_memory_mb(memory_text) if memory_text else None
+    if memory_limit_mb is not None:
+        parsed['memory_limit_mb'] = memory_limit_mb
+    if '추가 시간 없음' in text:
+        parsed['no_extra_time'] = True
+    return parsed
+
 def convert_to_standard_format(gemini_data):
     """Gemini 응답을 표준 형식으로 변환합니다."""
     print("  🔄 데이터 형식 변환 중...")
@@ -217,6 +359,10 @@ def convert_to_standard_format(gemini_data):
         if gemini_field in gemini_data and gemini_data[gemini_field]:
             standard_format[standard_field] = gemini_data[gemini_field]
     
+    # 제한사항 문자열을 러너가 사용할 수 있는 구조화된 값으로 변환
+    if standard_format.get('limits'):
+        standard_format.update(parse_limits(standard_format['limits']))
+    
     # 예제 테스트케이스 변환
     if 'sample_tests' in gemini_data and gemini_data['sample_tests']:
         samples = []
@@ -333,6 +479,8 @@ def main():
         print(f" 🏷️ 태그: {', '.join(complete_info.get('tags', []))}")
         print(f" 📊 추출된 예제: {len(complete_info.get('samples', []))}개")
         print(f" 📄 문제 설명 길이: {len(complete_info.get('description', ''))}자")
+        print(f" ⏱️ 시간 제한: {complete_info.get('time_limit_ms', 'N/A')}ms, "
+              f"메모리 제한: {complete_info.get('memory_limit_mb', 'N/A')}MB")
         print(f" 💾 저장된 파일: {problem_info_output_path}, {sample_tests_output_path}")
         print("="*60)
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+scripts/fuzzer.py
+작은 무작위 입력으로 제출 코드와 참고 풀이를 비교하여 반례를 찾는 퍼징 루프
+
+퍼징 생성기는 references/<문제번호>/fuzz_gen.py 에 두며, 스트레스 테스트 생성기와 같이
+sys.argv[1] 로 시드를 받아 작은 입력 하나를 표준 출력으로 내보냅니다.
+"""
+
+import json
+import os
+import threading
+import time
+
+from stress_tests import REFERENCE_DIR
+
+FUZZ_GENERATOR_NAME = 'fuzz_gen.py'
+
+# 퍼징 기본 시간 예산 (초)
+DEFAULT_FUZZ_BUDGET_SECONDS = 60
+
+# 반례 입력을 테스트케이스 파일에 그대로 저장할 최대 크기 (바이트). 더 크면 생성기 + 시드로 저장합니다.
+MAX_LITERAL_COUNTEREXAMPLE_BYTES = 64 * 1024
+
+
+def find_fuzz_generator(problem_id, root='.'):
+    """문제의 퍼징 생성기 코드를 반환합니다. 없으면 None 을 반환합니다."""
+    path = os.path.join(root, REFERENCE_DIR, str(problem_id), FUZZ_GENERATOR_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def fuzz(run_case, budget_seconds, workers, start_seed=1):
+    """시드를 하나씩 늘려 가며 run_case(seed) 를 workers 개 스레드에서 동시에 실행합니다.
+
+    run_case 는 두 풀이가 일치하면 None, 불일치하면 반례 정보를 반환해야 합니다.
+    처음 불일치가 발견되거나 시간 예산이 끝나면 멈추며,
+    {'cases': 실행한 입력 수, 'elapsed': 소요 시간, 'seed': 반례 시드, 'failure': 반례 정보} 를 반환합니다.
+    """
+    start_time = time.monotonic()
+    deadline = start_time + budget_seconds
+    stop = threading.Event()
+    lock = threading.Lock()
+    state = {'next_seed': start_seed, 'cases': 0}
+    failures = []
+
+    def worker():
+        while not stop.is_set() and time.monotonic() < deadline:
+            with lock:
+                seed = state['next_seed']
+                state['next_seed'] += 1
+            failure = run_case(seed)
+            with lock:
+                state['cases'] += 1
+                if failure is not None:
+                    failures.append((seed, failure))
+            if failure is not None:
+                stop.set()
+
+    threads = [threading.Thread(target=worker, name=f'fuzz-{i}', daemon=True) for i in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 동시에 여러 반례가 나오면 재현하기 쉬운 가장 작은 시드를 고릅니다.
+    seed, failure = min(failures, key=lambda item: item[0]) if failures else (None, None)
+    return {
+        'cases': state['cases'], 'elapsed': time.monotonic() - start_time,
+        'seed': seed, 'failure': failure
+    }
+
+
+def append_generated_test(tests_path, problem_id, test_case):
+    """반례를 생성 테스트케이스 파일(tests_<문제번호>.json)에 추가합니다."""
+    data = {'problem_id': str(problem_id), 'test_cases': []}
+    try:
+        with open(tests_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        pass
+    data.setdefault('test_cases', []).append(test_case)
+    data['total_generated'] = len(data['test_cases'])
+    with open(tests_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
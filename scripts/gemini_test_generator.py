@@ -9,6 +9,8 @@ import json
 import os
 import sys
 
+from stress_tests import MAX_GENERATOR_SOURCE_BYTES, STRESS_TEST_TYPE, is_stress_test
+
 def setup_gemini_client():
     """최신 Gemini API 클라이언트를 설정합니다."""
     api_key = os.getenv('GEMINI_API_KEY')
@@ -82,6 +84,11 @@ def generate_test_cases(client, types, problem_info, code_content, language):
 
 가능하면 5-8개의 다양한 테스트케이스를 생성해주세요.
 
+또한 시간 복잡도를 검증하기 위해, 최대 제한에 가까운 큰 입력을 만드는 스트레스 테스트를 1-2개 추가해주세요.
+스트레스 테스트는 입력을 직접 쓰지 말고, 입력 전체를 표준 출력으로 출력하는 Python 생성기 코드로 작성해주세요.
+생성기는 sys.argv[1] 로 난수 시드를 받아야 하며, 외부 라이브러리를 사용하면 안 됩니다.
+스트레스 테스트의 예상 출력은 채점기가 직접 계산하므로 작성하지 않아도 됩니다.
+
 응답은 다음 JSON 형식으로만 해주세요:
 {{
     "test_cases": [
@@ -89,6 +96,12 @@ def generate_test_cases(client, types, problem_info, code_content, language):
             "input": "테스트 입력", 
             "output": "예상 출력", 
             "description": "이 테스트케이스가 검증하는 내용"
+        }},
+        {{
+            "type": "stress",
+            "generator": "import sys, random\nrandom.seed(int(sys.argv[1]))\n...",
+            "seed": 1,
+            "description": "최대 크기 입력에서의 수행 시간"
         }}
     ]
 }}
@@ -159,7 +172,14 @@ def parse_test_cases(response_text):
             # 테스트케이스 유효성 검증
             valid_cases = []
             for i, test in enumerate(test_cases):
-                if isinstance(test, dict) and 'input' in test and 'output' in test:
+                if isinstance(test, dict) and is_stress_test(test) and test.get('generator'):
+                    valid_cases.append({
+                        'type': STRESS_TEST_TYPE,
+                        'generator': str(test['generator']),
+                        'seed': test.get('seed', i + 1),
+                        'description': test.get('description', f'스트레스 테스트 {i+1}')
+                    })
+                elif isinstance(test, dict) and 'input' in test and 'output' in test:
                     # 기본값 설정
                     clean_test = {
                         'input': str(test['input']).strip(),
@@ -196,6 +216,24 @@ def validate_test_cases(test_cases, problem_info):
     validated_cases = []
     for i, test in enumerate(test_cases):
         try:
+            # 스트레스 테스트는 입력 대신 생성기 코드를 검증합니다. (1MB 제한 대신, 생성된 입력은 실행할 때
+            # stress_tests.run_generator 가 MAX_GENERATED_INPUT_BYTES(256MB)로 제한합니다)
+            if is_stress_test(test):
+                generator = test.get('generator', '')
+                if not generator.strip():
+                    print(f"  ⚠️ 테스트케이스 {i+1}: 생성기 코드가 비어있음")
+                    continue
+                if len(generator.encode('utf-8')) > MAX_GENERATOR_SOURCE_BYTES:
+                    print(f"  ⚠️ 테스트케이스 {i+1}: 생성기 코드가 너무 큼")
+                    continue
+                try:
+                    compile(generator, f'generator_{i+1}', 'exec')
+                except SyntaxError as e:
+                    print(f"  ⚠️ 테스트케이스 {i+1}: 생성기 코드 문법 오류 ({e})")
+                    continue
+                validated_cases.append(test)
+                continue
+            
             # 입력과 출력이 모두 있는지 확인
             if not test.get('input') or not test.get('output'):
                 print(f"  ⚠️ 테스트케이스 {i+1}: 입력 또는 출력이 비어있음")
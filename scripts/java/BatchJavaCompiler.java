@@ -0,0 +1,83 @@
+import java.io.BufferedOutputStream;
+import java.io.BufferedReader;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.StringWriter;
+import java.nio.charset.StandardCharsets;
+import java.util.Arrays;
+import java.util.List;
+import javax.tools.Diagnostic;
+import javax.tools.DiagnosticCollector;
+import javax.tools.JavaCompiler;
+import javax.tools.JavaFileObject;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+
+/**
+ * scripts/java/BatchJavaCompiler.java
+ * 하나의 JVM 안에서 javac 를 재사용하여 여러 소스 파일을 차례로 컴파일하는 컴파일 서비스.
+ *
+ * 시작 시 "READY" (컴파일러를 찾을 수 없으면 "UNAVAILABLE") 한 줄을 출력합니다.
+ * 요청 (stdin, 한 줄에 하나):
+ *   COMPILE\t<소스 파일>\t<출력 디렉토리>
+ * 응답 (stdout):
+ *   RESULT <OK|FAIL> <진단 메시지 바이트 수>\n + 진단 메시지 (UTF-8)
+ */
+public class BatchJavaCompiler {
+
+    public static void main(String[] args) throws IOException {
+        OutputStream out = new BufferedOutputStream(new FileOutputStream(FileDescriptor.out));
+        JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+        if (compiler == null) {
+            out.write("UNAVAILABLE\n".getBytes(StandardCharsets.US_ASCII));
+            out.flush();
+            System.exit(3);
+        }
+        out.write("READY\n".getBytes(StandardCharsets.US_ASCII));
+        out.flush();
+
+        // 파일 매니저를 재사용하면 JDK 클래스 정보를 매번 다시 읽지 않아도 됩니다.
+        StandardJavaFileManager fileManager =
+                compiler.getStandardFileManager(null, null, StandardCharsets.UTF_8);
+        BufferedReader requests = new BufferedReader(
+                new InputStreamReader(new FileInputStream(FileDescriptor.in), StandardCharsets.UTF_8));
+        String line;
+        while ((line = requests.readLine()) != null) {
+            String[] parts = line.split("\t");
+            if (parts.length != 3 || !"COMPILE".equals(parts[0])) {
+                continue;
+            }
+            compileOne(compiler, fileManager, parts[1], parts[2], out);
+        }
+        fileManager.close();
+    }
+
+    private static void compileOne(JavaCompiler compiler, StandardJavaFileManager fileManager,
+                                   String source, String outputDir, OutputStream out) throws IOException {
+        DiagnosticCollector<JavaFileObject> diagnostics = new DiagnosticCollector<>();
+        StringWriter messages = new StringWriter();
+        boolean success;
+        try {
+            Iterable<? extends JavaFileObject> units = fileManager.getJavaFileObjects(source);
+            List<String> options = Arrays.asList("-encoding", "UTF-8", "-d", outputDir);
+            success = compiler.getTask(messages, fileManager, diagnostics, options, null, units).call();
+        } catch (RuntimeException e) {
+            success = false;
+            messages.write(String.valueOf(e));
+        }
+
+        StringBuilder report = new StringBuilder(messages.toString());
+        for (Diagnostic<? extends JavaFileObject> diagnostic : diagnostics.getDiagnostics()) {
+            report.append(diagnostic.toString()).append('\n');
+        }
+        byte[] body = report.toString().getBytes(StandardCharsets.UTF_8);
+        String header = "RESULT " + (success ? "OK" : "FAIL") + " " + body.length + "\n";
+        out.write(header.getBytes(StandardCharsets.US_ASCII));
+        out.write(body);
+        out.flush();
+    }
+}
@@ -0,0 +1,88 @@
+import java.io.BufferedReader;
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStreamWriter;
+import java.io.PrintWriter;
+import java.util.ArrayDeque;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.LinkedList;
+import java.util.List;
+import java.util.Map;
+import java.util.PriorityQueue;
+import java.util.Scanner;
+import java.util.StringTokenizer;
+import java.util.TreeMap;
+import java.util.TreeSet;
+import java.util.stream.Collectors;
+import java.util.stream.IntStream;
+
+/**
+ * scripts/java/CdsWarmup.java
+ * 클래스 데이터 공유(CDS) 아카이브에 넣을 JDK 클래스 목록을 만들기 위해 실행하는 프로그램.
+ *
+ * 알고리즘 풀이가 흔히 사용하는 입출력 클래스(BufferedReader, StringTokenizer, StringBuilder,
+ * Scanner, PrintWriter)와 컬렉션, 정렬, 스트림을 한 번씩 사용합니다.
+ * 표준 입력의 첫 줄은 숫자 개수, 둘째 줄은 숫자들입니다.
+ */
+public class CdsWarmup {
+
+    public static void main(String[] args) throws IOException {
+        BufferedReader br = new BufferedReader(new InputStreamReader(System.in));
+        int n = Integer.parseInt(br.readLine().trim());
+        StringTokenizer st = new StringTokenizer(br.readLine());
+        long[] values = new long[n];
+        for (int i = 0; i < n; i++) {
+            values[i] = Long.parseLong(st.nextToken());
+        }
+        Arrays.sort(values);
+
+        List<Integer> list = new ArrayList<>();
+        LinkedList<Integer> linked = new LinkedList<>();
+        ArrayDeque<Integer> deque = new ArrayDeque<>();
+        PriorityQueue<long[]> pq = new PriorityQueue<>(Comparator.comparingLong(a -> a[0]));
+        Map<Long, Integer> counts = new HashMap<>();
+        TreeMap<Long, Integer> ordered = new TreeMap<>();
+        HashSet<String> seen = new HashSet<>();
+        TreeSet<Long> sorted = new TreeSet<>();
+        for (int i = 0; i < n; i++) {
+            list.add(i);
+            linked.addLast(i);
+            deque.offerFirst(i);
+            pq.offer(new long[]{values[i], i});
+            counts.merge(values[i], 1, Integer::sum);
+            ordered.put(values[i], i);
+            seen.add(String.valueOf(values[i]));
+            sorted.add(values[i]);
+        }
+        Collections.sort(list, Collections.reverseOrder());
+        Integer[] boxed = list.toArray(new Integer[0]);
+        Arrays.sort(boxed, (a, b) -> Integer.compare(a, b));
+        String joined = IntStream.range(0, n).mapToObj(Integer::toString).collect(Collectors.joining(" "));
+        String[] parts = joined.split(" ");
+        Scanner scanner = new Scanner(joined);
+        long scanned = scanner.hasNextLong() ? scanner.nextLong() : 0;
+
+        StringBuilder sb = new StringBuilder();
+        while (!pq.isEmpty()) {
+            sb.append(pq.poll()[0]).append(' ');
+        }
+        sb.append('\n').append(counts.size()).append(' ').append(ordered.firstKey()).append(' ')
+                .append(seen.size()).append(' ').append(sorted.last()).append(' ').append(parts.length)
+                .append(' ').append(scanned).append(' ').append(Math.max(deque.size(), linked.size()))
+                .append(' ').append(String.format("%.3f", Math.sqrt(n))).append('\n');
+
+        BufferedWriter bw = new BufferedWriter(new OutputStreamWriter(System.out));
+        bw.write(sb.toString());
+        bw.flush();
+        PrintWriter pw = new PrintWriter(System.out);
+        pw.println(boxed.length);
+        pw.flush();
+        System.out.println(Arrays.toString(values).length());
+    }
+}
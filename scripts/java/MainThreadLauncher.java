@@ -0,0 +1,45 @@
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+
+/**
+ * scripts/java/MainThreadLauncher.java
+ * 풀이의 main 을 큰 스택을 가진 스레드 하나에서 실행하는 실행기.
+ *
+ * BOJ 는 Java 풀이를 -Xss512m 으로 실행하지만, -Xss 는 JVM 이 만드는 모든 자바 스레드에 적용됩니다.
+ * 주소 공간 상한(prlimit --as) 아래에서는 스레드마다 512MB 씩 예약하다가 JVM 이 스레드를 만들지 못하고,
+ * 그 오류가 메모리 초과로 잘못 판정됩니다. 그래서 큰 스택은 풀이의 메인 스레드에만 주고
+ * 나머지 스레드는 JVM 기본 스택 크기를 사용합니다.
+ *
+ * 사용법: java -cp <실행기 디렉토리>:<풀이 디렉토리> MainThreadLauncher <스택 크기(바이트)> <클래스 이름>
+ * 풀이가 예외로 끝나면 java 명령과 같이 스택 트레이스를 표준 오류에 출력하고 종료 코드 1로 끝납니다.
+ */
+public class MainThreadLauncher {
+
+    public static void main(String[] args) throws InterruptedException {
+        long stackBytes = Long.parseLong(args[0]);
+        String className = args[1];
+        Throwable[] failure = new Throwable[1];
+
+        Thread runner = new Thread(null, () -> {
+            try {
+                // 클래스 초기화(static 블록)도 큰 스택 스레드에서 실행되도록 여기서 불러옵니다.
+                Class<?> mainClass = Class.forName(className, true, MainThreadLauncher.class.getClassLoader());
+                Method mainMethod = mainClass.getMethod("main", String[].class);
+                mainMethod.invoke(null, (Object) new String[0]);
+            } catch (InvocationTargetException e) {
+                failure[0] = e.getCause();
+            } catch (Throwable t) {
+                failure[0] = t;
+            }
+        }, "main", stackBytes);
+        runner.start();
+        runner.join();
+
+        if (failure[0] != null) {
+            System.out.flush();
+            System.err.print("Exception in thread \"main\" ");
+            failure[0].printStackTrace();
+            System.exit(1);
+        }
+    }
+}
@@ -0,0 +1,72 @@
+/**
+ * scripts/java/SpeedCalibration.java
+ * 러너 머신의 속도를 재기 위한 고정 기준 작업.
+ *
+ * 인자가 "startup" 이면 아무 일도 하지 않고 끝나므로 JVM 시작 시간만 잴 수 있습니다.
+ * 인자가 없으면 CPU 위주의 고정 작업(에라토스테네스의 체, 정렬, 2차원 DP)을 실행하고
+ * "KERNEL <걸린 시간(ns)> <체크섬>" 을 출력합니다. 체크섬은 작업이 생략되지 않도록 결과를 묶은 값입니다.
+ */
+public class SpeedCalibration {
+
+    private static final int SIEVE_LIMIT = 10_000_000;
+    private static final int SORT_SIZE = 2_000_000;
+    private static final int DP_SIZE = 2_000;
+
+    public static void main(String[] args) {
+        if (args.length > 0 && "startup".equals(args[0])) {
+            return;
+        }
+        long start = System.nanoTime();
+        long checksum = sieve() * 31 + sort() * 17 + dp();
+        long elapsed = System.nanoTime() - start;
+        System.out.println("KERNEL " + elapsed + " " + checksum);
+    }
+
+    private static long sieve() {
+        boolean[] composite = new boolean[SIEVE_LIMIT + 1];
+        long count = 0;
+        for (int i = 2; i <= SIEVE_LIMIT; i++) {
+            if (composite[i]) {
+                continue;
+            }
+            count++;
+            for (long j = (long) i * i; j <= SIEVE_LIMIT; j += i) {
+                composite[(int) j] = true;
+            }
+        }
+        return count;
+    }
+
+    private static long sort() {
+        int[] values = new int[SORT_SIZE];
+        long state = 12345;
+        for (int i = 0; i < SORT_SIZE; i++) {
+            state = state * 6364136223846793005L + 1442695040888963407L;
+            values[i] = (int) (state >>> 33);
+        }
+        java.util.Arrays.sort(values);
+        long sum = 0;
+        for (int i = 0; i < SORT_SIZE; i += 1000) {
+            sum += values[i];
+        }
+        return sum;
+    }
+
+    private static long dp() {
+        int[] previous = new int[DP_SIZE + 1];
+        int[] current = new int[DP_SIZE + 1];
+        for (int i = 1; i <= DP_SIZE; i++) {
+            for (int j = 1; j <= DP_SIZE; j++) {
+                if ((i * 7 + 3) % 26 == (j * 11 + 5) % 26) {
+                    current[j] = previous[j - 1] + 1;
+                } else {
+                    current[j] = Math.max(previous[j], current[j - 1]);
+                }
+            }
+            int[] swap = previous;
+            previous = current;
+            current = swap;
+        }
+        return previous[DP_SIZE];
+    }
+}
@@ -0,0 +1,241 @@
+import java.io.BufferedOutputStream;
+import java.io.BufferedInputStream;
+import java.io.BufferedReader;
+import java.io.ByteArrayOutputStream;
+import java.io.FileDescriptor;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Paths;
+
+/**
+ * scripts/java/WarmJudgeHarness.java
+ * 하나의 JVM에서 여러 테스트케이스를 순서대로 실행하는 웜 JVM 하네스.
+ *
+ * 요청 (stdin, 한 줄에 하나):
+ *   RUN\t<클래스 디렉토리>\t<클래스 이름>\t<입력 파일>\t<제한 시간(ms)>\t<출력 제한(바이트)>\t<스택 크기(바이트)>
+ * 응답 (stdout):
+ *   RESULT <상태> <종료 코드> <실행 시간(ns)> <stdout 바이트 수> <stderr 바이트 수>\n
+ *   + stdout 바이트 + stderr 바이트
+ *
+ * 상태는 OK, RUNTIME_ERROR, TIMEOUT, OUTPUT_LIMIT, EXIT 중 하나입니다.
+ * OUTPUT_LIMIT 은 표준 출력이나 표준 오류가 출력 제한을 넘은 경우이며, 표준 출력은 보내지 않습니다.
+ * TIMEOUT, OUTPUT_LIMIT, EXIT 응답 뒤에는 하네스가 종료되므로 호출 측에서 다시 띄워야 합니다.
+ *
+ * 스택 크기는 풀이의 메인 스레드에만 적용합니다. (-Xss 로 주면 하네스의 모든 스레드가 같은 크기를 예약합니다)
+ */
+public class WarmJudgeHarness {
+
+    private static final OutputStream PROTOCOL_OUT =
+            new BufferedOutputStream(new FileOutputStream(FileDescriptor.out), 1 << 16);
+
+    /** 현재 실행 중인 테스트 (System.exit 호출 시 셧다운 훅에서 결과를 보고하기 위함) */
+    private static volatile RunState current;
+
+    /**
+     * 테스트 하나의 실행 상태.
+     * 출력 버퍼, 스트림별 바이트 수, outputExceeded 는 모두 이 객체를 잠그고 읽고 씁니다.
+     * (풀이가 여러 스레드에서 출력해도 보고하는 쪽이 중간 상태를 읽지 않도록 하기 위함입니다)
+     */
+    private static final class RunState {
+        final ByteArrayOutputStream out = new ByteArrayOutputStream();
+        final ByteArrayOutputStream err = new ByteArrayOutputStream();
+        final long startNanos = System.nanoTime();
+        boolean reported;
+        volatile boolean outputExceeded;
+    }
+
+    /**
+     * 출력이 제한을 넘는 즉시 결과를 보고하고 하네스를 종료하는 스트림 (무한 출력이 힙을 채우지 않도록 합니다)
+     * 잠금 순서는 report(클래스) → RunState 이므로, RunState 를 잠근 채로 report 를 호출하지 않습니다.
+     */
+    private static final class LimitedOutputStream extends OutputStream {
+        private final RunState state;
+        private final ByteArrayOutputStream buffer;
+        private final long limit;
+        private long written;
+
+        LimitedOutputStream(RunState state, ByteArrayOutputStream buffer, long limit) {
+            this.state = state;
+            this.buffer = buffer;
+            this.limit = limit;
+        }
+
+        @Override
+        public void write(int b) {
+            write(new byte[] { (byte) b }, 0, 1);
+        }
+
+        @Override
+        public void write(byte[] b, int off, int len) {
+            synchronized (state) {
+                if (!state.outputExceeded) {
+                    written += len;
+                    if (written <= limit) {
+                        buffer.write(b, off, len);
+                        return;
+                    }
+                    state.outputExceeded = true;
+                }
+            }
+            report(state, "OUTPUT_LIMIT", -1);
+            Runtime.getRuntime().halt(0);
+        }
+    }
+
+    public static void main(String[] args) throws IOException {
+        Runtime.getRuntime().addShutdownHook(new Thread(() -> {
+            RunState state = current;
+            if (state != null) {
+                // 풀이 코드가 System.exit 를 호출한 경우: 종료 코드는 호출 측이 프로세스에서 읽습니다.
+                report(state, "EXIT", -1);
+            }
+        }));
+
+        BufferedReader requests = new BufferedReader(
+                new InputStreamReader(new FileInputStream(FileDescriptor.in), StandardCharsets.UTF_8));
+        String line;
+        while ((line = requests.readLine()) != null) {
+            String[] parts = line.split("\t");
+            if (parts.length != 7 || !"RUN".equals(parts[0])) {
+                continue;
+            }
+            runOnce(parts[1], parts[2], parts[3], Long.parseLong(parts[4]), Long.parseLong(parts[5]),
+                    Long.parseLong(parts[6]));
+        }
+    }
+
+    private static void runOnce(String classDir, String className, String inputFile, long timeoutMillis,
+            long outputLimit, long stackBytes) throws IOException {
+        RunState state = new RunState();
+        PrintStream solutionOut =
+                new PrintStream(new LimitedOutputStream(state, state.out, outputLimit), false, "UTF-8");
+        PrintStream solutionErr =
+                new PrintStream(new LimitedOutputStream(state, state.err, outputLimit), true, "UTF-8");
+        InputStream solutionIn = new BufferedInputStream(new FileInputStream(inputFile), 1 << 16);
+
+        System.setIn(solutionIn);
+        System.setOut(solutionOut);
+        System.setErr(solutionErr);
+
+        // 테스트마다 새 클래스로더를 사용하여 static 상태가 이전 테스트에서 넘어오지 않도록 합니다.
+        URLClassLoader loader = new URLClassLoader(
+                new URL[] { Paths.get(classDir).toUri().toURL() },
+                ClassLoader.getPlatformClassLoader());
+        ThreadGroup group = new ThreadGroup("judge-" + className);
+        Throwable[] failure = new Throwable[1];
+
+        Thread runner = new Thread(group, () -> {
+            try {
+                Class<?> mainClass = Class.forName(className, true, loader);
+                Method mainMethod = mainClass.getMethod("main", String[].class);
+                mainMethod.invoke(null, (Object) new String[0]);
+            } catch (InvocationTargetException e) {
+                failure[0] = e.getCause();
+            } catch (Throwable t) {
+                failure[0] = t;
+            }
+        }, "main", stackBytes);
+        runner.setContextClassLoader(loader);
+
+        current = state;
+        runner.start();
+
+        long deadline = System.nanoTime() + timeoutMillis * 1_000_000L;
+        boolean finished = joinGroup(runner, group, deadline);
+
+        solutionOut.flush();
+        if (!finished) {
+            report(state, "TIMEOUT", -1);
+            // 멈추지 않는 스레드를 안전하게 정리할 방법이 없으므로 하네스를 종료합니다.
+            Runtime.getRuntime().halt(0);
+        }
+
+        if (failure[0] != null) {
+            failure[0].printStackTrace(solutionErr);
+            solutionErr.flush();
+            report(state, "RUNTIME_ERROR", 1);
+        } else {
+            report(state, "OK", 0);
+        }
+        if (state.outputExceeded) {
+            // 다른 스레드가 출력 제한을 넘긴 직후에 끝난 경우: OUTPUT_LIMIT 으로 보고했으므로 규약대로 종료합니다.
+            Runtime.getRuntime().halt(0);
+        }
+        current = null;
+        solutionIn.close();
+        loader.close();
+    }
+
+    /** 메인 스레드와, 풀이 코드가 만든 다른 스레드(예: 큰 스택용 스레드)가 모두 끝날 때까지 기다립니다. */
+    private static boolean joinGroup(Thread runner, ThreadGroup group, long deadline) {
+        try {
+            while (true) {
+                long remaining = deadline - System.nanoTime();
+                if (remaining <= 0) {
+                    return false;
+                }
+                if (runner.isAlive()) {
+                    runner.join(Math.max(1, remaining / 1_000_000L));
+                    continue;
+                }
+                Thread[] alive = new Thread[group.activeCount() + 1];
+                int count = group.enumerate(alive, true);
+                boolean anyAlive = false;
+                for (int i = 0; i < count; i++) {
+                    if (alive[i].isAlive() && !alive[i].isDaemon()) {
+                        anyAlive = true;
+                        alive[i].join(Math.max(1, (deadline - System.nanoTime()) / 1_000_000L));
+                        break;
+                    }
+                }
+                if (!anyAlive) {
+                    return true;
+                }
+            }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            return false;
+        }
+    }
+
+    private static synchronized void report(RunState state, String status, int exitCode) {
+        if (state.reported) {
+            return;
+        }
+        state.reported = true;
+        long elapsed = System.nanoTime() - state.startNanos;
+        byte[] out = new byte[0];
+        byte[] err;
+        synchronized (state) {
+            // 출력 제한을 넘은 뒤에는 어떤 경로로 보고하든 OUTPUT_LIMIT 입니다.
+            if (state.outputExceeded) {
+                status = "OUTPUT_LIMIT";
+                exitCode = -1;
+            }
+            if (!"OUTPUT_LIMIT".equals(status)) {
+                out = state.out.toByteArray();
+            }
+            err = state.err.toByteArray();
+        }
+        try {
+            String header = "RESULT " + status + " " + exitCode + " " + elapsed + " "
+                    + out.length + " " + err.length + "\n";
+            PROTOCOL_OUT.write(header.getBytes(StandardCharsets.US_ASCII));
+            PROTOCOL_OUT.write(out);
+            PROTOCOL_OUT.write(err);
+            PROTOCOL_OUT.flush();
+        } catch (IOException e) {
+            Runtime.getRuntime().halt(2);
+        }
+    }
+}
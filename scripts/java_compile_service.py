@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+scripts/java_compile_service.py
+하나의 장수(long-lived) 컴파일러 프로세스로 여러 Java 소스를 묶어서 컴파일하는 서비스
+(scripts/java/BatchJavaCompiler.java 와 파이프로 통신합니다)
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+SERVICE_SOURCE = Path(__file__).resolve().parent / 'java' / 'BatchJavaCompiler.java'
+SERVICE_CLASS = 'BatchJavaCompiler'
+
+# 파일 하나당 허용하는 최대 컴파일 시간 (초)
+COMPILE_TIMEOUT_SECONDS = 30
+
+# 컴파일 옵션 (BatchJavaCompiler.java 에서 사용하는 옵션과 같아야 합니다)
+COMPILE_FLAGS = ['-encoding', 'UTF-8']
+
+
+def compile_with_javac(source_file, output_dir, timeout=COMPILE_TIMEOUT_SECONDS):
+    """javac 프로세스를 새로 띄워 파일 하나를 컴파일합니다. (서비스를 사용할 수 없을 때의 대안)"""
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        result = subprocess.run(
+            ['javac', *COMPILE_FLAGS, '-d', output_dir, source_file],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return False, f"컴파일 시간 초과 ({timeout}초)"
+    except Exception as e:
+        return False, f"컴파일 중 오류: {str(e)}"
+    if result.returncode == 0:
+        return True, ""
+    return False, result.stderr or result.stdout or "알 수 없는 컴파일 오류"
+
+
+class JavaCompileService:
+    """BatchJavaCompiler 프로세스를 띄워 두고 컴파일 요청을 순서대로 보냅니다.
+
+    서비스를 띄울 수 없는 환경(JRE만 있는 경우 등)에서는 파일마다 javac 를 실행합니다.
+    service_command 가 주어지면 BatchJavaCompiler 를 빌드하지 않고 그 명령으로 서비스를 띄웁니다.
+    (같은 규약으로 응답하는 다른 구현이나 테스트용 가짜 서비스를 사용할 때)
+    """
+
+    def __init__(self, service_command=None):
+        self.build_dir = tempfile.mkdtemp(prefix='compile_service_')
+        self.service_command = list(service_command) if service_command else None
+        self.process = None
+        self.available = True
+        self.lock = threading.Lock()
+
+    def _start(self):
+        command = self.service_command
+        if command is None:
+            ok, error_msg = compile_with_javac(str(SERVICE_SOURCE), self.build_dir, timeout=60)
+            if not ok:
+                raise RuntimeError(f"컴파일 서비스 빌드 실패: {error_msg}")
+            command = ['java', '-cp', self.build_dir, SERVICE_CLASS]
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        ready = self.process.stdout.readline().decode('ascii', errors='replace').strip()
+        if ready != 'READY':
+            self._discard_process()
+            raise RuntimeError(f"컴파일 서비스 시작 실패: {ready or '응답 없음'}")
+
+    def _discard_process(self):
+        if self.process is None:
+            return
+        try:
+            self.process.kill()
+        except OSError:
+            pass
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self.process = None
+
+    def _ensure_started(self):
+        if not self.available:
+            return False
+        if self.process is not None and self.process.poll() is None:
+            return True
+        try:
+            self._start()
+            return True
+        except (RuntimeError, OSError) as e:
+            print(f"⚠️ 컴파일 서비스 사용 불가, 파일마다 javac 를 실행합니다: {e}")
+            self.available = False
+            return False
+
+    def _read_response(self, timeout):
+        process = self.process
+        watchdog = threading.Timer(timeout, process.kill)
+        watchdog.start()
+        try:
+            header = process.stdout.readline().decode('ascii', errors='replace').split()
+            if len(header) != 3 or header[0] != 'RESULT':
+                raise EOFError("컴파일 서비스 응답이 올바르지 않습니다.")
+            size = int(header[2])
+            body = process.stdout.read(size) if size else b''
+            if len(body) != size:
+                raise EOFError("컴파일 서비스 응답이 중간에 끊겼습니다.")
+            return header[1] == 'OK', body.decode('utf-8', errors='replace')
+        finally:
+            watchdog.cancel()
+
+    def compile_batch(self, jobs):
+        """[(소스 파일, 출력 디렉토리), ...] 를 컴파일하고 파일별 (성공 여부, 진단 메시지) 목록을 반환합니다."""
+        with self.lock:
+            if not self._ensure_started():
+                return [compile_with_javac(source, output_dir) for source, output_dir in jobs]
+
+            # 요청을 하나 보내고 그 응답을 읽은 뒤 다음 요청을 보냅니다. 요청을 한꺼번에 보내면 서비스가 응답을 쓰는 동안
+            # 양쪽 파이프 버퍼가 모두 차서 서로를 기다리게 될 수 있습니다.
+            outcomes = []
+            for index, (source, output_dir) in enumerate(jobs):
+                try:
+                    os.makedirs(output_dir, exist_ok=True)
+                    request = f"COMPILE\t{os.path.abspath(source)}\t{os.path.abspath(output_dir)}\n"
+                    self.process.stdin.write(request.encode('utf-8'))
+                    self.process.stdin.flush()
+                    outcomes.append(self._read_response(COMPILE_TIMEOUT_SECONDS))
+                except (OSError, EOFError, ValueError):
+                    # 서비스가 죽었으면 응답을 받지 못한 파일(지금 파일 포함)은 javac 로 직접 컴파일합니다.
+                    # 서비스 쪽 문제를 제출 코드의 컴파일 에러로 판정하지 않기 위함입니다.
+                    self._discard_process()
+                    outcomes.extend(compile_with_javac(s, d) for s, d in jobs[index:])
+                    break
+            return outcomes
+
+    def close(self):
+        """서비스 프로세스를 종료하고 빌드 디렉토리를 정리합니다."""
+        with self.lock:
+            if self.process is not None:
+                try:
+                    self.process.stdin.close()
+                    self.process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+                # 이미 종료된 프로세스는 파이프만 정리됩니다.
+                self._discard_process()
+            shutil.rmtree(self.build_dir, ignore_errors=True)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+scripts/jvm_startup.py
+JVM 시작 시간을 줄이기 위한 클래스 데이터 공유(AppCDS) 아카이브와 시작 시간 위주 JVM 옵션
+
+짧은 테스트는 실행 시간 대부분이 JVM 시작(JDK 클래스 로딩·검증)에 쓰이므로,
+풀이가 흔히 사용하는 JDK 클래스를 미리 아카이브로 만들어 두고 실행할 때마다 매핑해서 사용합니다.
+아카이브는 JDK 클래스만 담고 애플리케이션 클래스 경로 없이 만들기 때문에 어떤 -cp 로 실행해도 사용할 수 있습니다.
+(JDK 11 의 -XX:DumpLoadedClassList / -Xshare:dump 방식)
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+WARMUP_SOURCE = Path(__file__).resolve().parent / 'java' / 'CdsWarmup.java'
+WARMUP_CLASS = 'CdsWarmup'
+
+# 클래스 목록을 만들 때 워밍업 프로그램에 주는 입력
+WARMUP_INPUT = b"5\n3 1 4 1 5\n"
+
+JVM_FLAGS_DEFAULT = 'default'
+JVM_FLAGS_STARTUP = 'startup'
+
+# 시작 시간 위주 옵션: C1 컴파일러만 사용하고(JIT 준비 비용 감소), 성능 카운터 파일을 만들지 않습니다.
+# 오래 실행되는 풀이는 최고 성능이 낮아지므로 기본값으로 사용하지 않습니다.
+# (작은 힙에 맞는 SerialGC 는 ResourceProfile.jvm_options() 에서 항상 사용합니다)
+JVM_FLAG_PROFILES = {
+    JVM_FLAGS_DEFAULT: [],
+    JVM_FLAGS_STARTUP: ['-XX:TieredStopAtLevel=1', '-XX:-UsePerfData'],
+}
+
+# 아카이브를 만들 때와 사용할 때 같아야 하는 옵션 (GC 와 압축 포인터 설정이 다르면 아카이브를 쓸 수 없습니다)
+# ResourceProfile.jvm_options() 의 값과 맞춥니다.
+ARCHIVE_JVM_OPTIONS = ['-XX:+UseSerialGC', '-XX:CompressedClassSpaceSize=64m']
+
+ARCHIVE_BUILD_TIMEOUT_SECONDS = 120
+
+
+def get_java_version():
+    """java -version 출력을 반환합니다. java 를 찾을 수 없으면 None 을 반환합니다."""
+    try:
+        result = subprocess.run(['java', '-version'], capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return (result.stderr or result.stdout).strip() or None
+
+
+def jvm_flag_profile_options(name):
+    """JVM 옵션 프로필 이름에 해당하는 옵션 목록"""
+    if name not in JVM_FLAG_PROFILES:
+        raise ValueError(f"알 수 없는 JVM 옵션 프로필: {name}")
+    return list(JVM_FLAG_PROFILES[name])
+
+
+def cds_options(archive_path):
+    """아카이브를 사용하는 JVM 옵션. 아카이브를 쓸 수 없으면 JVM 이 조용히 일반 로딩으로 되돌아갑니다(-Xshare:auto)."""
+    return ['-Xshare:auto', f'-XX:SharedArchiveFile={archive_path}']
+
+
+def _run_step(cmd, input_data=b''):
+    try:
+        result = subprocess.run(cmd, input=input_data, capture_output=True, timeout=ARCHIVE_BUILD_TIMEOUT_SECONDS)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"{cmd[0]} 실행 실패: {e}")
+    if result.returncode != 0:
+        message = (result.stderr or result.stdout).decode('utf-8', errors='replace').strip()
+        raise RuntimeError(f"{' '.join(cmd[:3])} ... 실패: {message[:500]}")
+    return result
+
+
+def build_cds_archive(cache_dir, java_version):
+    """<캐시 디렉토리>/cds/<키>/app.jsa 에 아카이브를 만들고 경로를 반환합니다. 이미 있으면 다시 만들지 않습니다."""
+    with open(WARMUP_SOURCE, 'rb') as f:
+        digest = hashlib.sha256(f.read())
+    digest.update(b'\0' + java_version.encode('utf-8') + b'\0' + ' '.join(ARCHIVE_JVM_OPTIONS).encode('utf-8'))
+    entry = Path(cache_dir) / 'cds' / digest.hexdigest()
+    archive = entry / 'app.jsa'
+    if archive.is_file():
+        return str(archive)
+
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    # 임시 디렉토리에서 만든 뒤 이름을 바꿔서, 동시에 실행되는 러너가 만들다 만 아카이브를 보지 않게 합니다.
+    staging = tempfile.mkdtemp(prefix=f'.{entry.name[:8]}_', dir=entry.parent)
+    try:
+        classes_dir = os.path.join(staging, 'classes')
+        class_list = os.path.join(staging, 'classes.lst')
+        _run_step(['javac', '-encoding', 'UTF-8', '-d', classes_dir, str(WARMUP_SOURCE)])
+        _run_step(['java', *ARCHIVE_JVM_OPTIONS, '-Xshare:off', f'-XX:DumpLoadedClassList={class_list}',
+                   '-cp', classes_dir, WARMUP_CLASS], WARMUP_INPUT)
+        # 워밍업 프로그램 자신은 제외하고 JDK 클래스만 남깁니다.
+        with open(class_list, 'r', encoding='utf-8') as f:
+            jdk_classes = [line for line in f if line.strip() and not line.startswith(WARMUP_CLASS)]
+        with open(class_list, 'w', encoding='utf-8') as f:
+            f.writelines(jdk_classes)
+        _run_step(['java', *ARCHIVE_JVM_OPTIONS, '-Xshare:dump', f'-XX:SharedClassListFile={class_list}',
+                   f'-XX:SharedArchiveFile={os.path.join(staging, "app.jsa")}'])
+        # 만든 아카이브를 실제로 매핑할 수 있는지 확인합니다.
+        _run_step(['java', *ARCHIVE_JVM_OPTIONS, '-Xshare:on',
+                   f'-XX:SharedArchiveFile={os.path.join(staging, "app.jsa")}', '-version'])
+        shutil.rmtree(classes_dir, ignore_errors=True)
+        try:
+            os.replace(staging, entry)
+        except OSError:
+            # 다른 러너가 먼저 만든 경우 그 아카이브를 사용합니다.
+            if not archive.is_file():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return str(archive)
+
+
+class StartupOptions:
+    """run_java_program 이 JVM 옵션 뒤에 덧붙이는 시작 시간 관련 옵션을 만듭니다.
+    아카이브는 처음 필요할 때 한 번만 만들고, 실패하면 경고 후 아카이브 없이 실행합니다."""
+
+    def __init__(self, cache_dir=None, flag_profile=JVM_FLAGS_DEFAULT):
+        self.cache_dir = cache_dir
+        self.flag_profile = flag_profile
+        self.archive = None
+        self.checked = False
+        self.lock = threading.Lock()
+
+    def archive_path(self):
+        with self.lock:
+            if not self.checked and self.cache_dir:
+                self.checked = True
+                java_version = get_java_version()
+                if java_version is None:
+                    print("⚠️ java 버전을 확인할 수 없어 CDS 아카이브를 사용하지 않습니다.")
+                else:
+                    try:
+                        self.archive = build_cds_archive(self.cache_dir, java_version)
+                        print(f"📦 CDS 아카이브 사용: {self.archive}")
+                    except (RuntimeError, OSError) as e:
+                        print(f"⚠️ CDS 아카이브 생성 실패, 아카이브 없이 실행합니다: {e}")
+            return self.archive
+
+    def options(self, flag_profile=None):
+        """CDS 옵션과 JVM 옵션 프로필(flag_profile 이 없으면 기본 프로필)을 반환합니다."""
+        archive = self.archive_path()
+        return [*(cds_options(archive) if archive else []),
+                *jvm_flag_profile_options(flag_profile or self.flag_profile)]
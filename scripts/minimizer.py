@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+scripts/minimizer.py
+실패한 테스트 입력을 델타 디버깅(ddmin)으로 줄여 작은 재현 입력을 만듭니다.
+
+1. 줄 단위로 덩어리를 지워 보며 여전히 실패하는 가장 작은 입력을 찾습니다.
+2. 한 줄에 값이 여러 개인 줄은 토큰 단위로 같은 과정을 반복합니다.
+첫 줄이 "개수 N" 이면 줄/토큰을 지울 때 N 도 함께 줄여서 입력 형식을 유지합니다.
+후보 입력들은 여러 스레드에서 동시에 검사합니다.
+"""
+
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 최소화 기본 시간 예산 (초)
+DEFAULT_MINIMIZE_BUDGET_SECONDS = 60
+
+
+def split_lines(data):
+    """입력을 줄 목록으로 나눕니다. (마지막 빈 줄 제외)"""
+    lines = data.split(b'\n')
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return lines
+
+
+def join_lines(lines):
+    return b'\n'.join(lines) + b'\n' if lines else b''
+
+
+def _parse_count(line):
+    tokens = line.split()
+    if len(tokens) == 1 and tokens[0].isdigit():
+        return int(tokens[0])
+    return None
+
+
+class Minimizer:
+    """still_fails(입력 bytes) 가 True 를 유지하는 범위에서 입력을 줄입니다."""
+
+    def __init__(self, still_fails, workers=1, budget_seconds=DEFAULT_MINIMIZE_BUDGET_SECONDS):
+        self.still_fails = still_fails
+        self.workers = max(1, workers)
+        self.deadline = time.monotonic() + budget_seconds
+        self.tests = 0
+
+    def _expired(self):
+        return time.monotonic() >= self.deadline
+
+    def _check(self, candidate):
+        try:
+            return bool(self.still_fails(candidate))
+        except Exception:
+            # 검사 중 오류가 난 후보는 재현에 실패한 것으로 봅니다.
+            return False
+
+    def _first_failing(self, executor, candidates):
+        """후보를 workers 개씩 동시에 검사하여 여전히 실패하는 첫 후보의 번호를 반환합니다."""
+        for start in range(0, len(candidates), self.workers):
+            if self._expired():
+                return None
+            batch = candidates[start:start + self.workers]
+            results = list(executor.map(self._check, batch))
+            self.tests += len(batch)
+            for offset, failed in enumerate(results):
+                if failed:
+                    return start + offset
+        return None
+
+    def ddmin(self, executor, items, build):
+        """items 의 부분 목록 중 build(부분 목록) 이 여전히 실패하는 최소 목록을 찾습니다."""
+        granularity = 2
+        while len(items) >= 2 and not self._expired():
+            chunk = math.ceil(len(items) / granularity)
+            starts = range(0, len(items), chunk)
+            subsets = [items[i:i + chunk] for i in starts]
+            complements = [items[:i] + items[i + chunk:] for i in starts]
+            candidates = subsets + complements if granularity > 2 else complements
+            found = self._first_failing(executor, [build(candidate) for candidate in candidates])
+            if found is not None:
+                items = candidates[found]
+                granularity = 2 if granularity > 2 and found < len(subsets) else max(granularity - 1, 2)
+                continue
+            if granularity >= len(items):
+                break
+            granularity = min(len(items), granularity * 2)
+        return items
+
+    def minimize(self, data):
+        """입력 data 를 최소화한 bytes 를 반환합니다."""
+        lines = split_lines(data)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='minimize') as executor:
+            # 1단계: 줄 단위 최소화 (첫 줄이 나머지 줄 수이면 함께 갱신)
+            header = _parse_count(lines[0]) if lines else None
+            if header is not None and header == len(lines) - 1:
+                body = self.ddmin(executor, lines[1:], lambda rest: join_lines([str(len(rest)).encode(), *rest]))
+                lines = [str(len(body)).encode(), *body]
+            else:
+                lines = self.ddmin(executor, lines, join_lines)
+
+            # 2단계: 값이 여러 개인 줄의 토큰 단위 최소화 (첫 줄이 그 줄의 값 개수이면 함께 갱신)
+            header = _parse_count(lines[0]) if lines else None
+            for index in range(len(lines)):
+                if self._expired():
+                    break
+                tokens = lines[index].split()
+                if len(tokens) < 2:
+                    continue
+                syncs_header = index > 0 and header == len(tokens) and len(lines) == 2
+
+                def build(kept, index=index, syncs_header=syncs_header):
+                    candidate = list(lines)
+                    candidate[index] = b' '.join(kept)
+                    if syncs_header:
+                        candidate[0] = str(len(kept)).encode()
+                    return join_lines(candidate)
+
+                kept = self.ddmin(executor, tokens, build)
+                if kept != tokens:
+                    lines[index] = b' '.join(kept)
+                    if syncs_header:
+                        lines[0] = str(len(kept)).encode()
+        return join_lines(lines)
+
+
+def minimize_input(data, still_fails, workers=1, budget_seconds=DEFAULT_MINIMIZE_BUDGET_SECONDS):
+    """실패하는 입력 data 를 줄여 (최소화된 입력, 검사 횟수) 를 반환합니다."""
+    minimizer = Minimizer(still_fails, workers, budget_seconds)
+    minimized = minimizer.minimize(data)
+    # 줄바꿈 정리만으로 오히려 길어졌다면 원래 입력을 그대로 사용합니다.
+    return (minimized if len(minimized) < len(data) else data), minimizer.tests
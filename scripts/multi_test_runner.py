@@ -9,8 +9,94 @@ import os
 import sys
 import subprocess
 import time
+import argparse
+import asyncio
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+from process_runner import (
+    percentile, classify_execution, ExecutionResult, VERDICT_RUNTIME_ERROR
+)
+from async_runner import run_measured_async
+from checkpoint_journal import DEFAULT_JOURNAL_PATH, CheckpointJournal
+from cost_model import TestCostModel
+from data_store import (
+    DATA_TEST_TYPE, StreamedInput, compression_of, compression_suffix, load_data_tests, take_decompression_stats
+)
+from checkers import CHECKER_CUSTOM, ExactChecker, create_checker, detect_checker_spec
+from stress_tests import (
+    CONSENSUS_SIZE, REFERENCE_DIR, STRESS_TEST_TYPE, ReferenceOracle, find_reference_solutions, is_stress_test,
+    run_generator
+)
+from fuzzer import (
+    DEFAULT_FUZZ_BUDGET_SECONDS, FUZZ_GENERATOR_NAME, MAX_LITERAL_COUNTEREXAMPLE_BYTES, append_generated_test,
+    find_fuzz_generator, fuzz
+)
+from jvm_startup import JVM_FLAG_PROFILES, JVM_FLAGS_DEFAULT, StartupOptions
+from minimizer import DEFAULT_MINIMIZE_BUDGET_SECONDS, minimize_input
+from speed_calibration import REFERENCE_BASELINE_FILE, SpeedCalibrator, load_reference_baseline, normalize_seconds
+from repeat_timing import DEFAULT_REPEAT, DEFAULT_UNSTABLE_CV, combine_runs, describe_timing, needs_repeat
+from result_records import (
+    DEFAULT_ARTIFACT_DIR, Payload, PayloadBuilder, TestRecord, record_to_json, spill_payload
+)
+from scratch_space import ScratchSpace, install_cleanup_handlers, stage_test_inputs
+from verdict_cache import read_test_set, test_set_digest
+from resource_limits import (
+    ResourceProfile, DEFAULT_MEMORY_LIMIT_MB, DEFAULT_OUTPUT_LIMIT_MB, compile_launcher, default_max_tasks
+)
+
+# 입력을 줄여도 같은 실패가 재현되는 판정 (시간 초과는 입력을 줄이면 사라지므로 제외)
+MINIMIZABLE_VERDICTS = ('WA', 'RE', 'MLE')
+
+# 참고 풀이는 제출 코드보다 느릴 수 있으므로 제한 시간에 곱하는 배수
+REFERENCE_TIME_MULTIPLIER = 2
+
+# 문제별 채점기 설정(checker.json)과 채점 프로그램(Checker.java)을 두는 디렉토리
+CHECKER_DIR = 'checkers'
+
+# 명령행 옵션으로 설정되는 실행 옵션
+RUNNER_OPTIONS = {
+    'warm_jvm': False,
+    'jobs': os.cpu_count() or 1,
+    'class_cache_dir': None,
+    'verdict_cache_dir': None,
+    'cds_cache_dir': None,
+    'history_dir': None,
+    'jvm_flags': JVM_FLAGS_DEFAULT,
+    'cap_address_space': True,
+    'max_tasks': None,
+    'speed_factor': 1.0,
+    # 기준 작업으로 잰 속도 보정 결과 (speed_calibration.SpeedCalibrator.calibrate, main 에서 설정)
+    'calibration': None,
+    'repeat': DEFAULT_REPEAT,
+    'unstable_cv': DEFAULT_UNSTABLE_CV,
+    'output_limit_mb': DEFAULT_OUTPUT_LIMIT_MB,
+    'minimize_budget': DEFAULT_MINIMIZE_BUDGET_SECONDS,
+    'artifact_dir': DEFAULT_ARTIFACT_DIR,
+}
+
+_warm_pool = None
+_warm_pool_lock = threading.Lock()
+_test_executor = None
+_test_executor_lock = threading.Lock()
+_compile_service = None
+_compile_service_lock = threading.Lock()
+_class_cache = None
+_class_cache_checked = False
+_verdict_cache = None
+_verdict_cache_checked = False
+_startup_options = None
+# 풀이 메인 스레드에만 큰 스택을 주는 실행기의 빌드 디렉토리 (get_main_launcher_dir)
+_launcher_dir = None
+# --resume 으로 이어서 실행할 수 있도록 끝난 문제와 테스트를 기록하는 저널 (main 에서 만듭니다)
+_checkpoint = None
+# 문제별 빌드/실행 디렉토리를 만드는 tmpfs 세션 (작업 트리에는 아무것도 쓰지 않습니다)
+_scratch = ScratchSpace()
+
 class TestResult:
     """단일 문제의 테스트 결과를 저장하는 클래스"""
     def __init__(self):
@@ -26,54 +112,283 @@ class TestResult:
         self.error_messages = []
         self.execution_time = 0
 
-def compile_java_code(code_file):
-    """Java 코드를 컴파일합니다."""
+def get_compile_service():
+    """공용 Java 컴파일 서비스를 반환합니다."""
+    global _compile_service
+    with _compile_service_lock:
+        if _compile_service is None:
+            from java_compile_service import JavaCompileService
+            _compile_service = JavaCompileService()
+        return _compile_service
+
+def shutdown_compile_service():
+    """Java 컴파일 서비스를 종료합니다."""
+    global _compile_service
+    with _compile_service_lock:
+        service, _compile_service = _compile_service, None
+    if service is not None:
+        service.close()
+
+def get_class_cache():
+    """컴파일된 클래스 캐시를 반환합니다. 캐시를 사용하지 않거나 javac 버전을 알 수 없으면 None 을 반환합니다."""
+    global _class_cache, _class_cache_checked
+    with _compile_service_lock:
+        if not _class_cache_checked and RUNNER_OPTIONS['class_cache_dir']:
+            _class_cache_checked = True
+            from class_cache import CompiledClassCache, get_javac_version
+            from java_compile_service import COMPILE_FLAGS
+            javac_version = get_javac_version()
+            if javac_version:
+                _class_cache = CompiledClassCache(RUNNER_OPTIONS['class_cache_dir'], javac_version, COMPILE_FLAGS)
+            else:
+                print("⚠️ javac 버전을 확인할 수 없어 클래스 캐시를 사용하지 않습니다.")
+        return _class_cache
+
+def get_verdict_cache():
+    """채점 결과 캐시를 반환합니다. 캐시를 사용하지 않으면 None 을 반환합니다."""
+    global _verdict_cache, _verdict_cache_checked
+    with _compile_service_lock:
+        if not _verdict_cache_checked and RUNNER_OPTIONS['verdict_cache_dir']:
+            _verdict_cache_checked = True
+            from verdict_cache import VerdictCache
+            _verdict_cache = VerdictCache(RUNNER_OPTIONS['verdict_cache_dir'], current_runner_version())
+        return _verdict_cache
+
+def current_runner_version():
+    """러너 소스, JDK 버전, 판정에 영향을 주는 옵션으로 만든 러너 버전 (옵션이 다르면 다른 러너로 봅니다)"""
+    from class_cache import get_javac_version
+    from verdict_cache import runner_version
+    options = {key: RUNNER_OPTIONS[key]
+               for key in ('warm_jvm', 'cap_address_space', 'speed_factor', 'jvm_flags', 'output_limit_mb',
+                           'repeat')}
+    options['cds'] = bool(RUNNER_OPTIONS['cds_cache_dir'])
+    return runner_version(options, get_javac_version())
+
+def get_verdict_cache_stats():
+    """채점 결과 캐시 적중/미스 횟수를 반환합니다. 캐시를 사용하지 않으면 None 을 반환합니다."""
+    cache = _verdict_cache
+    return cache.stats() if cache is not None else None
+
+def get_class_cache_stats():
+    """클래스 캐시 적중/미스 횟수를 반환합니다."""
+    cache = _class_cache
+    return cache.stats() if cache is not None else None
+
+def compile_with_cache(jobs):
+    """캐시에 있는 파일은 클래스를 복사하고, 나머지만 컴파일 서비스로 컴파일합니다."""
+    cache = get_class_cache()
+    outcomes = [None] * len(jobs)
+    keys = [None] * len(jobs)
+    pending = []
+    for i, (code_file, output_dir) in enumerate(jobs):
+        if cache is not None:
+            keys[i] = cache.key_for(code_file)
+            if cache.restore(keys[i], output_dir):
+                outcomes[i] = (True, "")
+                continue
+        pending.append(i)
+
+    if pending:
+        compiled = get_compile_service().compile_batch([jobs[i] for i in pending])
+        for i, outcome in zip(pending, compiled):
+            outcomes[i] = outcome
+            if cache is not None and outcome[0]:
+                cache.store(keys[i], jobs[i][1])
+    return outcomes, len(jobs) - len(pending)
+
+def compile_java_batch(jobs):
+    """[(코드 파일, 출력 디렉토리), ...] 를 하나의 컴파일러 프로세스에서 컴파일합니다."""
+    if not jobs:
+        return []
+    print(f"⚙️ Java 코드 일괄 컴파일 중: {len(jobs)}개 파일")
+    start_time = time.time()
+    outcomes, cached = compile_with_cache(jobs)
+    for (code_file, _), (success, error_msg) in zip(jobs, outcomes):
+        if success:
+            print(f"  ✅ 컴파일 성공: {code_file}")
+        else:
+            print(f"  ❌ 컴파일 실패: {code_file}\n{error_msg}")
+    print(f"⏱️ 일괄 컴파일 소요 시간: {time.time() - start_time:.2f}초 (캐시 사용 {cached}개)")
+    return outcomes
+
+def compile_java_code(code_file, output_dir):
+    """Java 코드를 output_dir 에 컴파일합니다."""
     print(f"⚙️ Java 코드 컴파일 중: {code_file}")
+    outcomes, cached = compile_with_cache([(code_file, output_dir)])
+    success, error_msg = outcomes[0]
+    if success:
+        print("✅ 캐시된 클래스 사용" if cached else "✅ 컴파일 성공")
+    else:
+        print(f"❌ 컴파일 실패: {error_msg}")
+    return success, error_msg
+
+def make_scratch_dir(prefix):
+    """tmpfs 세션 안에 새 작업 디렉토리를 만듭니다."""
+    return _scratch.make_dir(prefix)
+
+def get_main_launcher_dir():
+    """풀이 메인 스레드에만 큰 스택을 주는 실행기(MainThreadLauncher)를 처음 한 번 컴파일하고 그 디렉토리를 반환합니다."""
+    global _launcher_dir
+    with _compile_service_lock:
+        if _launcher_dir is None:
+            build_dir = make_scratch_dir('launcher_')
+            ok, error_msg = compile_launcher(build_dir)
+            if not ok:
+                raise RuntimeError(f"메인 스레드 실행기 컴파일 실패: {error_msg}")
+            _launcher_dir = build_dir
+        return _launcher_dir
+
+def get_startup_options():
+    """CDS 아카이브와 JVM 옵션 프로필을 관리하는 StartupOptions 를 반환합니다."""
+    global _startup_options
+    with _compile_service_lock:
+        if _startup_options is None:
+            _startup_options = StartupOptions(RUNNER_OPTIONS['cds_cache_dir'], RUNNER_OPTIONS['jvm_flags'])
+        return _startup_options
+
+def startup_jvm_options(jvm_flags=None):
+    """CDS 아카이브 옵션과 JVM 옵션 프로필(jvm_flags 가 없으면 --jvm-flags 값)을 반환합니다."""
+    return get_startup_options().options(jvm_flags)
+
+def get_warm_harness(profile):
+    """현재 스레드에서 profile 로 실행되는 웜 JVM 하네스를 반환합니다. 웜 JVM 모드가 아니면 None 을 반환합니다."""
+    global _warm_pool
+    if not RUNNER_OPTIONS['warm_jvm']:
+        return None
+    with _warm_pool_lock:
+        if _warm_pool is None:
+            from warm_jvm import WarmJvmPool
+            _warm_pool = WarmJvmPool(build_dir=make_scratch_dir('warm_jvm_'))
+    return _warm_pool.acquire([*profile.jvm_options(), *startup_jvm_options()], profile.command_prefix())
+
+def shutdown_warm_harness():
+    """모든 웜 JVM 하네스를 종료합니다."""
+    global _warm_pool
+    with _warm_pool_lock:
+        pool, _warm_pool = _warm_pool, None
+    if pool is not None:
+        pool.close()
+
+def default_resource_profile(**limits):
+    """명령행 옵션을 반영한 자원 제한 프로필을 만듭니다."""
+    return ResourceProfile(cap_address_space=RUNNER_OPTIONS['cap_address_space'],
+                           max_tasks=RUNNER_OPTIONS['max_tasks'],
+                           speed_factor=RUNNER_OPTIONS['speed_factor'],
+                           output_limit_mb=RUNNER_OPTIONS['output_limit_mb'], **limits)
+
+def load_problem_info_file(problem_id):
+    """fetch_boj_problem.py 가 저장한 문제 정보를 읽습니다. 없으면 빈 dict 를 반환합니다."""
     try:
-        result = subprocess.run(
-            ['javac', '-encoding', 'UTF-8', code_file],
-            capture_output=True, text=True, timeout=30
-        )
-        if result.returncode == 0:
-            print("✅ 컴파일 성공")
-            return True, ""
-        else:
-            error_msg = result.stderr or result.stdout or "알 수 없는 컴파일 오류"
-            print(f"❌ 컴파일 실패: {error_msg}")
-            return False, error_msg
-    except subprocess.TimeoutExpired:
-        error_msg = "컴파일 시간 초과 (30초)"
-        print(f"❌ {error_msg}")
-        return False, error_msg
-    except Exception as e:
-        error_msg = f"컴파일 중 오류: {str(e)}"
-        print(f"❌ {error_msg}")
-        return False, error_msg
+        with open(f'problem_{problem_id}_info.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def build_resource_profile(problem_id):
+    """문제 정보 파일의 시간/메모리 제한으로 자원 제한 프로필을 만듭니다."""
+    info = load_problem_info_file(problem_id)
+    return default_resource_profile(
+        memory_limit_mb=info.get('memory_limit_mb') or DEFAULT_MEMORY_LIMIT_MB,
+        time_limit_ms=info.get('time_limit_ms'),
+        no_extra_time=bool(info.get('no_extra_time'))
+    )
+
+def load_checker_spec(problem_id):
+    """문제의 채점기 설정을 찾습니다.
+
+    우선순위: checkers/<문제번호>/Checker.java (채점 프로그램) > checkers/<문제번호>/checker.json
+    > 문제 정보의 checker 항목 > 문제 설명의 허용 오차 문장 > 기본 줄 단위 비교
+    """
+    problem_dir = os.path.join(CHECKER_DIR, str(problem_id))
+    custom_source = os.path.join(problem_dir, 'Checker.java')
+    if os.path.exists(custom_source):
+        return {'type': CHECKER_CUSTOM, 'source': custom_source}
+    spec_file = os.path.join(problem_dir, 'checker.json')
+    if os.path.exists(spec_file):
+        with open(spec_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    info = load_problem_info_file(problem_id)
+    if info.get('checker'):
+        return info['checker']
+    return detect_checker_spec(info.get('description'), info.get('output_format'), info.get('hint'))
+
+def build_checker(problem_id, build_dir):
+    """문제에 맞는 채점기를 만듭니다. 채점 프로그램은 문제마다 한 번만 컴파일하여 모든 테스트에서 재사용합니다."""
+    spec = load_checker_spec(problem_id)
+    if isinstance(spec, dict) and spec.get('type') == CHECKER_CUSTOM and 'command' not in spec:
+        source = spec['source']
+        checker_dir = os.path.join(build_dir, 'checker')
+        success, error_msg = compile_java_code(source, checker_dir)
+        if not success:
+            raise RuntimeError(f"채점 프로그램 컴파일 실패: {error_msg}")
+        spec = {**spec, 'command': ['java', '-cp', checker_dir, Path(source).stem]}
+    return create_checker(spec)
 
-def run_java_program(code_dir, class_name, input_data, timeout=5):
-    """Java 프로그램을 실행하고 결과를 반환합니다."""
+def run_reference_solution(profile, code_dir, class_name, input_path, output_path):
+    """참고 풀이를 실행하여 출력을 output_path 에 저장합니다. 참고 풀이는 제출 코드보다 느릴 수 있으므로 시간을 넉넉히 줍니다."""
+    with open(output_path, 'wb') as out:
+        execution = run_java_program(code_dir, class_name, b'', profile.timeout_seconds() * REFERENCE_TIME_MULTIPLIER,
+                                     profile, stdout_sink=out.write, input_file=input_path)
+    return execution.success
+
+def build_reference_oracle(problem_id, code_file, build_dir, profile):
+    """스트레스 테스트의 예상 출력을 만들 참고 풀이를 찾아 컴파일합니다."""
+    sources, trusted = find_reference_solutions(problem_id, code_file)
+    sources = sources[:1] if trusted else sources[:CONSENSUS_SIZE]
+    jobs = [(source, os.path.join(build_dir, f'reference_{i}')) for i, source in enumerate(sources)]
+    solutions = []
+    if jobs:
+        for (source, output_dir), (success, error_msg) in zip(jobs, compile_java_batch(jobs)):
+            if success:
+                solutions.append((output_dir, Path(source).stem))
+            else:
+                print(f"⚠️ 참고 풀이 컴파일 실패 ({source}): {error_msg}")
+    return ReferenceOracle(solutions, trusted, partial(run_reference_solution, profile))
+
+def run_java_program(code_dir, class_name, input_data, timeout=5, profile=None, stdout_sink=None, input_file=None,
+                     jvm_flags=None):
+    """Java 프로그램을 자원 제한 프로필에 맞춰 실행하고 ExecutionResult 를 반환합니다.
+
+    입출력은 바이트로 다룹니다. input_file 이 주어지면 input_data 대신 해당 파일을 표준 입력 파일 디스크립터로
+    연결하고, 없으면 input_data 를 memfd 에 담아 연결합니다.
+    stdout_sink 가 주어지면 출력을 읽는 즉시 넘기고(스트리밍 비교), 결과에는 출력 앞부분만 보관합니다.
+    jvm_flags 로 JVM 옵션 프로필('default', 'startup')을 지정할 수 있으며, 없으면 --jvm-flags 값을 사용합니다.
+    """
+    if profile is None:
+        profile = default_resource_profile()
+    try:
+        harness = get_warm_harness(profile)
+        if harness is not None:
+            return harness.run(code_dir, class_name, input_data, timeout, profile, stdout_sink, input_file)
+    except (RuntimeError, OSError) as e:
+        # 하네스를 띄울 수 없으면 테스트마다 새 JVM을 띄우는 방식으로 되돌아갑니다.
+        print(f"⚠️ 웜 JVM 사용 불가, 일반 실행으로 전환: {e}")
+        RUNNER_OPTIONS['warm_jvm'] = False
+        shutdown_warm_harness()
+    # 순차 실행은 비동기 실행 코어를 이벤트 루프 하나로 감싼 것입니다.
+    return asyncio.run(run_java_program_async(code_dir, class_name, input_data, timeout, profile, stdout_sink,
+                                              input_file, jvm_flags))
+
+async def run_java_program_async(code_dir, class_name, input_data, timeout=5, profile=None, stdout_sink=None,
+                                 input_file=None, jvm_flags=None):
+    """run_java_program 의 코루틴 버전. 동시 실행 수는 호출하는 쪽(_run_suite_async 의 슬롯)에서 제한합니다."""
+    if profile is None:
+        profile = default_resource_profile()
+    if RUNNER_OPTIONS['warm_jvm']:
+        # 웜 JVM 하네스는 실행 스레드마다 하나씩 있으므로 테스트 실행 스레드 풀에서 실행합니다.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_test_executor(), partial(
+            run_java_program, code_dir, class_name, input_data, timeout, profile, stdout_sink, input_file, jvm_flags
+        ))
     try:
-        start_time = time.time()
         # ✨ [수정] -cp 옵션으로 클래스 경로를 지정하여 ClassNotFoundException 해결
-        process = subprocess.run(
-            ['java', '-cp', code_dir, class_name],
-            input=input_data,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            timeout=timeout
-        )
-        execution_time = time.time() - start_time
-        
-        if process.returncode == 0:
-            return True, process.stdout.strip(), execution_time, ""
-        else:
-            error_msg = process.stderr or "프로그램 실행 오류"
-            return False, "", execution_time, error_msg
-    except subprocess.TimeoutExpired:
-        return False, "", timeout, f"실행 시간 초과 ({timeout}초)"
+        cmd = [*profile.command_prefix(), 'java', *profile.jvm_options(), *startup_jvm_options(jvm_flags),
+               *profile.launch_args(get_main_launcher_dir(), code_dir, class_name)]
+        outcome = await run_measured_async(cmd, input_data, timeout, stdout_sink, input_file, profile.output_limit_bytes())
+        return classify_execution(profile, outcome.returncode, outcome.timed_out, outcome.stdout, outcome.stderr,
+                                  outcome.wall_time, timeout, outcome.metrics(), outcome.output_exceeded)
     except Exception as e:
-        return False, "", 0, f"실행 중 오류: {str(e)}"
+        return ExecutionResult(VERDICT_RUNTIME_ERROR, b"", 0, f"실행 중 오류: {str(e)}")
 
 def normalize_output(output):
     """출력을 정규화합니다."""
@@ -83,51 +398,383 @@ def normalize_output(output):
     normalized_lines = [line.strip() for line in lines]
     return '\n'.join(normalized_lines)
 
-def compare_outputs(expected, actual, problem_id=None):
-    """출력을 비교합니다."""
+def compare_outputs(expected, actual, problem_id=None, checker=None):
+    """출력을 비교합니다. checker 가 없으면 문제의 채점기 설정(채점 프로그램 제외)을 사용합니다."""
+    if checker is None and problem_id is not None:
+        spec = load_checker_spec(problem_id)
+        if spec and (spec if isinstance(spec, str) else spec.get('type')) != CHECKER_CUSTOM:
+            checker = create_checker(spec)
+    if checker is not None:
+        return checker.check(expected, actual)
     expected_norm = normalize_output(expected)
     actual_norm = normalize_output(actual)
     return expected_norm == actual_norm
 
-def run_single_test(code_dir, class_name, test_case, test_type, test_index, problem_id=None):
-    """단일 테스트케이스를 실행합니다."""
-    input_data = test_case.get('input', '')
+def format_metrics(metrics):
+    """CPU 시간과 최대 메모리를 로그용 문자열로 만듭니다."""
+    parts = []
+    if metrics.get('user_time') is not None and metrics.get('sys_time') is not None:
+        parts.append(f"CPU {metrics['user_time']:.3f}+{metrics['sys_time']:.3f}초")
+    if metrics.get('peak_rss_kb') is not None:
+        parts.append(f"메모리 {metrics['peak_rss_kb'] / 1024:.1f}MB")
+    return f" ({', '.join(parts)})" if parts else ""
+
+def normalization_factor():
+    """실행 시간을 기준 머신 시간으로 환산할 때 나누는 값 (속도 보정 결과가 없으면 --speed-factor).
+
+    둘 다 없으면 기준 머신을 알 수 없으므로 None 을 반환합니다.
+    """
+    calibration = RUNNER_OPTIONS['calibration']
+    if calibration:
+        return calibration['factor']
+    return RUNNER_OPTIONS['speed_factor'] if RUNNER_OPTIONS['speed_factor'] != 1.0 else None
+
+def summarize_performance(details):
+    """테스트별 자원 사용량으로 문제 단위 최댓값과 p95 를 계산합니다.
+
+    normalized 에는 시간 항목을 기준 머신 시간으로 환산한 값을 담아, 러너 머신이 달라도 비교할 수 있게 합니다.
+    (환산할 기준이 없으면 None 입니다)
+    """
+    performance = {}
+    for key in ('wall_time', 'user_time', 'sys_time', 'peak_rss_kb'):
+        values = [d[key] for d in details if d.get(key) is not None]
+        performance[key] = {
+            'max': max(values) if values else None,
+            'p95': percentile(values, 0.95)
+        }
+    factor = normalization_factor()
+    if factor is None:
+        performance['normalized'] = None
+        return performance
+    performance['normalized'] = {'speed_factor': factor}
+    for key in ('wall_time', 'user_time', 'sys_time'):
+        performance['normalized'][key] = {stat: normalize_seconds(value, factor)
+                                          for stat, value in performance[key].items()}
+    return performance
+
+def run_stress_test(code_dir, class_name, test_case, test_type, test_index, problem_id=None, log=print,
+                    profile=None, checker=None, oracle=None, spill=True):
+    """생성기로 입력을 만들고 참고 풀이로 예상 출력을 만들어 스트레스 테스트를 실행합니다."""
+    if profile is None:
+        profile = default_resource_profile()
+    description = test_case.get('description', f'{test_type} 스트레스 테스트 {test_index + 1}')
+    seed = test_case.get('seed', 0)
+    work_dir = make_scratch_dir('stress_')
+    try:
+        try:
+            input_path = run_generator(test_case.get('generator', ''), seed, work_dir, profile=profile)
+        except (RuntimeError, OSError) as e:
+            # 생성기 오류는 제출 코드의 잘못이 아니므로 실패로 세지 않고 건너뜁니다.
+            log(f"  🧪 {description}")
+            log(f"     ⚠️ 건너뜀: {e}")
+            return TestRecord(description, 'SKIP', error=str(e), input=Payload.from_text(f'<생성기 시드 {seed}>'),
+                              skipped=True)
+        expected_path, expected_note = (oracle.expected_output(input_path) if oracle is not None
+                                        else (None, "참고 풀이 없음"))
+        materialized = {
+            'description': description,
+            'input': f'<생성기 시드 {seed}, {os.path.getsize(input_path)} bytes>',
+            'input_file': input_path,
+            'output': f'<{expected_note}>',
+        }
+        if expected_path:
+            materialized['output_file'] = expected_path
+        else:
+            materialized['no_expected'] = True
+        return run_single_test(code_dir, class_name, materialized, test_type, test_index, problem_id, log,
+                               profile, checker, spill=spill)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def spill_failed_test(record, test_case, actual_spool, problem_id, test_type, test_index):
+    """실패한 테스트의 입력/예상 출력/실제 출력 전체를 결과 디렉토리에 저장합니다.
+
+    실행 결과(execution.output)에는 출력 앞부분만 남으므로, 실제 출력은 실행하면서 받아 둔 임시 파일(actual_spool)에서 복사합니다.
+    """
+    target_dir = os.path.join(RUNNER_OPTIONS['artifact_dir'], str(problem_id or 'unknown'),
+                              f'{test_type}_{test_index + 1}')
+    try:
+        # 압축된 테스트 데이터는 압축된 그대로 복사하고 확장자를 붙입니다.
+        spill_payload(record.input, os.path.join(target_dir, 'input.txt' + compression_suffix(
+                          test_case.get('input_file') or '')),
+                      None if test_case.get('input_file') else test_case.get('input', '').encode('utf-8'),
+                      test_case.get('input_file'))
+        if not test_case.get('no_expected'):
+            spill_payload(record.expected, os.path.join(target_dir, 'expected.txt' + compression_suffix(
+                              test_case.get('output_file') or '')),
+                          None if test_case.get('output_file') else test_case.get('output', '').encode('utf-8'),
+                          test_case.get('output_file'))
+        spill_payload(record.actual, os.path.join(target_dir, 'actual.txt'), source_file=actual_spool)
+    except OSError as e:
+        print(f"⚠️ 실패한 테스트 데이터 저장 실패 ({target_dir}): {e}")
+
+def prepare_single_test(test_case, test_type, test_index, log, checker, spill=False):
+    """테스트 실행 전에 입력/예상 출력 요약과 채점 세션을 준비합니다.
+
+    spill 이 켜져 있으면 실패했을 때 전체 실제 출력을 저장할 수 있도록 출력을 임시 파일에도 받아 둡니다.
+    """
+    # 입력 파일이 있으면 파일을 그대로 표준 입력으로 연결하므로 입력 문자열을 인코딩하지 않습니다.
+    input_data = b'' if test_case.get('input_file') else (test_case.get('input') or '').encode('utf-8')
     expected_output = test_case.get('output', '')
     description = test_case.get('description', f'{test_type} 테스트 {test_index + 1}')
+    input_file, input_stream, input_builder = test_case.get('input_file'), None, None
+    if compression_of(input_file):
+        # 압축된 입력은 실행하면서 FIFO 로 풀어 넣고, 입력 요약도 그때 함께 계산합니다.
+        input_builder = PayloadBuilder()
+        input_stream = StreamedInput(input_file, make_scratch_dir('stream_'), input_builder.feed)
+        input_file = input_stream.path
+        input_payload = None
+        source = test_case['input_file']
+        input_preview = f'<{os.path.basename(source)}, 압축 {os.path.getsize(source)} bytes>'
+    else:
+        input_payload = Payload.from_file(input_file) if input_file else Payload.from_bytes(input_data)
+        input_preview = repr(input_payload.preview())
+    if test_case.get('no_expected'):
+        expected_payload = None
+    elif test_case.get('output_file'):
+        expected_payload = Payload.from_file(test_case['output_file'])
+    else:
+        expected_payload = Payload.from_text(expected_output)
     
-    print(f"  🧪 {description}")
-    print(f"     입력: {repr(input_data)}")
-    print(f"     예상: {repr(expected_output)}")
+    log(f"  🧪 {description}")
+    log(f"     입력: {input_preview}")
+    log(f"     예상: {repr(expected_payload.preview() if expected_payload else expected_output)}")
     
-    # ✨ [수정] 코드 디렉토리를 run_java_program에 전달
-    success, actual_output, exec_time, error_msg = run_java_program(code_dir, class_name, input_data)
+    # 출력을 모두 모은 뒤 비교하지 않고, 읽는 즉시 문제의 채점기로 넘깁니다.
+    # 예상 출력을 만들 수 없는 스트레스 테스트는 시간/메모리 제한만 확인합니다.
+    comparator = None if test_case.get('no_expected') else (checker or ExactChecker()).open(test_case)
     
-    result_detail = {
-        'input': input_data, 'expected': expected_output, 
-        'actual': actual_output, 'error': error_msg,
-        'execution_time': exec_time, 'description': description
-    }
+    # 실제 출력은 채점기로 넘기면서 크기/해시/미리보기만 계산합니다.
+    actual_builder = PayloadBuilder()
+    actual_spool = tempfile.TemporaryFile(prefix='actual_') if spill else None
     
-    if not success:
-        print(f"     ❌ 실행 실패: {error_msg.strip()}")
-        result_detail['passed'] = False
-        return result_detail
+    def stdout_sink(chunk):
+        actual_builder.feed(chunk)
+        if actual_spool is not None:
+            actual_spool.write(chunk)
+        if comparator is not None:
+            comparator.feed(chunk)
+    
+    return {
+        'description': description, 'input_data': input_data, 'input': input_payload, 'input_file': input_file,
+        'input_stream': input_stream, 'input_builder': input_builder,
+        'expected': expected_payload, 'comparator': comparator, 'actual_builder': actual_builder,
+        'actual_spool': actual_spool, 'stdout_sink': stdout_sink
+    }
+
+def close_input_stream(prepared):
+    """압축된 입력을 풀어 넣던 스트림을 닫고, 끝까지 푼 입력의 요약을 기록합니다."""
+    input_stream = prepared['input_stream']
+    if input_stream is None:
+        return
+    input_stream.close()
+    prepared['input'] = prepared['input_builder'].build()
+    if input_stream.error is not None:
+        raise RuntimeError(f"입력 압축 해제 실패 ({input_stream.source}): {input_stream.error}")
+
+def finish_single_test(prepared, execution, test_case, test_type, test_index, problem_id, log, spill):
+    """실행 결과를 채점하여 TestRecord 를 만듭니다."""
+    comparator = prepared['comparator']
+    exec_time, metrics = execution.execution_time, execution.metrics
     
-    print(f"     실제: {repr(actual_output)}")
-    print(f"     시간: {exec_time:.3f}초")
+    record = TestRecord(prepared['description'], execution.verdict, error=execution.error, execution_time=exec_time,
+                        metrics=metrics, input=prepared['input'], expected=prepared['expected'],
+                        actual=prepared['actual_builder'].build())
     
-    if compare_outputs(expected_output, actual_output, problem_id):
-        print(f"     ✅ 통과")
-        result_detail['passed'] = True
+    if not execution.success:
+        log(f"     ❌ 실행 실패 [{execution.verdict}]: {execution.error.strip()}")
     else:
-        print(f"     ❌ 실패 - 출력 불일치")
-        result_detail['passed'] = False
-        result_detail['error'] = '출력 불일치'
+        log(f"     실제: {repr(record.actual.preview())}")
+        log(f"     시간: {exec_time:.3f}초{format_metrics(metrics)}")
         
-    return result_detail
+        if comparator is None:
+            log(f"     ✅ 제한 시간/메모리 통과 (예상 출력 없음, 출력은 확인하지 않음)")
+            record.passed = True
+            record.verdict = 'AC'
+            record.output_checked = False
+        elif comparator.finish():
+            log(f"     ✅ 통과")
+            record.passed = True
+            record.verdict = 'AC'
+        else:
+            log(f"     ❌ 실패 - 출력 불일치: {comparator.describe_mismatch()}")
+            record.verdict = 'WA'
+            record.error = '출력 불일치'
+            record.mismatch = comparator.mismatch
+    
+    actual_spool = prepared['actual_spool']
+    if actual_spool is not None:
+        try:
+            if spill and not record.passed:
+                spill_failed_test(record, test_case, actual_spool, problem_id, test_type, test_index)
+        finally:
+            actual_spool.close()
+    return record
+
+def discard_log(line):
+    """반복 측정처럼 로그를 남기지 않는 실행에 사용합니다."""
+
+def combine_repeated_runs(first, reruns, log):
+    """반복 측정한 실행들을 실행 시간이 중앙값인 실행의 결과로 합칩니다."""
+    record = combine_runs([first] + reruns, RUNNER_OPTIONS['unstable_cv'])
+    log(f"     ⏱️ {describe_timing(record.timing)}")
+    if record.verdict != first.verdict:
+        log(f"     ↪️ 중앙값 실행 기준 판정: {first.verdict} → {record.verdict}")
+    return record
 
-def run_test_suite(code_dir, class_name, test_cases, test_type, problem_id=None):
-    """테스트 스위트를 실행합니다."""
+def run_single_test(code_dir, class_name, test_case, test_type, test_index, problem_id=None, log=print,
+                    profile=None, checker=None, oracle=None, spill=True):
+    """단일 테스트케이스를 실행합니다.
+
+    결과에는 입력/출력의 크기, 해시, 앞뒤 미리보기만 남기고, spill 이 켜져 있으면
+    실패한 테스트의 전체 데이터만 결과 디렉토리에 파일로 저장합니다.
+    --repeat 가 2 이상이면 시간 제한 근처에서 끝난 테스트를 여러 번 실행하여 중앙값 실행으로 판정합니다.
+    """
+    if is_stress_test(test_case):
+        return run_stress_test(code_dir, class_name, test_case, test_type, test_index, problem_id, log,
+                               profile, checker, oracle, spill)
+    if profile is None:
+        profile = default_resource_profile()
+    record = execute_single_test(code_dir, class_name, test_case, test_type, test_index, problem_id, log, profile,
+                                 checker, spill)
+    if not needs_repeat(record, profile.timeout_seconds(), RUNNER_OPTIONS['repeat']):
+        return record
+    reruns = [execute_single_test(code_dir, class_name, test_case, test_type, test_index, problem_id, discard_log,
+                                  profile, checker, spill=False)
+              for _ in range(RUNNER_OPTIONS['repeat'] - 1)]
+    return combine_repeated_runs(record, reruns, log)
+
+def execute_single_test(code_dir, class_name, test_case, test_type, test_index, problem_id, log, profile, checker,
+                        spill):
+    """풀이를 한 번 실행하고 채점합니다."""
+    prepared = prepare_single_test(test_case, test_type, test_index, log, checker, spill)
+    try:
+        # ✨ [수정] 코드 디렉토리를 run_java_program에 전달
+        execution = run_java_program(code_dir, class_name, prepared['input_data'], profile.timeout_seconds(),
+                                     profile, stdout_sink=prepared['stdout_sink'], input_file=prepared['input_file'])
+    finally:
+        close_input_stream(prepared)
+    return finish_single_test(prepared, execution, test_case, test_type, test_index, problem_id, log, spill)
+
+async def run_single_test_async(code_dir, class_name, test_case, test_type, test_index, problem_id=None,
+                                log=print, profile=None, checker=None, oracle=None, spill=True):
+    """run_single_test 의 코루틴 버전. 풀이 실행은 이벤트 루프에서, 동기 코드(생성기, 참고 풀이, 채점 프로그램)는
+    기본 스레드 풀에서 처리합니다."""
+    loop = asyncio.get_running_loop()
+    if is_stress_test(test_case):
+        return await loop.run_in_executor(None, partial(
+            run_stress_test, code_dir, class_name, test_case, test_type, test_index, problem_id, log,
+            profile, checker, oracle, spill
+        ))
+    if profile is None:
+        profile = default_resource_profile()
+    record = await execute_single_test_async(code_dir, class_name, test_case, test_type, test_index, problem_id,
+                                             log, profile, checker, spill)
+    if not needs_repeat(record, profile.timeout_seconds(), RUNNER_OPTIONS['repeat']):
+        return record
+    # 반복 측정은 같은 슬롯 안에서 차례로 실행합니다.
+    reruns = [await execute_single_test_async(code_dir, class_name, test_case, test_type, test_index,
+                                              problem_id, discard_log, profile, checker, spill=False)
+              for _ in range(RUNNER_OPTIONS['repeat'] - 1)]
+    return combine_repeated_runs(record, reruns, log)
+
+async def execute_single_test_async(code_dir, class_name, test_case, test_type, test_index, problem_id, log,
+                                    profile, checker, spill):
+    """execute_single_test 의 코루틴 버전"""
+    loop = asyncio.get_running_loop()
+    prepared = prepare_single_test(test_case, test_type, test_index, log, checker, spill)
+    try:
+        execution = await run_java_program_async(code_dir, class_name, prepared['input_data'],
+                                                 profile.timeout_seconds(), profile, prepared['stdout_sink'],
+                                                 prepared['input_file'])
+    finally:
+        # 스트림 스레드가 끝나기를 기다리므로 이벤트 루프를 막지 않도록 스레드 풀에서 닫습니다.
+        await loop.run_in_executor(None, close_input_stream, prepared)
+    return await loop.run_in_executor(None, partial(
+        finish_single_test, prepared, execution, test_case, test_type, test_index, problem_id, log, spill
+    ))
+
+def get_test_executor():
+    """웜 JVM 하네스로 테스트를 실행할 공용 스레드 풀을 반환합니다. (하네스는 실행 스레드마다 하나씩 있습니다)"""
+    global _test_executor
+    with _test_executor_lock:
+        if _test_executor is None:
+            _test_executor = ThreadPoolExecutor(
+                max_workers=RUNNER_OPTIONS['jobs'], thread_name_prefix='judge'
+            )
+        return _test_executor
+
+def shutdown_test_executor():
+    """테스트 실행 스레드 풀을 종료합니다."""
+    global _test_executor
+    with _test_executor_lock:
+        executor, _test_executor = _test_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+async def _run_suite_async(code_dir, class_name, test_cases, test_type, problem_id, profile, checker, oracle, order,
+                           on_finished):
+    """order 의 테스트를 하나의 이벤트 루프에서 동시에 실행하고 {테스트 번호: (결과, 소요 시간, 로그 줄)} 을 반환합니다.
+
+    동시에 실행하는 테스트 수는 세마포어로 제한하고, 대기 중인 테스트는 order 순서대로 빈 슬롯을 얻습니다.
+    (병렬 실행 시 출력 순서를 유지하기 위해 로그는 버퍼에 모아 둡니다)
+    테스트가 끝날 때마다 on_finished(테스트 번호, 결과) 를 호출합니다.
+    """
+    slots = asyncio.Semaphore(RUNNER_OPTIONS['jobs'])
+    logs = {i: [] for i in order}
+
+    async def run_in_slot(i):
+        # 스트레스 테스트의 생성기·참고 풀이 실행까지 슬롯 하나를 차지하도록 테스트 전체를 슬롯 안에서 실행합니다.
+        async with slots:
+            start_time = time.perf_counter()
+            record = await run_single_test_async(code_dir, class_name, test_cases[i], test_type, i, problem_id,
+                                                 logs[i].append, profile, checker, oracle)
+            on_finished(i, record)
+            return record, time.perf_counter() - start_time
+
+    # 세마포어는 먼저 기다린 작업부터 깨우므로 작업을 만든 순서가 실행 순서가 됩니다.
+    tasks = {i: asyncio.ensure_future(run_in_slot(i)) for i in order}
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        # 하나가 실패하면 나머지 테스트를 취소하여 실행 중인 프로세스를 종료합니다.
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return {i: (*tasks[i].result(), logs[i]) for i in order}
+
+def _run_suite_sequential(code_dir, class_name, test_cases, test_type, problem_id, profile, checker, oracle, indices,
+                          on_finished):
+    """indices 의 테스트를 하나씩 실행하며 (테스트 번호, 결과, 소요 시간) 을 차례로 만듭니다."""
+    for i in indices:
+        start_time = time.perf_counter()
+        # ✨ [수정] 코드 디렉토리를 run_single_test에 전달
+        record = run_single_test(code_dir, class_name, test_cases[i], test_type, i, problem_id, profile=profile,
+                                 checker=checker, oracle=oracle)
+        on_finished(i, record)
+        yield i, record, time.perf_counter() - start_time
+
+def _resume_completed_tests(test_cases, test_type, checkpoint):
+    """체크포인트에 기록된 테스트 결과를 {테스트 번호: 결과} 로 반환합니다."""
+    if checkpoint is None:
+        return {}
+    resumed = {}
+    for i, test_case in enumerate(test_cases):
+        record = checkpoint.completed_test(test_type, test_case)
+        if record is not None:
+            resumed[i] = record
+    if resumed:
+        print(f"  ♻️ 이전 실행에서 끝난 테스트 {len(resumed)}개는 기록된 결과를 사용합니다.")
+    return resumed
+
+def run_test_suite(code_dir, class_name, test_cases, test_type, problem_id=None, profile=None, checker=None,
+                   oracle=None, cost_model=None, checkpoint=None):
+    """테스트 스위트를 실행합니다.
+
+    cost_model 이 주어지면 예측 시간이 긴 테스트부터 실행하고, 실제 소요 시간을 기록에 더합니다.
+    checkpoint 가 주어지면 끝난 테스트를 기록하고, 이미 기록된 테스트는 실행하지 않습니다.
+    """
     print(f"\n📋 {test_type} 테스트 실행 ({len(test_cases)}개)")
     results = {'total': len(test_cases), 'passed': 0, 'failed': 0, 'details': []}
     
@@ -135,16 +782,78 @@ def run_test_suite(code_dir, class_name, test_cases, test_type, problem_id=None)
         print(f"  ⚠️ {test_type} 테스트케이스가 없습니다.")
         return results
     
+    resumed = _resume_completed_tests(test_cases, test_type, checkpoint)
+    if resumed:
+        results['resumed'] = len(resumed)
+    pending = [i for i in range(len(test_cases)) if i not in resumed]
+    parallel = RUNNER_OPTIONS['jobs'] > 1 and len(pending) > 1
+    workers = RUNNER_OPTIONS['jobs'] if parallel else 1
+    if cost_model is not None and pending:
+        planned, schedule = cost_model.plan([test_cases[i] for i in pending], workers)
+        order = [pending[j] for j in planned]
+    else:
+        order, schedule = pending, None
+    
+    def on_finished(i, record):
+        # 생성기 오류로 건너뛴 테스트는 다시 실행할 수 있도록 기록하지 않습니다.
+        if checkpoint is not None and not record.get('skipped'):
+            checkpoint.record_test(test_type, test_cases[i], record)
+    
+    start_time = time.perf_counter()
+    outcomes = {i: (record, None) for i, record in resumed.items()}
+    if parallel:
+        # 테스트는 동시에 실행하되, 결과와 로그는 테스트 순서대로 모읍니다.
+        finished = asyncio.run(_run_suite_async(code_dir, class_name, test_cases, test_type, problem_id, profile,
+                                                checker, oracle, order, on_finished))
+        for i in sorted(finished):
+            test_result, seconds, lines = finished[i]
+            for line in lines:
+                print(line)
+            outcomes[i] = (test_result, seconds)
+    else:
+        for i, test_result, seconds in _run_suite_sequential(code_dir, class_name, test_cases, test_type, problem_id,
+                                                             profile, checker, oracle, order, on_finished):
+            outcomes[i] = (test_result, seconds)
+    
     for i, test_case in enumerate(test_cases):
-        # ✨ [수정] 코드 디렉토리를 run_single_test에 전달
-        test_result = run_single_test(code_dir, class_name, test_case, test_type, i, problem_id)
+        test_result, seconds = outcomes[i]
         results['details'].append(test_result)
+        if test_result.get('skipped'):
+            results['skipped'] = results.get('skipped', 0) + 1
+            continue
+        if cost_model is not None and seconds is not None:
+            # --repeat 로 다시 실행한 테스트의 슬롯 시간에는 반복 실행이 모두 들어 있으므로, 한 번 실행한 시간(중앙값)을 기록합니다.
+            timing = test_result.get('timing')
+            cost_model.record(test_case, timing['median'] if timing else seconds)
+        if test_result.get('timing') and test_result['timing']['unstable']:
+            results['unstable'] = results.get('unstable', 0) + 1
         if test_result['passed']:
             results['passed'] += 1
         else:
             results['failed'] += 1
             
-    print(f"📊 {test_type} 테스트 결과: {results['passed']}/{results['total']} 통과")
+    skipped = f" ({results['skipped']}개 건너뜀)" if results.get('skipped') else ""
+    print(f"📊 {test_type} 테스트 결과: {results['passed']}/{results['total']} 통과{skipped}")
+    if results.get('unstable'):
+        print(f"⚠️ 실행 시간 측정이 불안정한 테스트 {results['unstable']}개 "
+              f"(변동 계수 {RUNNER_OPTIONS['unstable_cv']:.0%} 초과)")
+    # 이번에 실행한 테스트의 압축 데이터만 집계합니다. (체크포인트에서 가져온 테스트는 압축을 풀지 않았습니다)
+    compression = take_decompression_stats(
+        [path for i in order for path in (test_cases[i].get('input_file'), test_cases[i].get('output_file')) if path]
+    )
+    if compression is not None:
+        results['compression'] = compression
+        ratio = f"{compression['ratio']:.1f}배" if compression['ratio'] else "알 수 없음"
+        print(f"🗜️ 압축 테스트 데이터 {compression['files']}개: {compression['compressed_bytes']} → "
+              f"{compression['raw_bytes']} bytes (압축률 {ratio}), "
+              f"압축 해제 {compression['decompress_seconds']:.3f}초 ({compression['passes']}회)")
+    if schedule is not None:
+        schedule['actual_makespan'] = time.perf_counter() - start_time
+        results['schedule'] = schedule
+        print(f"🗓️ 예상 소요 시간 {schedule['predicted_makespan']:.2f}초 "
+              f"(입력 순서대로 실행 시 {schedule['naive_predicted_makespan']:.2f}초), "
+              f"실제 {schedule['actual_makespan']:.2f}초 - 기록 기반 {schedule['estimated_from_history']}개, "
+              f"입력 크기 추정 {schedule['estimated_from_size']}개")
     return results
 
 def load_test_cases(file_path):
@@ -224,124 +933,663 @@ def generate_tests_with_gemini(problem_info):
         print(f"⚠️ 문제 {problem_id} 테스트 생성 중 오류: {e}")
         return False, str(e)
 
-def run_single_problem_test(problem_info):
-    """단일 문제에 대한 전체 테스트를 실행합니다."""
+def create_problem_context(problem_info):
+    """문제 하나를 처리하는 동안 단계들이 공유하는 상태를 만듭니다."""
     problem_id = problem_info['problem_id']
     code_file = problem_info['code_file']
-    author = problem_info['author']
-    language = problem_info.get('language', 'java')
+    code_path = Path(code_file)
+    return {
+        'problem_info': problem_info,
+        # 컴파일된 클래스는 소스 옆이 아닌 문제별 빌드 디렉토리에 생성합니다.
+        'code_dir': None,
+        'class_name': code_path.stem,
+        'compile_outcome': None,
+        'checkpoint': _checkpoint.for_problem(problem_info) if _checkpoint is not None else None,
+        'result': {
+            'problem_id': problem_id, 'author': problem_info['author'], 'code_file': code_file,
+            'language': problem_info.get('language', 'java'), 'result': 'FAIL', 'search_success': False,
+            'sample_tests': {'total': 0, 'passed': 0, 'failed': 0},
+            'generated_tests': {'total': 0, 'passed': 0, 'failed': 0},
+            'errors': []
+        }
+    }
+
+def stage_compile(ctx):
+    """[CPU] 코드 파일을 확인하고 컴파일합니다."""
+    result = ctx['result']
+    code_file = ctx['problem_info']['code_file']
+    if not os.path.exists(code_file):
+        result['errors'].append(f"코드 파일 없음: {code_file}")
+        result['result'] = 'ERROR'
+        return False
+
+    if ctx['code_dir'] is None:
+        ctx['code_dir'] = make_scratch_dir(f"build_{result['problem_id']}_")
+    if ctx['compile_outcome'] is None:
+        ctx['compile_outcome'] = compile_java_code(code_file, ctx['code_dir'])
+    compilation_success, compilation_error = ctx['compile_outcome']
+    if not compilation_success:
+        result['errors'].append(f"컴파일 실패: {compilation_error}")
+        result['result'] = 'COMPILATION_ERROR'
+        return False
+    return True
+
+def stage_fetch(ctx):
+    """[I/O] 문제 정보와 샘플 테스트케이스를 가져옵니다."""
+    result = ctx['result']
+    if ctx.get('test_set_resumed'):
+        result['search_success'] = True
+        return True
+    # ✨ [수정] 검색 실패 시 대안 처리 로직 제거, 실패 시 즉시 에러로 반환
+    search_success, search_error = search_problem_with_fetch_boj(result['problem_id'])
+    result['search_success'] = search_success
+    if not search_success:
+        result['errors'].append(f"문제 검색 실패: {search_error}")
+        result['result'] = 'ERROR'
+        return False
+    return True
+
+def stage_generate(ctx):
+    """[I/O] Gemini로 테스트케이스를 생성합니다. 실패해도 샘플 테스트는 가능하므로 계속 진행합니다."""
+    if ctx.get('test_set_resumed'):
+        return True
+    test_gen_success, test_gen_error = generate_tests_with_gemini(ctx['problem_info'])
+    if not test_gen_success:
+        ctx['result']['errors'].append(f"테스트 생성 실패: {test_gen_error}")
+        # 일시적인 실패일 수 있으므로 생성 테스트 없이 얻은 결과는 캐시에 저장하지 않습니다.
+        ctx['cacheable'] = False
+    elif ctx['checkpoint'] is not None:
+        problem_info = ctx['problem_info']
+        ctx['checkpoint'].record_test_set(test_set_digest(problem_info['problem_id'], problem_info['code_file'],
+                                                          read_test_set(problem_info['problem_id'])))
+    return True
+
+def stage_run(ctx):
+    """[CPU] 샘플/생성 테스트를 실행하고 최종 결과를 판정합니다."""
+    result = ctx['result']
+    if ctx.get('pipelined'):
+        print_problem_banner(result)
+    problem_id = result['problem_id']
+    code_dir, class_name = ctx['code_dir'], ctx['class_name']
+
+    sample_tests_path = f'sample_{problem_id}_tests.json'
+    generated_tests_path = f'tests_{problem_id}.json'
     
-    print(f"\n{'='*60}")
-    print(f"🧪 문제 {problem_id} 테스트 시작 (작성자: {author})")
-    print(f"{'='*60}")
+    sample_test_cases = load_test_cases(sample_tests_path)
+    generated_test_cases = load_test_cases(generated_tests_path)
+    # testdata/<문제번호> 의 파일 테스트 데이터는 생성 테스트와 함께 실행합니다.
+    data_test_cases = load_data_tests(problem_id)
+    generated_test_cases = generated_test_cases + data_test_cases
     
-    result = {
-        'problem_id': problem_id, 'author': author, 'code_file': code_file,
-        'language': language, 'result': 'FAIL', 'search_success': False,
-        'sample_tests': {'total': 0, 'passed': 0, 'failed': 0},
-        'generated_tests': {'total': 0, 'passed': 0, 'failed': 0},
-        'errors': []
-    }
+    print(f"📋 로드된 테스트케이스: 샘플 {len(sample_test_cases)}개, 생성 {len(generated_test_cases)}개"
+          + (f" (파일 데이터 {len(data_test_cases)}개 포함)" if data_test_cases else ""))
+    # 테스트 입력을 빌드 디렉토리(tmpfs)의 파일로 옮겨 두고 표준 입력으로 바로 연결합니다.
+    inputs_dir = os.path.join(code_dir, 'inputs')
+    sample_test_cases = stage_test_inputs(sample_test_cases, inputs_dir, 'sample')
+    generated_test_cases = stage_test_inputs(generated_test_cases, inputs_dir, 'generated')
     
+    # ✨ [수정] 테스트 실행 함수에 코드 디렉토리 전달
+    test_result_obj = TestResult()
+    profile = build_resource_profile(problem_id)
+    print(f"🧱 자원 제한: 시간 {profile.timeout_seconds():.2f}초, 메모리 {profile.memory_limit_mb}MB, "
+          f"스택 {profile.stack_mb}MB")
     try:
-        if not os.path.exists(code_file):
-            result['errors'].append(f"코드 파일 없음: {code_file}")
-            result['result'] = 'ERROR'
-            return result
-
-        compilation_success, compilation_error = compile_java_code(code_file)
-        if not compilation_success:
-            result['errors'].append(f"컴파일 실패: {compilation_error}")
-            result['result'] = 'COMPILATION_ERROR'
-            return result
-        
-        # ✨ [수정] Java 클래스 경로와 이름을 올바르게 설정
-        code_path = Path(code_file)
-        code_dir = str(code_path.parent)
-        class_name = code_path.stem
-        
-        try:
-            # ✨ [수정] 검색 실패 시 대안 처리 로직 제거, 실패 시 즉시 에러로 반환
-            search_success, search_error = search_problem_with_fetch_boj(problem_id)
-            result['search_success'] = search_success
-            if not search_success:
-                result['errors'].append(f"문제 검색 실패: {search_error}")
-                result['result'] = 'ERROR'
-                return result
-
-            test_gen_success, test_gen_error = generate_tests_with_gemini(problem_info)
-            if not test_gen_success:
-                result['errors'].append(f"테스트 생성 실패: {test_gen_error}")
-                # 테스트 생성 실패는 치명적이지 않으므로 계속 진행 (샘플 테스트는 가능)
-            
-            sample_tests_path = f'sample_{problem_id}_tests.json'
-            generated_tests_path = f'tests_{problem_id}.json'
-            
-            sample_test_cases = load_test_cases(sample_tests_path)
-            generated_test_cases = load_test_cases(generated_tests_path)
-            
-            print(f"📋 로드된 테스트케이스: 샘플 {len(sample_test_cases)}개, 생성 {len(generated_test_cases)}개")
-            
-            # ✨ [수정] 테스트 실행 함수에 코드 디렉토리 전달
-            test_result_obj = TestResult()
-            test_result_obj.sample_tests = run_test_suite(code_dir, class_name, sample_test_cases, "샘플", problem_id)
-            test_result_obj.generated_tests = run_test_suite(code_dir, class_name, generated_test_cases, "생성", problem_id)
-            
-            s_total, s_passed = test_result_obj.sample_tests['total'], test_result_obj.sample_tests['passed']
-            g_total, g_passed = test_result_obj.generated_tests['total'], test_result_obj.generated_tests['passed']
-
-            print(f"📊 테스트 상세: 샘플 {s_passed}/{s_total} 통과, 생성 {g_passed}/{g_total} 통과")
-
-            if s_total == 0 and g_total == 0:
-                result['result'] = "PARTIAL_PASS" # 컴파일만 성공
-                result['errors'].append("테스트케이스 없음 - 컴파일만 확인됨")
-            elif s_total > 0 and s_passed == s_total:
-                result['result'] = "PASS"
-            elif s_passed > 0 or g_passed > 0:
-                result['result'] = "PARTIAL_PASS"
-            else:
-                result['result'] = "FAIL"
-            
-            result['sample_tests'] = test_result_obj.sample_tests
-            result['generated_tests'] = test_result_obj.generated_tests
-            
-            print(f"📊 문제 {problem_id} 최종 결과: {result['result']}")
-            
-        finally:
-            class_file = Path(code_file).with_suffix('.class')
-            if class_file.exists():
-                class_file.unlink()
-                print(f"🧹 정리 완료: {class_file}")
+        checker = build_checker(problem_id, code_dir)
+    except (RuntimeError, OSError, ValueError, KeyError) as e:
+        print(f"⚠️ 채점기 준비 실패, 줄 단위 비교로 채점합니다: {e}")
+        result['errors'].append(f"채점기 준비 실패: {e}")
+        checker = ExactChecker()
+    result['checker'] = checker.name
+    print(f"🔍 채점 방식: {checker.describe()}")
+    oracle = None
+    if any(is_stress_test(test_case) for test_case in sample_test_cases + generated_test_cases):
+        oracle = build_reference_oracle(problem_id, ctx['problem_info']['code_file'], code_dir, profile)
+        print(f"🏋️ 스트레스 테스트 예상 출력: {oracle.describe()}")
+    cost_model = TestCostModel(RUNNER_OPTIONS['history_dir'], problem_id, normalization_factor())
+    test_result_obj.sample_tests = run_test_suite(code_dir, class_name, sample_test_cases, "샘플", problem_id, profile,
+                                                  checker, oracle, cost_model, ctx['checkpoint'])
+    test_result_obj.generated_tests = run_test_suite(code_dir, class_name, generated_test_cases, "생성", problem_id,
+                                                     profile, checker, oracle, cost_model, ctx['checkpoint'])
+    cost_model.save()
     
+    s_total, s_passed = test_result_obj.sample_tests['total'], test_result_obj.sample_tests['passed']
+    g_total, g_passed = test_result_obj.generated_tests['total'], test_result_obj.generated_tests['passed']
+
+    print(f"📊 테스트 상세: 샘플 {s_passed}/{s_total} 통과, 생성 {g_passed}/{g_total} 통과")
+
+    if s_total == 0 and g_total == 0:
+        result['result'] = "PARTIAL_PASS" # 컴파일만 성공
+        result['errors'].append("테스트케이스 없음 - 컴파일만 확인됨")
+    elif s_total > 0 and s_passed == s_total:
+        result['result'] = "PASS"
+    elif s_passed > 0 or g_passed > 0:
+        result['result'] = "PARTIAL_PASS"
+    else:
+        result['result'] = "FAIL"
+    
+    result['sample_tests'] = test_result_obj.sample_tests
+    result['generated_tests'] = test_result_obj.generated_tests
+    if RUNNER_OPTIONS['minimize_budget'] > 0:
+        minimized = minimize_failure(ctx, profile, checker, oracle, [
+            (generated_test_cases, test_result_obj.generated_tests['details']),
+            (sample_test_cases, test_result_obj.sample_tests['details']),
+        ])
+        if minimized:
+            result['minimized_case'] = minimized
+    result['performance'] = summarize_performance(
+        test_result_obj.sample_tests['details'] + test_result_obj.generated_tests['details']
+    )
+    peak = result['performance']['peak_rss_kb']['max']
+    if result['performance']['wall_time']['max'] is not None:
+        normalized = result['performance']['normalized']
+        print(f"⏱️ 최대 실행 시간 {result['performance']['wall_time']['max']:.3f}초"
+              + (f" (기준 머신 환산 {normalized['wall_time']['max']:.3f}초)" if normalized else "")
+              + (f", 최대 메모리 {peak / 1024:.1f}MB" if peak is not None else ""))
+    
+    print(f"📊 문제 {problem_id} 최종 결과: {result['result']}")
+    store_cached_result(ctx)
+    return True
+
+def restore_checkpoint_result(ctx):
+    """체크포인트에 끝난 결과가 있으면 ctx 의 결과로 사용하고 True 를 반환합니다.
+
+    결과는 없지만 검색/생성을 마친 테스트 세트가 그대로 남아 있으면 검색/생성 단계를 건너뛰도록 표시합니다.
+    """
+    checkpoint = ctx['checkpoint']
+    if checkpoint is None:
+        return False
+    problem_info = ctx['problem_info']
+    completed = checkpoint.completed_result()
+    if completed is not None:
+        ctx['result'] = {**completed, 'resumed': True}
+        print(f"♻️ 문제 {problem_info['problem_id']} ({problem_info['author']}): 이전 실행에서 완료됨 - "
+              f"{completed['result']}")
+        return True
+    problem_id = problem_info['problem_id']
+    test_set = read_test_set(problem_id)
+    if any(content is not None for content in test_set.values()) and checkpoint.test_set_ready(
+            test_set_digest(problem_id, problem_info['code_file'], test_set)):
+        ctx['test_set_resumed'] = True
+        print(f"♻️ 문제 {problem_id}: 이전 실행에서 만든 테스트 세트를 사용합니다 (검색/생성 생략)")
+    return False
+
+def checkpoint_problem(ctx):
+    """끝난 문제 결과를 체크포인트에 기록합니다. (생성 실패 등 다시 시도할 만한 결과는 기록하지 않습니다)"""
+    result = ctx['result']
+    if ctx['checkpoint'] is not None and ctx.get('cacheable', True) and not result.get('resumed'):
+        ctx['checkpoint'].record_result(result)
+    return True
+
+def restore_cached_result(ctx):
+    """소스, 테스트 세트, 러너가 모두 같은 이전 결과가 있으면 ctx 의 결과로 사용하고 True 를 반환합니다."""
+    cache = get_verdict_cache()
+    problem_info = ctx['problem_info']
+    if cache is None or not os.path.exists(problem_info['code_file']):
+        return False
+    try:
+        cached = cache.lookup(problem_info['problem_id'], problem_info['code_file'])
     except Exception as e:
+        print(f"⚠️ 문제 {problem_info['problem_id']} 결과 캐시 조회 실패: {e}")
+        return False
+    if cached is None:
+        return False
+    # 같은 소스를 다른 참가자가 제출했을 수 있으므로 제출 정보는 현재 값을 사용합니다.
+    ctx['result'] = {**cached, 'problem_id': problem_info['problem_id'], 'author': problem_info['author'],
+                     'code_file': problem_info['code_file'], 'cached': True}
+    print(f"🗃️ 문제 {problem_info['problem_id']} ({problem_info['author']}): 변경 없음, "
+          f"캐시된 결과 사용 - {cached['result']}")
+    return True
+
+def store_cached_result(ctx):
+    """채점 결과와 사용한 테스트 세트를 결과 캐시에 저장합니다."""
+    cache = get_verdict_cache()
+    if cache is None or not ctx.get('cacheable', True):
+        return
+    problem_info = ctx['problem_info']
+    try:
+        cache.store(problem_info['problem_id'], problem_info['code_file'], ctx['result'])
+    except Exception as e:
+        print(f"⚠️ 문제 {problem_info['problem_id']} 결과 캐시 저장 실패: {e}")
+
+def reproduce_failure(repro_ctx, input_bytes):
+    """input_bytes 로 제출 코드를 실행하여 (원래 실패와 같은 판정인지, 결과, 예상 출력) 을 반환합니다.
+
+    참고 풀이가 있으면 참고 풀이의 출력과 비교하고, 참고 풀이가 처리하지 못하는 입력은 유효하지 않은 입력으로 봅니다.
+    """
+    case_dir = tempfile.mkdtemp(prefix='minimize_', dir=repro_ctx['work_dir'])
+    try:
+        input_path = os.path.join(case_dir, 'input.txt')
+        with open(input_path, 'wb') as f:
+            f.write(input_bytes)
+        test_case = {'input_file': input_path, 'description': '최소화 후보'}
+        expected_text = None
+        oracle = repro_ctx['oracle']
+        if oracle is not None and oracle.solutions:
+            expected_path, _ = oracle.expected_output(input_path)
+            if expected_path is None:
+                return False, None, None
+            test_case['output_file'] = expected_path
+            with open(expected_path, 'rb') as f:
+                expected_text = f.read().decode('utf-8', errors='replace')
+        else:
+            test_case['no_expected'] = True
+        detail = run_single_test(repro_ctx['code_dir'], repro_ctx['class_name'], test_case, '최소화', 0,
+                                 repro_ctx['problem_id'], log=lambda line: None, profile=repro_ctx['profile'],
+                                 checker=repro_ctx['checker'], spill=False)
+        return detail['verdict'] == repro_ctx['verdict'], detail, expected_text
+    finally:
+        shutil.rmtree(case_dir, ignore_errors=True)
+
+def minimize_failure(ctx, profile, checker, oracle, suites):
+    """처음 실패한 생성/스트레스 테스트의 입력을 최소화하여 작은 재현 입력을 만듭니다. 없으면 None 을 반환합니다.
+
+    시간 초과는 입력을 줄이면 재현되지 않으므로 최소화하지 않습니다.
+    """
+    problem_id = ctx['result']['problem_id']
+    for test_cases, details in suites:
+        for test_case, detail in zip(test_cases, details):
+            if detail['passed'] or detail.get('skipped') or detail['verdict'] not in MINIMIZABLE_VERDICTS:
+                continue
+            if test_case.get('type') == DATA_TEST_TYPE:
+                # 파일 테스트 데이터는 대부분 매우 커서 메모리에 올려 최소화하지 않습니다.
+                continue
+            if detail['verdict'] == 'WA' and oracle is None:
+                oracle = build_reference_oracle(problem_id, ctx['problem_info']['code_file'], ctx['code_dir'], profile)
+            if detail['verdict'] == 'WA' and not oracle.solutions:
+                # 오답은 최소화할 수 없지만, 뒤에 있는 런타임 에러/메모리 초과 실패는 최소화할 수 있습니다.
+                print(f"⚠️ 참고 풀이가 없어 '{detail['description']}' 오답 입력을 최소화할 수 없습니다.")
+                continue
+            work_dir = make_scratch_dir(f'minimize_{problem_id}_')
+            try:
+                if is_stress_test(test_case):
+                    with open(run_generator(test_case.get('generator', ''), test_case.get('seed', 0), work_dir,
+                                            profile=profile), 'rb') as f:
+                        input_bytes = f.read()
+                else:
+                    input_bytes = test_case.get('input', '').encode('utf-8')
+                repro_ctx = {
+                    'problem_id': problem_id, 'code_dir': ctx['code_dir'], 'class_name': ctx['class_name'],
+                    'profile': profile, 'checker': checker, 'oracle': oracle, 'verdict': detail['verdict'],
+                    'work_dir': work_dir
+                }
+                if not reproduce_failure(repro_ctx, input_bytes)[0]:
+                    print(f"⚠️ '{detail['description']}' 실패가 재현되지 않아 최소화하지 않습니다.")
+                    continue
+                print(f"✂️ '{detail['description']}' 입력 최소화 중 ({len(input_bytes)} bytes)...")
+                minimized, tests = minimize_input(input_bytes, lambda data: reproduce_failure(repro_ctx, data)[0],
+                                                  RUNNER_OPTIONS['jobs'], RUNNER_OPTIONS['minimize_budget'])
+                _, repro, expected_text = reproduce_failure(repro_ctx, minimized)
+            except (RuntimeError, OSError) as e:
+                print(f"⚠️ 입력 최소화 실패: {e}")
+                return None
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            print(f"✂️ 최소화 완료: {len(input_bytes)} → {len(minimized)} bytes (후보 {tests}개 검사)")
+            return {
+                'description': detail['description'], 'verdict': detail['verdict'],
+                'original_bytes': len(input_bytes), 'input_bytes': len(minimized),
+                'input': minimized.decode('utf-8', errors='replace'), 'expected': expected_text,
+                'actual': repro.actual.preview() if repro else None, 'error': repro.error if repro else None,
+                'candidates_tested': tests
+            }
+    return None
+
+def cleanup_problem(ctx):
+    """컴파일 산출물을 정리합니다."""
+    build_dir = ctx['code_dir']
+    if build_dir is None:
+        return
+    ctx['code_dir'] = None
+    shutil.rmtree(build_dir, ignore_errors=True)
+    print(f"🧹 정리 완료: {build_dir}")
+
+def precompile_problems(contexts):
+    """존재하는 코드 파일을 한 번에 컴파일하고 결과를 각 문제의 컨텍스트에 저장합니다."""
+    batch = []
+    for ctx in contexts:
+        code_file = ctx['problem_info']['code_file']
+        if not os.path.exists(code_file):
+            continue
+        ctx['code_dir'] = make_scratch_dir(f"build_{ctx['result']['problem_id']}_")
+        batch.append(ctx)
+    try:
+        outcomes = compile_java_batch([(ctx['problem_info']['code_file'], ctx['code_dir']) for ctx in batch])
+    except Exception as e:
+        # 일괄 컴파일이 실패해도 문제별 컴파일 단계에서 다시 시도합니다.
+        print(f"⚠️ 일괄 컴파일 실패, 문제별로 컴파일합니다: {e}")
+        return True
+    for ctx, outcome in zip(batch, outcomes):
+        ctx['compile_outcome'] = outcome
+    return True
+
+def guarded_stage(stage, ctx):
+    """단계 실행 중 예외가 발생하면 문제 결과를 ERROR 로 기록하고 False 를 반환합니다."""
+    try:
+        return stage(ctx)
+    except Exception as e:
+        result = ctx['result']
         result['errors'].append(f"실행 중 치명적 오류: {str(e)}")
         result['result'] = 'ERROR'
         import traceback
-        print(f"❌ 문제 {problem_id} 처리 중 치명적 오류: {e}\n{traceback.format_exc()}")
+        print(f"❌ 문제 {result['problem_id']} 처리 중 치명적 오류: {e}\n{traceback.format_exc()}")
+        return False
+
+def print_problem_banner(result):
+    """문제 처리 시작 구분선을 출력합니다."""
+    print(f"\n{'='*60}")
+    print(f"🧪 문제 {result['problem_id']} 테스트 시작 (작성자: {result['author']})")
+    print(f"{'='*60}")
+
+def run_single_problem_test(problem_info):
+    """단일 문제에 대한 전체 테스트를 실행합니다."""
+    ctx = create_problem_context(problem_info)
+    result = ctx['result']
+    
+    print_problem_banner(result)
+    if restore_checkpoint_result(ctx) or restore_cached_result(ctx):
+        return ctx['result']
+    
+    try:
+        for stage in (stage_compile, stage_fetch, stage_generate, stage_run):
+            if not guarded_stage(stage, ctx):
+                break
+        checkpoint_problem(ctx)
+    finally:
+        cleanup_problem(ctx)
         
     return result
 
+def run_problems_pipeline(problems, io_workers=4, cpu_workers=1):
+    """모든 문제의 컴파일/검색/생성/실행 단계를 의존 그래프로 묶어 겹쳐서 실행합니다.
+
+    한 문제의 테스트가 실행되는 동안 다른 문제의 검색·생성 요청이 진행되므로,
+    전체 소요 시간이 문제별 소요 시간의 합이 아니라 가장 긴 문제 하나에 가까워집니다.
+    """
+    from pipeline_scheduler import PipelineScheduler, IO, CPU
+
+    scheduler = PipelineScheduler(io_workers=io_workers, cpu_workers=cpu_workers)
+    contexts = []
+    for problem in problems:
+        ctx = create_problem_context(problem)
+        ctx['pipelined'] = True
+        contexts.append(ctx)
+    # 이전 실행에서 끝났거나 캐시된 결과가 있는 문제는 아무 단계도 실행하지 않습니다.
+    pending = [ctx for ctx in contexts if not (restore_checkpoint_result(ctx) or restore_cached_result(ctx))]
+
+    # 모든 문제를 하나의 컴파일러 프로세스에서 한 번에 컴파일한 뒤, 문제별 단계는 그 결과만 확인합니다.
+    batch_compile_task = scheduler.add_task('compile-batch', partial(precompile_problems, pending), kind=CPU)
+    last_run_by_problem = {}
+    for i, ctx in enumerate(pending):
+        problem_id = ctx['result']['problem_id']
+        # 같은 문제 번호는 문제 정보/테스트 파일 이름을 공유하므로 앞선 문제가 끝난 뒤 처리합니다.
+        after = [last_run_by_problem[problem_id]] if problem_id in last_run_by_problem else []
+
+        compile_task = scheduler.add_task(f'{i}:compile', partial(guarded_stage, stage_compile, ctx),
+                                          deps=[batch_compile_task], kind=CPU)
+        fetch_task = scheduler.add_task(f'{i}:fetch', partial(guarded_stage, stage_fetch, ctx),
+                                        after=after, kind=IO)
+        generate_task = scheduler.add_task(f'{i}:generate', partial(guarded_stage, stage_generate, ctx),
+                                           deps=[compile_task, fetch_task], kind=IO)
+        last_run_by_problem[problem_id] = scheduler.add_task(
+            f'{i}:run', partial(guarded_stage, stage_run, ctx), deps=[generate_task], kind=CPU
+        )
+        # 앞 단계가 실패해도 문제 처리가 끝나면 결과를 체크포인트에 기록합니다.
+        scheduler.add_task(f'{i}:checkpoint', partial(checkpoint_problem, ctx),
+                           after=[last_run_by_problem[problem_id]], kind=IO)
+
+    start_time = time.time()
+    try:
+        scheduler.run()
+    finally:
+        for ctx in pending:
+            cleanup_problem(ctx)
+    print(f"\n⏱️ 파이프라인 전체 소요 시간: {time.time() - start_time:.1f}초")
+    return [ctx['result'] for ctx in contexts]
+
+def run_fuzz_case(fuzz_ctx, seed):
+    """시드 하나로 작은 입력을 만들어 제출 코드와 참고 풀이를 비교합니다. 불일치하면 반례 정보를 반환합니다."""
+    case_dir = tempfile.mkdtemp(prefix=f'fuzz_{seed}_', dir=fuzz_ctx['work_dir'])
+    try:
+        try:
+            input_path = run_generator(fuzz_ctx['generator'], seed, case_dir, profile=fuzz_ctx['profile'])
+        except (RuntimeError, OSError) as e:
+            fuzz_ctx['generator_errors'].append(str(e))
+            return None
+        expected_path, _ = fuzz_ctx['oracle'].expected_output(input_path)
+        if expected_path is None:
+            # 참고 풀이도 처리하지 못하는 입력은 비교 대상에서 제외합니다.
+            return None
+        test_case = {'input_file': input_path, 'output_file': expected_path, 'description': f'퍼징 시드 {seed}'}
+        detail = run_single_test(fuzz_ctx['code_dir'], fuzz_ctx['class_name'], test_case, '퍼징', seed - 1,
+                                 fuzz_ctx['problem_id'], log=lambda line: None, profile=fuzz_ctx['profile'],
+                                 checker=fuzz_ctx['checker'], spill=False)
+        if detail['passed']:
+            return None
+        with open(input_path, 'rb') as f:
+            input_bytes = f.read()
+        with open(expected_path, 'rb') as f:
+            expected_bytes = f.read()
+        description = f"퍼징 반례 (시드 {seed}, {detail['verdict']})"
+        if len(input_bytes) + len(expected_bytes) <= MAX_LITERAL_COUNTEREXAMPLE_BYTES:
+            saved = {'input': input_bytes.decode('utf-8', errors='replace'),
+                     'output': expected_bytes.decode('utf-8', errors='replace'), 'description': description}
+        else:
+            saved = {'type': STRESS_TEST_TYPE, 'generator': fuzz_ctx['generator'], 'seed': seed,
+                     'description': description}
+        return {'verdict': detail['verdict'], 'error': detail['error'], 'mismatch': detail.get('mismatch'),
+                'test_case': saved}
+    finally:
+        shutil.rmtree(case_dir, ignore_errors=True)
+
+def fuzz_single_problem(problem_info, budget_seconds, start_seed=1):
+    """한 문제의 제출 코드를 참고 풀이와 비교하며 시간 예산 동안 반례를 찾습니다."""
+    problem_id = problem_info['problem_id']
+    code_file = problem_info['code_file']
+    outcome = {'problem_id': problem_id, 'author': problem_info['author'], 'code_file': code_file,
+               'cases': 0, 'counterexample': None, 'errors': []}
+    print(f"\n{'='*60}")
+    print(f"🎲 문제 {problem_id} 퍼징 시작 (작성자: {problem_info['author']}, 예산 {budget_seconds}초)")
+    print(f"{'='*60}")
+
+    generator = find_fuzz_generator(problem_id)
+    if generator is None:
+        outcome['errors'].append(f"퍼징 생성기 없음 ({REFERENCE_DIR}/{problem_id}/{FUZZ_GENERATOR_NAME})")
+        print(f"⚠️ {outcome['errors'][-1]}")
+        return outcome
+
+    build_dir = make_scratch_dir(f"fuzz_build_{problem_id}_")
+    try:
+        success, error_msg = compile_java_code(code_file, build_dir)
+        if not success:
+            outcome['errors'].append(f"컴파일 실패: {error_msg}")
+            return outcome
+        profile = build_resource_profile(problem_id)
+        oracle = build_reference_oracle(problem_id, code_file, build_dir, profile)
+        if not oracle.solutions:
+            outcome['errors'].append("비교할 참고 풀이 없음")
+            print(f"⚠️ 비교할 참고 풀이가 없습니다.")
+            return outcome
+        print(f"🔍 비교 대상: {oracle.describe()}")
+        fuzz_ctx = {
+            'problem_id': problem_id, 'code_dir': build_dir, 'class_name': Path(code_file).stem,
+            'profile': profile, 'checker': build_checker(problem_id, build_dir), 'oracle': oracle,
+            'generator': generator, 'work_dir': build_dir, 'generator_errors': []
+        }
+        report = fuzz(partial(run_fuzz_case, fuzz_ctx), budget_seconds, RUNNER_OPTIONS['jobs'], start_seed)
+        outcome['cases'] = report['cases']
+        if fuzz_ctx['generator_errors']:
+            outcome['errors'].append(f"생성기 실행 실패 {len(fuzz_ctx['generator_errors'])}회: "
+                                     f"{fuzz_ctx['generator_errors'][0]}")
+        print(f"📊 {report['cases']}개 입력 비교 ({report['elapsed']:.1f}초)")
+        if report['failure'] is not None:
+            failure = report['failure']
+            outcome['counterexample'] = {'seed': report['seed'], **failure}
+            append_generated_test(f'tests_{problem_id}.json', problem_id, failure['test_case'])
+            print(f"❌ 반례 발견 (시드 {report['seed']}, {failure['verdict']}): {failure['error']}")
+            print(f"💾 반례를 tests_{problem_id}.json 에 저장했습니다.")
+        else:
+            print("✅ 시간 예산 안에 반례를 찾지 못했습니다.")
+    except Exception as e:
+        outcome['errors'].append(f"퍼징 중 오류: {e}")
+        print(f"❌ 문제 {problem_id} 퍼징 중 오류: {e}")
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return outcome
+
+def run_fuzz_mode(problems, budget_seconds, start_seed=1):
+    """모든 문제를 퍼징하고 결과를 fuzz_results.json 에 저장합니다. 반례가 하나라도 있으면 False 를 반환합니다."""
+    outcomes = [fuzz_single_problem(problem, budget_seconds, start_seed) for problem in problems]
+    with open('fuzz_results.json', 'w', encoding='utf-8') as f:
+        json.dump({'problems': outcomes}, f, ensure_ascii=False, indent=2)
+    found = [o for o in outcomes if o['counterexample']]
+    print(f"\n🎲 퍼징 완료: {len(outcomes)}개 문제 중 {len(found)}개에서 반례 발견")
+    return not found
+
 # generate_summary와 main 함수는 기존 코드와 동일하게 사용합니다.
-def generate_summary(results):
+def generate_summary(results, class_cache_stats=None, verdict_cache_stats=None, calibration=None):
     """테스트 결과 요약을 생성합니다."""
     total = len(results)
     passed = len([r for r in results if r['result'] == 'PASS'])
     partial = len([r for r in results if r['result'] == 'PARTIAL_PASS'])
     failed = len([r for r in results if r['result'] in ['FAIL', 'COMPILATION_ERROR']])
     error = len([r for r in results if r['result'] == 'ERROR'])
+    cached = len([r for r in results if r.get('cached')])
+    resumed = len([r for r in results if r.get('resumed')])
     
     overall_success = (passed + partial) > 0
     
     return {
         'overall_success': overall_success, 'total_problems': total,
         'passed_problems': passed, 'partial_passed_problems': partial,
-        'failed_problems': failed, 'error_problems': error,
+        'failed_problems': failed, 'error_problems': error, 'cached_problems': cached,
+        'resumed_problems': resumed,
+        'class_cache': class_cache_stats or {'hits': 0, 'misses': 0},
+        'verdict_cache': verdict_cache_stats or {'hits': 0, 'misses': 0},
+        'calibration': calibration,
         'details': results
     }
 
+def calibrate_machine_speed(cache_dir, resume=False):
+    """기준 작업으로 이 머신의 속도를 재서 시간 제한 보정 계수와 환산 계수를 설정합니다.
+
+    --resume 이면 처음 실행과 시간 제한(과 러너 버전)이 같도록 마지막 측정을 다시 사용합니다.
+    """
+    from class_cache import DEFAULT_CACHE_DIR
+    try:
+        baseline = load_reference_baseline()
+        if baseline is None:
+            print(f"⚠️ 기준 머신에서 잰 속도 기준 값({REFERENCE_BASELINE_FILE.name})이 없어 시간 제한을 보정하지 않고, "
+                  f"실행 시간은 환산하지 않은 값으로 기록합니다.")
+            return
+        print("📏 기준 작업으로 머신 속도 측정 중...")
+        calibration = SpeedCalibrator(cache_dir or DEFAULT_CACHE_DIR, baseline).calibrate(reuse_last=resume)
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        print(f"⚠️ 머신 속도 측정 실패, 보정 없이 실행합니다: {e}")
+        return
+    RUNNER_OPTIONS['calibration'] = calibration
+    RUNNER_OPTIONS['speed_factor'] = calibration['limit_factor']
+    print(f"📏 속도 보정 계수 {calibration['factor']:.3f} (JVM 시작 {calibration['jvm_startup']:.3f}초, "
+          f"CPU 작업 {calibration['kernel']:.3f}초, 기준 머신 대비 {calibration['jvm_startup_ratio']:.2f}배/"
+          f"{calibration['kernel_ratio']:.2f}배{', 이전 측정 사용' if calibration.get('reused') else ''}) "
+          f"→ 시간 제한 ×{calibration['limit_factor']:g}")
+    print(f"📏 기준 머신: {calibration['baseline'].get('origin')}")
+    if calibration.get('baseline_jdk_mismatch'):
+        print(f"⚠️ 기준 값을 잰 JDK({calibration['baseline'].get('java_version')})와 실행 JDK 가 달라, "
+              f"환산한 시간에 JDK 차이가 섞입니다.")
+
+def parse_args(argv=None):
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description='다중 문제 테스트 실행')
+    parser.add_argument('--warm-jvm', action='store_true',
+                        help='테스트마다 JVM을 새로 띄우지 않고 하나의 JVM에서 모든 테스트를 실행 '
+                             '(빠르지만 실행 시간에 JVM 시작이 빠지고 최대 메모리에 하네스 JVM 사용량이 섞이므로, '
+                             '채점 서버와 같은 시간/메모리 판정이 필요하면 사용하지 마세요)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='동시에 실행할 테스트케이스 수 (기본값: CPU 코어 수)')
+    parser.add_argument('--io-concurrency', type=int, default=4,
+                        help='동시에 진행할 문제 검색/테스트 생성 요청 수')
+    parser.add_argument('--cpu-concurrency', type=int, default=1,
+                        help='동시에 진행할 컴파일/테스트 실행 단계 수')
+    parser.add_argument('--sequential', action='store_true',
+                        help='파이프라인을 사용하지 않고 문제를 하나씩 순서대로 처리')
+    parser.add_argument('--cache-dir', default=None,
+                        help='컴파일된 클래스 캐시 디렉토리 (기본값: $JUDGE_CACHE_DIR 또는 ~/.cache/boj-judge)')
+    parser.add_argument('--no-class-cache', action='store_true',
+                        help='컴파일된 클래스 캐시를 사용하지 않음')
+    parser.add_argument('--jvm-flags', choices=sorted(JVM_FLAG_PROFILES), default=JVM_FLAGS_DEFAULT,
+                        help='JVM 옵션 프로필 (startup: C1 컴파일러만 사용하여 짧은 테스트의 시작 시간 단축)')
+    parser.add_argument('--no-cds', action='store_true',
+                        help='자주 쓰는 JDK 클래스를 담은 CDS 아카이브를 만들거나 사용하지 않음')
+    parser.add_argument('--no-verdict-cache', action='store_true',
+                        help='소스와 테스트가 바뀌지 않은 문제도 캐시된 결과 없이 다시 채점')
+    parser.add_argument('--no-test-history', action='store_true',
+                        help='테스트 소요 시간 기록을 사용하지 않음 (기록이 없으면 입력 크기로 예측하여 긴 테스트부터 실행)')
+    parser.add_argument('--checkpoint', default=DEFAULT_JOURNAL_PATH,
+                        help='끝난 문제와 테스트 결과를 기록하는 체크포인트 저널 파일 (JSONL)')
+    parser.add_argument('--resume', action='store_true',
+                        help='체크포인트 저널에 기록된 문제와 테스트는 다시 실행하지 않고 기록된 결과를 사용')
+    parser.add_argument('--no-address-space-cap', action='store_true',
+                        help='풀이 프로세스에 주소 공간 상한을 걸지 않음 (-Xmx 제한만 적용)')
+    parser.add_argument('--speed-factor', type=float, default=None,
+                        help='이 머신의 속도 보정 계수 (시간 제한에 곱함, 느린 머신은 1보다 크게). '
+                             '주면 기준 작업으로 속도를 재지 않습니다.')
+    parser.add_argument('--no-calibration', action='store_true',
+                        help='시작할 때 기준 작업(JVM 시작 + CPU 작업)으로 머신 속도를 재지 않음 (보정 계수 1)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='시간 제한 근처에서 끝나거나 시간 초과된 테스트를 반복 실행할 횟수 '
+                             '(최소/중앙값/편차를 기록하고 중앙값 실행으로 판정, 홀수 권장)')
+    parser.add_argument('--unstable-cv', type=float, default=DEFAULT_UNSTABLE_CV,
+                        help='반복 측정의 변동 계수(표준편차/평균)가 이 값을 넘으면 불안정한 측정으로 표시')
+    parser.add_argument('--output-limit-mb', type=float, default=DEFAULT_OUTPUT_LIMIT_MB,
+                        help='풀이의 표준 출력/표준 오류 최대 크기 (MB, 넘으면 바로 종료하고 출력 초과로 판정)')
+    parser.add_argument('--artifact-dir', default=DEFAULT_ARTIFACT_DIR,
+                        help='실패한 테스트의 입력/예상 출력/실제 출력 전체를 저장할 디렉토리')
+    parser.add_argument('--minimize-budget', type=float, default=DEFAULT_MINIMIZE_BUDGET_SECONDS,
+                        help='실패한 테스트 입력을 최소화하는 데 쓸 문제별 시간 예산 (초, 0이면 최소화하지 않음)')
+    parser.add_argument('--fuzz', action='store_true',
+                        help=f'테스트 대신 {REFERENCE_DIR}/<문제번호>/{FUZZ_GENERATOR_NAME} 로 작은 입력을 만들어 '
+                             '참고 풀이와 비교하는 퍼징 실행')
+    parser.add_argument('--fuzz-budget', type=float, default=DEFAULT_FUZZ_BUDGET_SECONDS,
+                        help='문제별 퍼징 시간 예산 (초)')
+    parser.add_argument('--fuzz-seed', type=int, default=1,
+                        help='퍼징 시작 시드')
+    return parser.parse_args(argv)
+
 def main():
     """메인 실행 함수"""
+    global _checkpoint
+    args = parse_args()
+    install_cleanup_handlers(_scratch)
+    RUNNER_OPTIONS['warm_jvm'] = args.warm_jvm
+    RUNNER_OPTIONS['jobs'] = max(1, args.jobs)
+    RUNNER_OPTIONS['cap_address_space'] = not args.no_address_space_cap
+    RUNNER_OPTIONS['speed_factor'] = args.speed_factor if args.speed_factor and args.speed_factor > 0 else 1.0
+    RUNNER_OPTIONS['repeat'] = max(1, args.repeat)
+    RUNNER_OPTIONS['unstable_cv'] = max(0.0, args.unstable_cv)
+    RUNNER_OPTIONS['output_limit_mb'] = args.output_limit_mb if args.output_limit_mb > 0 else DEFAULT_OUTPUT_LIMIT_MB
+    RUNNER_OPTIONS['minimize_budget'] = max(0.0, args.minimize_budget)
+    RUNNER_OPTIONS['artifact_dir'] = args.artifact_dir
+    RUNNER_OPTIONS['max_tasks'] = default_max_tasks(RUNNER_OPTIONS['jobs'] * args.cpu_concurrency)
+    if RUNNER_OPTIONS['max_tasks'] is None and hasattr(os, 'geteuid') and os.geteuid() == 0:
+        print("ℹ️ root 로 실행 중이므로 스레드/프로세스 수 상한(RLIMIT_NPROC)은 적용되지 않습니다.")
+    if not args.no_class_cache:
+        from class_cache import DEFAULT_CACHE_DIR
+        RUNNER_OPTIONS['class_cache_dir'] = args.cache_dir or DEFAULT_CACHE_DIR
+    if not args.no_verdict_cache:
+        from class_cache import DEFAULT_CACHE_DIR
+        RUNNER_OPTIONS['verdict_cache_dir'] = args.cache_dir or DEFAULT_CACHE_DIR
+    if not args.no_cds:
+        from class_cache import DEFAULT_CACHE_DIR
+        RUNNER_OPTIONS['cds_cache_dir'] = args.cache_dir or DEFAULT_CACHE_DIR
+    RUNNER_OPTIONS['jvm_flags'] = args.jvm_flags
+    if not args.no_test_history:
+        from class_cache import DEFAULT_CACHE_DIR
+        RUNNER_OPTIONS['history_dir'] = args.cache_dir or DEFAULT_CACHE_DIR
+
     print("🚀 다중 문제 테스트 시작...")
+    if RUNNER_OPTIONS['warm_jvm']:
+        print("🔥 웜 JVM 모드: 문제별로 하나의 JVM에서 테스트를 실행합니다.")
+    print(f"⚡ 테스트 동시 실행 수: {RUNNER_OPTIONS['jobs']}")
     problems = load_problems_info()
     
     if not problems:
@@ -352,24 +1600,45 @@ def main():
     for p in problems:
         print(f"  - 문제 {p['problem_id']} ({p['author']}) - {p['code_file']}")
     
+    if args.speed_factor is None and not args.no_calibration:
+        calibrate_machine_speed(args.cache_dir, args.resume)
+    
+    if args.fuzz:
+        no_counterexample = run_fuzz_mode(problems, args.fuzz_budget, args.fuzz_seed)
+        shutdown_warm_harness()
+        shutdown_compile_service()
+        sys.exit(0 if no_counterexample else 1)
+    
+    _checkpoint = CheckpointJournal(args.checkpoint, current_runner_version(), resume=args.resume)
+    
     results = []
-    for i, problem in enumerate(problems, 1):
-        print(f"\n🔄 진행률: {i}/{len(problems)}")
-        try:
-            results.append(run_single_problem_test(problem))
-        except Exception as e:
-            print(f"❌ 문제 {problem.get('problem_id', 'unknown')} 처리 중 최상위 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append({
-                'problem_id': problem.get('problem_id', 'unknown'),
-                'author': problem.get('author', 'unknown'),
-                'result': 'ERROR', 'errors': [str(e)]
-            })
-    
-    summary = generate_summary(results)
+    if args.sequential:
+        for i, problem in enumerate(problems, 1):
+            print(f"\n🔄 진행률: {i}/{len(problems)}")
+            try:
+                results.append(run_single_problem_test(problem))
+            except Exception as e:
+                print(f"❌ 문제 {problem.get('problem_id', 'unknown')} 처리 중 최상위 오류: {e}")
+                import traceback
+                traceback.print_exc()
+                results.append({
+                    'problem_id': problem.get('problem_id', 'unknown'),
+                    'author': problem.get('author', 'unknown'),
+                    'result': 'ERROR', 'errors': [str(e)]
+                })
+    else:
+        print(f"🔀 파이프라인 실행 (I/O 동시 실행 {args.io_concurrency}, CPU 동시 실행 {args.cpu_concurrency})")
+        results = run_problems_pipeline(problems, args.io_concurrency, args.cpu_concurrency)
+    
+    shutdown_test_executor()
+    shutdown_warm_harness()
+    shutdown_compile_service()
+    _checkpoint.close()
+
+    summary = generate_summary(results, get_class_cache_stats(), get_verdict_cache_stats(),
+                               RUNNER_OPTIONS['calibration'])
     with open('test_results_summary.json', 'w', encoding='utf-8') as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+        json.dump(summary, f, ensure_ascii=False, indent=2, default=record_to_json)
     
     print(f"\n{'='*60}")
     print(f"📊 전체 테스트 결과 요약")
@@ -379,6 +1648,10 @@ def main():
     print(f"⚠️ 부분 성공: {summary['partial_passed_problems']}개")
     print(f"❌ 실패: {summary['failed_problems']}개")
     print(f"💥 오류: {summary['error_problems']}개")
+    print(f"🗃️ 클래스 캐시: 적중 {summary['class_cache']['hits']}개, 미스 {summary['class_cache']['misses']}개")
+    print(f"🗃️ 결과 캐시: 적중 {summary['verdict_cache']['hits']}개, 미스 {summary['verdict_cache']['misses']}개")
+    if summary['resumed_problems']:
+        print(f"♻️ 체크포인트에서 이어받은 문제: {summary['resumed_problems']}개")
     print(f"전체 결과: {'🎉 성공' if summary['overall_success'] else '❌ 실패'}")
     
     print(f"\n📝 문제별 결과:")
@@ -387,7 +1660,8 @@ def main():
             'PASS': '✅', 'PARTIAL_PASS': '⚠️', 'FAIL': '❌', 
             'ERROR': '💥', 'COMPILATION_ERROR': '🔧'
         }.get(res['result'], '❓')
-        print(f"  {status} 문제 {res['problem_id']} ({res['author']}): {res['result']}")
+        cached_mark = " (캐시)" if res.get('cached') else " (이어받음)" if res.get('resumed') else ""
+        print(f"  {status} 문제 {res['problem_id']} ({res['author']}): {res['result']}{cached_mark}")
         if res.get('errors'):
             print(f"      └─ {res['errors'][0]}")
     
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+scripts/output_compare.py
+풀이 출력을 읽는 즉시 줄 단위로 예상 출력과 비교하는 스트리밍 비교기
+
+비교 규칙은 기존 normalize_output 과 같습니다.
+- 각 줄의 앞뒤 공백을 무시합니다.
+- 출력 앞뒤의 빈 줄을 무시합니다. (중간의 빈 줄은 비교합니다)
+"""
+
+import mmap
+
+from data_store import compression_of, iter_data_chunks
+
+
+def iter_lines_from_bytes(data):
+    """bytes 를 줄 단위로 나눕니다. (줄 끝 문자 제외)"""
+    start = 0
+    length = len(data)
+    while start < length:
+        end = data.find(b'\n', start)
+        if end == -1:
+            yield data[start:]
+            return
+        yield data[start:end]
+        start = end + 1
+
+
+def iter_lines_from_chunks(chunks):
+    """조각 단위로 들어오는 bytes 를 줄 단위로 나눕니다. (줄 끝 문자 제외)"""
+    parts = []
+    for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b'\n', start)
+            if end == -1:
+                if start < len(chunk):
+                    parts.append(chunk[start:])
+                break
+            parts.append(chunk[start:end])
+            yield b''.join(parts)
+            parts = []
+            start = end + 1
+    if parts:
+        yield b''.join(parts)
+
+
+def iter_lines_from_file(path):
+    """파일을 메모리 맵으로 열어 줄 단위로 읽습니다. (전체를 메모리에 복사하지 않습니다)
+
+    압축된 파일은 조각 단위로 풀면서 읽습니다.
+    """
+    if compression_of(path):
+        yield from iter_lines_from_chunks(iter_data_chunks(path))
+        return
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 메모리 맵을 만들 수 없습니다.
+            return
+        with mapped:
+            while True:
+                line = mapped.readline()
+                if not line:
+                    return
+                yield line[:-1] if line.endswith(b'\n') else line
+
+
+def iter_records(lines):
+    """빈 줄이 아닌 줄마다 (줄 번호, 바로 앞 빈 줄 수, 앞뒤 공백을 제거한 줄) 을 만듭니다.
+
+    출력 맨 앞의 빈 줄 수는 0으로 취급하고, 맨 뒤의 빈 줄은 만들어지지 않으므로
+    출력 전체를 strip() 한 것과 같은 효과를 냅니다.
+    """
+    blanks = 0
+    first = True
+    for line_no, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped:
+            blanks += 1
+            continue
+        yield line_no, (0 if first else blanks), stripped
+        blanks = 0
+        first = False
+
+
+# 불일치 정보에 남기는 줄의 최대 길이 (바이트)
+MISMATCH_PREVIEW_BYTES = 200
+
+
+def preview_bytes(data, limit=MISMATCH_PREVIEW_BYTES):
+    """불일치 정보에 남길 수 있도록 긴 줄을 잘라 문자열로 만듭니다."""
+    if data is None:
+        return None
+    text = data[:limit].decode('utf-8', errors='replace')
+    return f"{text}... ({len(data)} bytes)" if len(data) > limit else text
+
+
+def _lines_equal(expected, actual):
+    if expected == actual:
+        return True
+    # bytes.strip() 은 ASCII 공백만 제거하므로, 유니코드 공백까지 고려해 한 번 더 비교합니다.
+    return (expected.decode('utf-8', errors='replace').strip()
+            == actual.decode('utf-8', errors='replace').strip())
+
+
+class StreamingComparator:
+    """출력 조각(bytes)을 받을 때마다 예상 출력과 비교하고, 처음 다른 줄에서 비교를 멈춥니다."""
+
+    def __init__(self, expected_lines):
+        self.expected = iter_records(expected_lines)
+        self.partial = []
+        self.line_no = 0
+        self.blanks = 0
+        self.first = True
+        self.matched = None
+        self.mismatch = None
+
+    @classmethod
+    def from_text(cls, expected_text):
+        """예상 출력 문자열로 비교기를 만듭니다."""
+        return cls(iter_lines_from_bytes((expected_text or '').encode('utf-8')))
+
+    @classmethod
+    def from_file(cls, expected_path):
+        """예상 출력 파일(메모리 맵)로 비교기를 만듭니다."""
+        return cls(iter_lines_from_file(expected_path))
+
+    def _consume_line(self, line):
+        """실제 출력 한 줄을 iter_records 와 같은 규칙으로 처리하여 예상 출력과 비교합니다."""
+        self.line_no += 1
+        stripped = line.strip()
+        if not stripped:
+            self.blanks += 1
+            return
+        record = (self.line_no, 0 if self.first else self.blanks, stripped)
+        self.blanks = 0
+        self.first = False
+        expected_record = next(self.expected, None)
+        if expected_record is None:
+            self._fail(None, record)
+        elif expected_record[1] != record[1] or not _lines_equal(expected_record[2], record[2]):
+            self._fail(expected_record, record)
+
+    def _fail(self, expected_record, actual_record):
+        self.matched = False
+        self.mismatch = {
+            'line': actual_record[0] if actual_record else (expected_record[0] if expected_record else None),
+            'expected': preview_bytes(expected_record[2]) if expected_record else None,
+            'actual': preview_bytes(actual_record[2]) if actual_record else None,
+        }
+
+    def feed(self, chunk):
+        """출력 조각을 비교합니다. 이미 불일치가 발견되었으면 무시합니다."""
+        if self.matched is False or not chunk:
+            return
+        end = chunk.find(b'\n')
+        if end == -1:
+            # 아주 긴 한 줄이 여러 조각으로 나뉘어 와도 매번 이어 붙이지 않도록 모아 둡니다.
+            self.partial.append(chunk)
+            return
+        if self.partial:
+            self.partial.append(chunk[:end])
+            line = b''.join(self.partial)
+            self.partial = []
+        else:
+            line = chunk[:end]
+        self._consume_line(line)
+        start = end + 1
+        while self.matched is not False:
+            end = chunk.find(b'\n', start)
+            if end == -1:
+                break
+            self._consume_line(chunk[start:end])
+            start = end + 1
+        if self.matched is not False and start < len(chunk):
+            self.partial.append(chunk[start:])
+
+    def finish(self):
+        """출력이 끝났음을 알리고 최종 일치 여부를 반환합니다."""
+        if self.matched is False:
+            return False
+        if self.partial:
+            line = b''.join(self.partial)
+            self.partial = []
+            self._consume_line(line)
+            if self.matched is False:
+                return False
+        remaining = next(self.expected, None)
+        if remaining is not None:
+            self._fail(remaining, None)
+            return False
+        self.matched = True
+        return True
+
+    def describe_mismatch(self):
+        """불일치 위치를 사람이 읽을 수 있는 문자열로 만듭니다."""
+        if not self.mismatch:
+            return ""
+        expected = self.mismatch['expected']
+        actual = self.mismatch['actual']
+        if actual is None:
+            return f"출력이 예상보다 짧습니다 ({self.mismatch['line']}번째 줄 {expected!r} 없음)"
+        if expected is None:
+            return f"출력이 예상보다 깁니다 ({self.mismatch['line']}번째 줄 {actual!r})"
+        return f"{self.mismatch['line']}번째 줄 불일치 (예상 {expected!r}, 실제 {actual!r})"
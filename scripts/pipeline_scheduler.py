@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+scripts/pipeline_scheduler.py
+작업 간 의존 관계(DAG)에 따라 I/O 작업과 CPU 작업을 서로 다른 동시 실행 한도로 겹쳐서 실행하는 스케줄러
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+IO = 'io'
+CPU = 'cpu'
+
+
+class PipelineTask:
+    """스케줄러에 등록되는 단일 작업"""
+    def __init__(self, name, func, deps, after, kind):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.after = list(after)
+        self.kind = kind
+        self.dependents = []
+        self.pending = len(self.deps) + len(self.after)
+        self.result = None
+        self.skipped = False
+
+
+class PipelineScheduler:
+    """의존 작업이 모두 성공(참 값 반환)한 작업만 실행합니다.
+
+    의존 작업(deps) 중 하나라도 거짓 값을 반환하거나 예외를 던지면 그 뒤의 작업은 실행하지 않고
+    결과를 False 로 기록합니다. 순서 의존 작업(after)은 끝나기만 기다리고 결과는 따지지 않습니다.
+    먼저 등록한 작업이 먼저 실행 대기열에 들어갑니다.
+    """
+
+    def __init__(self, io_workers=4, cpu_workers=1):
+        self.io_workers = max(1, io_workers)
+        self.cpu_workers = max(1, cpu_workers)
+        self.tasks = {}
+        self.order = []
+
+    def add_task(self, name, func, deps=(), after=(), kind=CPU):
+        """작업을 등록합니다. 의존 작업은 먼저 등록되어 있어야 합니다."""
+        if name in self.tasks:
+            raise ValueError(f"이미 등록된 작업입니다: {name}")
+        if kind not in (IO, CPU):
+            raise ValueError(f"알 수 없는 작업 종류입니다: {kind}")
+        for dep in [*deps, *after]:
+            if dep not in self.tasks:
+                raise ValueError(f"등록되지 않은 의존 작업입니다: {dep}")
+        task = PipelineTask(name, func, deps, after, kind)
+        for dep in deps:
+            self.tasks[dep].dependents.append((task, True))
+        for dep in after:
+            self.tasks[dep].dependents.append((task, False))
+        self.tasks[name] = task
+        self.order.append(task)
+        return name
+
+    def run(self):
+        """모든 작업을 실행하고 {작업 이름: 결과} 를 반환합니다."""
+        if not self.order:
+            return {}
+
+        lock = threading.Lock()
+        done = threading.Event()
+        remaining = [len(self.order)]
+        executors = {
+            IO: ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='pipeline-io'),
+            CPU: ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix='pipeline-cpu'),
+        }
+
+        def finish(task, result):
+            ready = []
+            with lock:
+                task.result = result
+                remaining[0] -= 1
+                for dependent, requires_success in task.dependents:
+                    dependent.pending -= 1
+                    if requires_success and not result:
+                        dependent.skipped = True
+                    if dependent.pending == 0:
+                        ready.append(dependent)
+                if remaining[0] == 0:
+                    done.set()
+            for dependent in ready:
+                dispatch(dependent)
+
+        def execute(task):
+            try:
+                result = task.func()
+            except Exception as e:
+                print(f"❌ 작업 {task.name} 실행 중 오류: {e}")
+                result = False
+            finish(task, result)
+
+        def dispatch(task):
+            if task.skipped:
+                finish(task, False)
+            else:
+                executors[task.kind].submit(execute, task)
+
+        try:
+            for task in [t for t in self.order if t.pending == 0]:
+                dispatch(task)
+            done.wait()
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+
+        return {task.name: task.result for task in self.order}
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+scripts/process_runner.py
+자식 프로세스를 실행하면서 벽시계 시간, 사용자/시스템 CPU 시간, 최대 메모리(RSS)를 측정합니다.
+
+입출력은 처음부터 끝까지 바이트로 다룹니다. 표준 입력은 파이프에 써 넣지 않고 파일(메모리 데이터는 memfd)을
+자식의 표준 입력 파일 디스크립터로 바로 연결하며, 출력은 진단 메시지를 만들 때만 문자열로 바꿉니다.
+"""
+
+import math
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+# 실행 판정
+VERDICT_OK = 'OK'
+VERDICT_RUNTIME_ERROR = 'RE'
+VERDICT_TIME_LIMIT = 'TLE'
+VERDICT_MEMORY_LIMIT = 'MLE'
+VERDICT_OUTPUT_LIMIT = 'OLE'
+
+
+class ExecutionResult:
+    """풀이 프로그램 한 번 실행의 판정 결과"""
+    def __init__(self, verdict, output=b"", execution_time=0, error="", metrics=None):
+        self.verdict = verdict
+        self.output = output
+        self.execution_time = execution_time
+        self.error = error
+        self.metrics = metrics or {}
+
+    @property
+    def success(self):
+        return self.verdict == VERDICT_OK
+
+
+def classify_execution(profile, returncode, timed_out, stdout, stderr, execution_time, timeout, metrics,
+                       output_exceeded=False):
+    """종료 상태와 표준 오류로 실행 판정(OK/OLE/TLE/MLE/RE)을 내립니다.
+
+    stdout/stderr 는 바이트이며, 표준 출력은 그대로 결과에 담고 표준 오류만 진단 메시지로 디코딩합니다.
+    """
+    if timed_out and not output_exceeded:
+        return ExecutionResult(VERDICT_TIME_LIMIT, b"", timeout, f"실행 시간 초과 ({timeout}초)", metrics)
+    if returncode == 0 and not output_exceeded:
+        return ExecutionResult(VERDICT_OK, stdout, execution_time, "", metrics)
+    stderr_text = stderr.decode('utf-8', errors='replace')
+    if output_exceeded:
+        # 출력 제한을 넘는 즉시 종료시키므로 종료 코드와 관계없이 출력 초과로 판정합니다.
+        error_msg = f"출력 초과 ({profile.output_limit_mb}MB)\n{stderr_text}".rstrip()
+        return ExecutionResult(VERDICT_OUTPUT_LIMIT, b"", execution_time, error_msg, metrics)
+    if profile.is_memory_exceeded(stderr_text):
+        error_msg = f"메모리 초과 ({profile.memory_limit_mb}MB)\n{stderr_text}"
+        return ExecutionResult(VERDICT_MEMORY_LIMIT, b"", execution_time, error_msg, metrics)
+    return ExecutionResult(VERDICT_RUNTIME_ERROR, b"", execution_time, stderr_text or "프로그램 실행 오류", metrics)
+
+
+class ProcessOutcome:
+    """프로세스 한 번 실행의 결과와 자원 사용량"""
+    def __init__(self):
+        self.returncode = None
+        self.stdout = b''
+        self.stdout_truncated = False
+        self.stderr = b''
+        self.timed_out = False
+        self.output_exceeded = False
+        self.wall_time = 0.0
+        self.user_time = None
+        self.sys_time = None
+        self.peak_rss_kb = None
+
+    def metrics(self):
+        """테스트 결과에 기록할 자원 사용량을 반환합니다."""
+        return {
+            'wall_time': self.wall_time, 'user_time': self.user_time,
+            'sys_time': self.sys_time, 'peak_rss_kb': self.peak_rss_kb
+        }
+
+
+def rusage_to_kb(maxrss):
+    """ru_maxrss 를 KB 단위로 바꿉니다. (macOS 는 바이트, Linux 는 KB 단위)"""
+    return maxrss // 1024 if sys.platform == 'darwin' else maxrss
+
+
+# 비교기로 스트리밍할 때 진단용으로 보관하는 표준 출력의 최대 크기 (바이트)
+STDOUT_RETAIN_BYTES = 1 << 20
+
+# 진단용으로 보관하는 표준 오류의 최대 크기 (바이트). 예외 메시지와 스택 트레이스 앞부분이면 충분합니다.
+STDERR_RETAIN_BYTES = 4096
+
+
+class BoundedCapture:
+    """출력 조각을 sink 로 넘기면서 앞부분 limit 바이트만 보관합니다.
+
+    max_total 을 넘는 출력이 들어오면 exceeded 를 표시하고 그 뒤의 출력은 버립니다.
+    (출력 제한을 넘은 프로세스를 종료하는 것은 호출 측의 몫입니다)
+    """
+    def __init__(self, sink=None, limit=None, max_total=None):
+        self.sink = sink
+        self.limit = limit
+        self.max_total = max_total
+        self.chunks = []
+        self.size = 0
+        self.total = 0
+        self.truncated = False
+        self.exceeded = False
+
+    def write(self, chunk):
+        if self.exceeded:
+            return
+        self.total += len(chunk)
+        if self.max_total is not None and self.total > self.max_total:
+            self.exceeded = True
+            self.truncated = True
+            return
+        if self.sink is not None:
+            self.sink(chunk)
+        if self.limit is None:
+            self.chunks.append(chunk)
+            return
+        room = self.limit - self.size
+        if room <= 0:
+            self.truncated = True
+            return
+        if len(chunk) > room:
+            chunk = chunk[:room]
+            self.truncated = True
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+
+    def getvalue(self):
+        return b''.join(self.chunks)
+
+
+def _drain(stream, capture, on_exceed):
+    for chunk in iter(lambda: stream.read(1 << 16), b''):
+        if capture.exceeded:
+            continue
+        capture.write(chunk)
+        if capture.exceeded:
+            on_exceed()
+    stream.close()
+
+
+def open_stdin(input_data=b'', stdin_path=None):
+    """자식의 표준 입력으로 연결할 파일 객체를 엽니다. (호출 측에서 자식을 띄운 뒤 닫습니다)
+
+    stdin_path 가 주어지면 그 파일을 열고, 아니면 input_data(바이트)를 memfd 에 한 번 써서 사용합니다.
+    memfd 가 없는 플랫폼에서는 이름 없는 임시 파일을 사용합니다.
+    파이프와 달리 입력을 밀어 넣는 스레드가 없고, 풀이가 입력을 다 읽지 않고 끝나도 문제가 없습니다.
+    """
+    if stdin_path is not None:
+        return open(stdin_path, 'rb')
+    if hasattr(os, 'memfd_create'):
+        stdin_file = os.fdopen(os.memfd_create('judge-stdin', os.MFD_CLOEXEC), 'w+b')
+    else:
+        stdin_file = tempfile.TemporaryFile()
+    try:
+        stdin_file.write(input_data or b'')
+        stdin_file.flush()
+        stdin_file.seek(0)
+    except BaseException:
+        stdin_file.close()
+        raise
+    return stdin_file
+
+
+def kill_process_tree(process):
+    """새 세션으로 띄운 프로세스와 그 자손을 프로세스 그룹 단위로 모두 종료합니다."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, AttributeError):
+        try:
+            process.kill()
+        except OSError:
+            pass
+
+
+def capture_streams(stdout_sink=None, output_limit=None):
+    """표준 출력/표준 오류를 받을 BoundedCapture 두 개를 만듭니다.
+
+    output_limit(바이트)이 주어지면 두 스트림 각각 그 크기를 넘는 순간 exceeded 가 표시됩니다.
+    표준 오류는 진단용 앞부분(STDERR_RETAIN_BYTES)만 보관합니다.
+    """
+    stdout_retain = STDOUT_RETAIN_BYTES if stdout_sink else None
+    return (BoundedCapture(stdout_sink, stdout_retain, output_limit),
+            BoundedCapture(None, STDERR_RETAIN_BYTES, output_limit))
+
+
+def run_measured(cmd, input_data=b'', timeout=5, stdout_sink=None, stdin_path=None, output_limit=None, env=None,
+                 cwd=None):
+    """cmd 를 실행하고 ProcessOutcome 을 반환합니다.
+
+    stdout_sink 가 주어지면 표준 출력을 읽는 즉시 조각 단위로 넘기고, 보관은 앞부분만 합니다.
+    stdin_path 가 주어지면 input_data(바이트) 대신 해당 파일을 표준 입력으로 연결합니다.
+    output_limit(바이트)이 주어지면 표준 출력이나 표준 오류가 그보다 커지는 즉시 프로세스를 종료하고
+    output_exceeded 를 표시합니다. 표준 오류는 앞부분만 보관합니다.
+    env, cwd 는 subprocess.Popen 의 같은 인자로 넘깁니다.
+
+    wait4 로 직접 자식을 회수하여 해당 프로세스의 rusage(CPU 시간, 최대 RSS)를 얻습니다.
+    wait4 가 없는 플랫폼에서는 벽시계 시간만 측정합니다.
+    자식은 새 세션에서 실행되므로 시간 초과 시 자식이 만든 프로세스까지 함께 종료됩니다.
+    """
+    outcome = ProcessOutcome()
+    with open_stdin(input_data, stdin_path) as stdin_file:
+        start_time = time.perf_counter()
+        process = subprocess.Popen(cmd, stdin=stdin_file, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   start_new_session=True, env=env, cwd=cwd)
+
+    stdout_capture, stderr_capture = capture_streams(stdout_sink, output_limit)
+
+    def on_exceed():
+        outcome.output_exceeded = True
+        kill_process_tree(process)
+
+    workers = [
+        threading.Thread(target=_drain, args=(process.stdout, stdout_capture, on_exceed), daemon=True),
+        threading.Thread(target=_drain, args=(process.stderr, stderr_capture, on_exceed), daemon=True),
+    ]
+    for worker in workers:
+        worker.start()
+
+    def on_timeout():
+        outcome.timed_out = True
+        kill_process_tree(process)
+
+    watchdog = threading.Timer(timeout, on_timeout)
+    watchdog.start()
+    try:
+        if hasattr(os, 'wait4'):
+            _, status, rusage = os.wait4(process.pid, 0)
+            # Popen 이 같은 자식을 다시 회수하지 않도록 종료 코드를 직접 기록합니다.
+            process.returncode = os.waitstatus_to_exitcode(status)
+            outcome.user_time = rusage.ru_utime
+            outcome.sys_time = rusage.ru_stime
+            outcome.peak_rss_kb = rusage_to_kb(rusage.ru_maxrss)
+        else:
+            process.wait()
+        outcome.wall_time = time.perf_counter() - start_time
+    finally:
+        watchdog.cancel()
+    # 풀이가 남겨 둔 자손 프로세스가 출력 파이프를 잡고 있지 않도록 정리합니다.
+    kill_process_tree(process)
+
+    for worker in workers:
+        worker.join()
+    outcome.returncode = process.returncode
+    outcome.stdout = stdout_capture.getvalue()
+    outcome.stdout_truncated = stdout_capture.truncated
+    outcome.stderr = stderr_capture.getvalue()
+    return outcome
+
+
+def percentile(values, fraction):
+    """정렬된 값에서 최근접 순위(nearest-rank) 방식으로 백분위수를 구합니다."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * fraction))
+    return ordered[rank - 1]
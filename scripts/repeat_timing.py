@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+scripts/repeat_timing.py
+같은 테스트를 여러 번 실행하여 실행 시간의 잡음을 줄이는 반복 측정 (--repeat K)
+
+공유 CI 러너에서는 한 번 잰 실행 시간이 다른 작업의 영향을 크게 받으므로,
+시간 제한 근처에서 끝난 테스트(또는 시간 초과된 테스트)만 K 번 실행하여 최솟값/중앙값/편차를 기록합니다.
+- 판정과 결과는 실행 시간이 중앙값인 실행의 것을 사용하므로, 한 번 운 나쁘게 느린 실행으로 시간 초과가 되지 않습니다.
+  (시간 초과된 실행은 제한 시간에서 멈추므로 K 번 중 절반을 넘게 시간 초과되어야 시간 초과로 판정합니다)
+- 변동 계수(표준편차 / 평균)가 기준을 넘으면 측정이 불안정한 것으로 표시합니다.
+"""
+
+import statistics
+
+# 기본 반복 횟수 (1이면 반복하지 않습니다)
+DEFAULT_REPEAT = 1
+
+# 변동 계수가 이 값을 넘으면 측정이 불안정한 것으로 표시합니다.
+DEFAULT_UNSTABLE_CV = 0.1
+
+# 첫 실행 시간이 제한 시간의 이 비율 이상인 테스트만 반복합니다. (제한 시간과 먼 테스트는 판정이 바뀌지 않습니다)
+REPEAT_MIN_FRACTION = 0.5
+
+# 실행 시간에 따라 판정이 달라질 수 있는 판정
+TIMING_VERDICTS = ('AC', 'TLE')
+
+
+def needs_repeat(record, time_limit, repeat):
+    """첫 실행 결과로 반복 측정이 필요한 테스트인지 판단합니다."""
+    if repeat <= 1 or record.get('skipped') or record['verdict'] not in TIMING_VERDICTS:
+        return False
+    return record['verdict'] == 'TLE' or record['execution_time'] >= REPEAT_MIN_FRACTION * time_limit
+
+
+def summarize_samples(samples, unstable_cv=DEFAULT_UNSTABLE_CV):
+    """실행 시간 표본의 최솟값, 중앙값, 최댓값, 편차(최댓값 - 최솟값), 변동 계수, 불안정 여부"""
+    mean = statistics.fmean(samples)
+    cv = statistics.pstdev(samples) / mean if mean > 0 else 0.0
+    return {
+        'runs': len(samples), 'min': min(samples), 'median': statistics.median(samples), 'max': max(samples),
+        'spread': max(samples) - min(samples), 'cv': cv, 'unstable': cv > unstable_cv,
+        'samples': list(samples)
+    }
+
+
+def combine_runs(records, unstable_cv=DEFAULT_UNSTABLE_CV):
+    """같은 테스트를 여러 번 실행한 결과를 하나로 합칩니다.
+
+    실행 시간이 중앙값인 실행(짝수 번이면 둘 중 빠른 쪽)의 결과를 사용하고, 실행 시간은 중앙값으로 바꾸며,
+    timing 에 반복 측정 요약을 남깁니다.
+    """
+    ordered = sorted(records, key=lambda record: record['execution_time'])
+    chosen = ordered[(len(ordered) - 1) // 2]
+    timing = summarize_samples([record['execution_time'] for record in records], unstable_cv)
+    timing['timeouts'] = sum(1 for record in records if record['verdict'] == 'TLE')
+    chosen.timing = timing
+    chosen.execution_time = timing['median']
+    return chosen
+
+
+def describe_timing(timing):
+    """로그에 남길 반복 측정 요약 문자열"""
+    text = (f"{timing['runs']}회 측정: 최소 {timing['min']:.3f}초, 중앙값 {timing['median']:.3f}초, "
+            f"편차 {timing['spread']:.3f}초 (변동 계수 {timing['cv']:.1%})")
+    if timing['timeouts']:
+        text += f", 시간 초과 {timing['timeouts']}회"
+    if timing['unstable']:
+        text += " ⚠️ 불안정"
+    return text
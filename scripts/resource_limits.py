@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+scripts/resource_limits.py
+BOJ와 비슷한 실행 환경을 만들기 위한 문제별 자원 제한 프로필
+(힙/스택 크기, 주소 공간 상한, 스레드·프로세스 수 상한)
+"""
+
+import functools
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+# 문제 정보에 메모리 제한이 없을 때 사용하는 기본값 (MB)
+DEFAULT_MEMORY_LIMIT_MB = 256
+
+# 문제 정보에 시간 제한이 없을 때 사용하는 실행 제한 시간 (초)
+DEFAULT_TIMEOUT_SECONDS = 5
+
+# BOJ의 Java 시간 제한 규칙: 문제 시간 제한 × 2 + 1초
+JAVA_TIME_MULTIPLIER = 2
+JAVA_EXTRA_TIME_MS = 1000
+
+# BOJ는 Java 풀이를 -Xss512m 으로 실행하므로 깊은 재귀도 같은 조건에서 동작하도록 맞춥니다.
+MAX_STACK_MB = 512
+
+# -Xss 는 모든 자바 스레드에 적용되므로, 큰 스택은 이 실행기로 풀이의 메인 스레드에만 줍니다.
+LAUNCHER_SOURCE = Path(__file__).resolve().parent / 'java' / 'MainThreadLauncher.java'
+LAUNCHER_CLASS = 'MainThreadLauncher'
+
+# 힙 이외에 JVM이 예약하는 주소 공간(코드 캐시, 메타스페이스, 공유 라이브러리 등)을 위한 여유분 (MB)
+JVM_ADDRESS_SPACE_OVERHEAD_MB = 1024
+
+# 풀이 하나가 출력할 수 있는 최대 크기 (MB). 넘으면 바로 종료하고 출력 초과(OLE)로 판정합니다.
+DEFAULT_OUTPUT_LIMIT_MB = 64
+
+# 실행 하나가 추가로 만들 수 있는 스레드/프로세스 수
+TASKS_PER_RUN = 128
+
+
+def compile_launcher(build_dir):
+    """메인 스레드 실행기를 build_dir 에 컴파일합니다."""
+    try:
+        result = subprocess.run(
+            ['javac', '-encoding', 'UTF-8', '-d', build_dir, str(LAUNCHER_SOURCE)],
+            capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return False, str(e)
+    if result.returncode != 0:
+        return False, result.stderr or result.stdout or "실행기 컴파일 실패"
+    return True, ""
+
+MEMORY_ERROR_MARKERS = (
+    'java.lang.OutOfMemoryError',
+    'Could not reserve enough space',
+    'Cannot allocate memory',
+    'insufficient memory for the Java Runtime Environment',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def find_prlimit():
+    """prlimit 실행 파일 경로를 반환합니다."""
+    return shutil.which('prlimit')
+
+
+def count_user_tasks():
+    """현재 사용자가 실행 중인 스레드 수를 셉니다. (RLIMIT_NPROC 은 사용자 전체 스레드 수에 적용됩니다)"""
+    uid = os.getuid()
+    total = 0
+    try:
+        pids = [name for name in os.listdir('/proc') if name.isdigit()]
+    except OSError:
+        return None
+    for pid in pids:
+        try:
+            if os.stat(f'/proc/{pid}').st_uid == uid:
+                total += len(os.listdir(f'/proc/{pid}/task'))
+        except OSError:
+            continue
+    return total
+
+
+class ResourceProfile:
+    """문제 하나를 실행할 때 적용하는 자원 제한"""
+
+    def __init__(self, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, cap_address_space=True, max_tasks=None,
+                 time_limit_ms=None, no_extra_time=False, speed_factor=1.0, output_limit_mb=DEFAULT_OUTPUT_LIMIT_MB):
+        self.memory_limit_mb = int(memory_limit_mb or DEFAULT_MEMORY_LIMIT_MB)
+        self.stack_mb = min(MAX_STACK_MB, self.memory_limit_mb)
+        self.cap_address_space = cap_address_space
+        self.max_tasks = max_tasks
+        self.time_limit_ms = time_limit_ms
+        self.no_extra_time = no_extra_time
+        self.speed_factor = speed_factor or 1.0
+        self.output_limit_mb = output_limit_mb or DEFAULT_OUTPUT_LIMIT_MB
+
+    def java_time_limit_ms(self):
+        """BOJ 규칙을 적용한 Java 시간 제한 (ms). 문제 시간 제한을 모르면 None 을 반환합니다."""
+        if not self.time_limit_ms:
+            return None
+        if self.no_extra_time:
+            return self.time_limit_ms
+        return self.time_limit_ms * JAVA_TIME_MULTIPLIER + JAVA_EXTRA_TIME_MS
+
+    def timeout_seconds(self):
+        """실행 제한 시간 (초). 이 머신의 속도 보정 계수를 곱합니다."""
+        limit_ms = self.java_time_limit_ms()
+        if limit_ms is None:
+            return DEFAULT_TIMEOUT_SECONDS
+        return limit_ms * self.speed_factor / 1000
+
+    def output_limit_bytes(self):
+        """표준 출력/표준 오류 각각의 최대 크기 (바이트)"""
+        return int(self.output_limit_mb * 1024 * 1024)
+
+    def jvm_options(self):
+        """메모리 제한에 맞춘 JVM 옵션을 반환합니다.
+
+        -Xss 는 주지 않습니다. 풀이의 메인 스레드 스택(stack_mb)은 launch_args 의 실행기가 정하고,
+        JVM 의 다른 스레드와 풀이가 크기를 지정하지 않고 만든 스레드는 JVM 기본 스택 크기를 사용합니다.
+        """
+        return [
+            f'-Xmx{self.memory_limit_mb}m',
+            # 주소 공간 상한 안에서 JVM이 뜰 수 있도록 부가 영역 예약 크기를 줄입니다.
+            '-XX:ReservedCodeCacheSize=64m', '-XX:CompressedClassSpaceSize=64m',
+            '-XX:+UseSerialGC',
+        ]
+
+    def main_stack_bytes(self):
+        """풀이 메인 스레드의 스택 크기 (바이트)"""
+        return self.stack_mb * 1024 * 1024
+
+    def launch_args(self, launcher_dir, code_dir, class_name):
+        """JVM 옵션 뒤에 붙여 풀이를 메인 스레드 실행기로 실행하는 인자를 반환합니다."""
+        return ['-cp', f'{launcher_dir}{os.pathsep}{code_dir}', LAUNCHER_CLASS, str(self.main_stack_bytes()),
+                class_name]
+
+    def address_space_limit_bytes(self):
+        """주소 공간 상한 (바이트). 큰 스택은 메인 스레드 하나에만 있으므로 한 번만 더합니다."""
+        total_mb = self.memory_limit_mb + self.stack_mb + JVM_ADDRESS_SPACE_OVERHEAD_MB
+        return total_mb * 1024 * 1024
+
+    def command_prefix(self):
+        """prlimit 으로 자원 상한을 걸어 명령을 실행하기 위한 접두어를 반환합니다.
+
+        스레드가 여럿인 러너에서 preexec_fn 은 안전하지 않으므로 util-linux 의 prlimit 을 사용합니다.
+        prlimit 이 없으면 JVM 옵션만 적용합니다.
+        """
+        prlimit = find_prlimit()
+        if prlimit is None:
+            return []
+        limits = []
+        if self.cap_address_space:
+            limits.append(f'--as={self.address_space_limit_bytes()}')
+        if self.max_tasks:
+            limits.append(f'--nproc={self.max_tasks}')
+        return [prlimit, *limits, '--'] if limits else []
+
+    def is_memory_exceeded(self, stderr_text):
+        """실행 결과가 메모리 초과(MLE)인지 판정합니다."""
+        return bool(stderr_text) and any(marker in stderr_text for marker in MEMORY_ERROR_MARKERS)
+
+
+def default_max_tasks(concurrent_runs):
+    """동시에 실행되는 테스트 수를 고려한 사용자 스레드 수 상한을 계산합니다.
+
+    RLIMIT_NPROC 은 root(CAP_SYS_RESOURCE/CAP_SYS_ADMIN)에게는 적용되지 않으므로, root 로 실행하면
+    (예: 컨테이너 안의 CI) 상한을 걸지 않고 None 을 반환합니다. 그때 포크 폭탄은 제한 시간으로만 막습니다.
+    """
+    if hasattr(os, 'geteuid') and os.geteuid() == 0:
+        return None
+    current = count_user_tasks()
+    if current is None:
+        return None
+    return current + TASKS_PER_RUN * max(1, concurrent_runs)
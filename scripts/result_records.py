@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+scripts/result_records.py
+테스트 결과를 고정 크기로 기록하기 위한 레코드
+
+입력/예상 출력/실제 출력은 전체 문자열 대신 바이트 수, SHA-256, 앞뒤 미리보기만 보관하고,
+실패한 테스트의 전체 데이터만 별도 파일로 저장합니다.
+따라서 테스트 데이터가 아무리 커도 메모리 사용량과 test_results_summary.json 크기는 일정하게 유지됩니다.
+"""
+
+import hashlib
+import os
+import shutil
+
+from data_store import open_data
+
+# 미리보기로 보관하는 앞/뒤 바이트 수
+PREVIEW_BYTES = 256
+
+# 실패한 테스트의 전체 데이터를 저장하는 기본 디렉토리
+DEFAULT_ARTIFACT_DIR = 'test_artifacts'
+
+
+class PayloadBuilder:
+    """조각 단위로 받은 데이터의 크기, 해시, 앞뒤 미리보기를 계산합니다."""
+    __slots__ = ('size', 'digest', 'head', 'tail')
+
+    def __init__(self):
+        self.size = 0
+        self.digest = hashlib.sha256()
+        self.head = b''
+        self.tail = b''
+
+    def feed(self, chunk):
+        if not chunk:
+            return
+        self.size += len(chunk)
+        self.digest.update(chunk)
+        if len(self.head) < PREVIEW_BYTES:
+            self.head += chunk[:PREVIEW_BYTES - len(self.head)]
+        self.tail = (self.tail + chunk[-PREVIEW_BYTES:])[-PREVIEW_BYTES:]
+
+    def build(self):
+        return Payload(self.size, self.digest.hexdigest(), self.head, self.tail)
+
+
+class Payload:
+    """입력/출력 하나의 요약"""
+    __slots__ = ('size', 'sha256', 'head', 'tail', 'file')
+
+    def __init__(self, size, sha256, head, tail, file=None):
+        self.size = size
+        self.sha256 = sha256
+        self.head = head
+        self.tail = tail
+        self.file = file
+
+    @classmethod
+    def from_bytes(cls, data):
+        builder = PayloadBuilder()
+        builder.feed(data)
+        return builder.build()
+
+    @classmethod
+    def from_text(cls, text):
+        return cls.from_bytes((text or '').encode('utf-8'))
+
+    @classmethod
+    def from_file(cls, path):
+        """파일 내용의 요약. 압축된 테스트 데이터(.gz, .xz)는 푼 내용의 요약입니다."""
+        builder = PayloadBuilder()
+        with open_data(path) as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                builder.feed(chunk)
+        return builder.build()
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict() 결과로 Payload 를 다시 만듭니다. (미리보기는 UTF-8 로 다시 인코딩합니다)"""
+        head = data.get('head', '').encode('utf-8')
+        return cls(data['bytes'], data['sha256'], head, data.get('tail', '').encode('utf-8') or head,
+                   data.get('file'))
+
+    @property
+    def truncated(self):
+        return self.size > len(self.head)
+
+    def preview(self):
+        """로그와 알림에 사용할 미리보기 문자열 (잘린 경우 앞/뒤 부분과 생략 표시)"""
+        head = self.head.decode('utf-8', errors='replace')
+        if not self.truncated:
+            return head
+        tail = self.tail.decode('utf-8', errors='replace')
+        return f"{head}\n... ({self.size} bytes 중 일부 생략) ...\n{tail}"
+
+    def to_dict(self):
+        data = {'bytes': self.size, 'sha256': self.sha256, 'head': self.head.decode('utf-8', errors='replace')}
+        if self.truncated:
+            data['tail'] = self.tail.decode('utf-8', errors='replace')
+        if self.file:
+            data['file'] = self.file
+        return data
+
+
+class TestRecord:
+    """테스트케이스 하나의 결과. 기존 dict 결과와 같이 record['verdict'], record.get('wall_time') 로도 읽을 수 있습니다."""
+    __slots__ = (
+        'description', 'verdict', 'passed', 'skipped', 'error', 'execution_time',
+        'wall_time', 'user_time', 'sys_time', 'peak_rss_kb',
+        'input', 'expected', 'actual', 'mismatch', 'output_checked', 'timing'
+    )
+
+    def __init__(self, description, verdict, passed=False, error='', execution_time=0, metrics=None,
+                 input=None, expected=None, actual=None, mismatch=None, skipped=False, output_checked=True):
+        metrics = metrics or {}
+        self.description = description
+        self.verdict = verdict
+        self.passed = passed
+        self.skipped = skipped
+        self.error = error
+        self.execution_time = execution_time
+        self.wall_time = metrics.get('wall_time')
+        self.user_time = metrics.get('user_time')
+        self.sys_time = metrics.get('sys_time')
+        self.peak_rss_kb = metrics.get('peak_rss_kb')
+        self.input = input
+        self.expected = expected
+        self.actual = actual
+        self.mismatch = mismatch
+        self.output_checked = output_checked
+        # 반복 측정한 경우의 실행 시간 요약 (repeat_timing.combine_runs)
+        self.timing = None
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict() 결과로 TestRecord 를 다시 만듭니다."""
+        record = cls(data['description'], data['verdict'])
+        for name in cls.__slots__:
+            value = data.get(name, getattr(record, name))
+            if name in ('input', 'expected', 'actual') and isinstance(value, dict):
+                value = Payload.from_dict(value)
+            setattr(record, name, value)
+        return record
+
+    def to_dict(self):
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            data[name] = value.to_dict() if isinstance(value, Payload) else value
+        return data
+
+
+def record_to_json(obj):
+    """json.dump(default=...) 에서 레코드를 직렬화합니다."""
+    if isinstance(obj, (TestRecord, Payload)):
+        return obj.to_dict()
+    raise TypeError(f"{type(obj).__name__} 는 JSON 으로 변환할 수 없습니다.")
+
+
+def spill_payload(payload, target_path, data=None, source_path=None, source_file=None):
+    """실패한 테스트의 전체 데이터를 파일로 저장하고 payload 에 경로를 기록합니다.
+
+    data(바이트), source_path(복사할 파일 경로), source_file(처음부터 다시 읽을 열린 파일) 중 하나로 데이터를 받습니다.
+    """
+    if payload is None or (data is None and source_path is None and source_file is None):
+        return
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    if source_path is not None:
+        shutil.copyfile(source_path, target_path)
+    elif source_file is not None:
+        source_file.seek(0)
+        with open(target_path, 'wb') as f:
+            shutil.copyfileobj(source_file, f)
+    else:
+        with open(target_path, 'wb') as f:
+            f.write(data)
+    payload.file = target_path
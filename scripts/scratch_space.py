@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+scripts/scratch_space.py
+문제별 컴파일/실행에 사용하는 격리된 임시 디렉토리
+
+러너 실행 하나마다 tmpfs(/dev/shm, 없으면 시스템 임시 디렉토리) 아래에 세션 디렉토리를 만들고,
+문제별 빌드 디렉토리와 테스트 입력 파일은 모두 그 안에 둡니다.
+작업 트리에는 아무것도 쓰지 않으며, 같은 경로의 두 소스도 서로 다른 디렉토리에서 동시에 컴파일할 수 있습니다.
+
+정리는 세 단계로 보장합니다.
+- 문제 처리가 끝나면 문제 디렉토리를 바로 삭제합니다.
+- 정상 종료, 예외, SIGTERM/SIGHUP 으로 끝나면 세션 디렉토리 전체를 삭제합니다.
+- SIGKILL 등으로 정리하지 못한 세션은 다음 실행 시작 시 소유 프로세스가 없으면 삭제합니다.
+"""
+
+import atexit
+import os
+import shutil
+import signal
+import tempfile
+import threading
+
+from stress_tests import is_stress_test
+
+SCRATCH_ENV = 'JUDGE_SCRATCH_DIR'
+TMPFS_ROOT = '/dev/shm'
+
+# tmpfs 여유 공간이 이보다 적으면 시스템 임시 디렉토리를 사용합니다.
+MIN_TMPFS_FREE_MB = 512
+
+SESSION_PREFIX = 'boj-judge-'
+OWNER_FILE = 'owner.pid'
+
+
+def tmpfs_free_mb(path):
+    try:
+        stats = os.statvfs(path)
+    except OSError:
+        return 0
+    return stats.f_bavail * stats.f_frsize // (1024 * 1024)
+
+
+def choose_scratch_root():
+    """$JUDGE_SCRATCH_DIR > /dev/shm (쓰기 가능하고 여유 공간이 충분할 때) > 시스템 임시 디렉토리"""
+    configured = os.environ.get(SCRATCH_ENV)
+    if configured:
+        os.makedirs(configured, exist_ok=True)
+        return configured
+    if os.path.isdir(TMPFS_ROOT) and os.access(TMPFS_ROOT, os.W_OK) and tmpfs_free_mb(TMPFS_ROOT) >= MIN_TMPFS_FREE_MB:
+        return TMPFS_ROOT
+    return tempfile.gettempdir()
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def reap_stale_sessions(root):
+    """소유 프로세스가 더 이상 없는 세션 디렉토리를 삭제하고 삭제한 개수를 반환합니다."""
+    removed = 0
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return 0
+    for name in names:
+        if not name.startswith(SESSION_PREFIX):
+            continue
+        session = os.path.join(root, name)
+        try:
+            with open(os.path.join(session, OWNER_FILE), 'r') as f:
+                owner = int(f.read().strip())
+        except (OSError, ValueError):
+            continue
+        if owner != os.getpid() and not _process_alive(owner):
+            shutil.rmtree(session, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+class ScratchSpace:
+    """러너 실행 하나의 세션 디렉토리. 처음 사용할 때 만들어집니다."""
+
+    def __init__(self, root=None):
+        self.root = root
+        self.session = None
+        self.lock = threading.Lock()
+
+    def _ensure_session(self):
+        with self.lock:
+            if self.session is None:
+                if self.root is None:
+                    self.root = choose_scratch_root()
+                reaped = reap_stale_sessions(self.root)
+                if reaped:
+                    print(f"🧹 이전 실행이 남긴 임시 디렉토리 {reaped}개 정리")
+                self.session = tempfile.mkdtemp(prefix=SESSION_PREFIX, dir=self.root)
+                with open(os.path.join(self.session, OWNER_FILE), 'w') as f:
+                    f.write(str(os.getpid()))
+            return self.session
+
+    def make_dir(self, prefix):
+        """세션 안에 새 디렉토리를 만들어 경로를 반환합니다."""
+        return tempfile.mkdtemp(prefix=prefix, dir=self._ensure_session())
+
+    def cleanup(self):
+        """세션 디렉토리 전체를 삭제합니다. 여러 번 호출해도 됩니다."""
+        with self.lock:
+            session, self.session = self.session, None
+        if session is not None:
+            shutil.rmtree(session, ignore_errors=True)
+
+
+def _raise_system_exit(signum, frame):
+    # finally 블록과 atexit 정리가 실행되도록 종료 시그널을 SystemExit 로 바꿉니다.
+    raise SystemExit(128 + signum)
+
+
+def install_cleanup_handlers(scratch):
+    """정상 종료와 SIGTERM/SIGHUP 종료 시 세션을 정리하도록 등록합니다. (메인 스레드에서 호출해야 합니다)"""
+    atexit.register(scratch.cleanup)
+    for signum in (signal.SIGTERM, signal.SIGHUP):
+        try:
+            if signal.getsignal(signum) in (signal.SIG_DFL, None):
+                signal.signal(signum, _raise_system_exit)
+        except (ValueError, OSError):
+            pass
+
+
+def stage_test_inputs(test_cases, target_dir, label):
+    """테스트 입력을 target_dir 의 파일로 옮겨 적고, input_file 을 추가한 테스트케이스 사본 목록을 반환합니다.
+
+    실행할 때 파이프로 입력을 밀어 넣는 대신 파일을 표준 입력으로 바로 연결할 수 있습니다.
+    스트레스 테스트와 이미 파일 입력인 테스트는 그대로 둡니다.
+    """
+    staged = []
+    os.makedirs(target_dir, exist_ok=True)
+    for i, test_case in enumerate(test_cases):
+        if is_stress_test(test_case) or test_case.get('input_file'):
+            staged.append(test_case)
+            continue
+        path = os.path.join(target_dir, f'{label}_{i + 1}.in')
+        with open(path, 'wb') as f:
+            f.write((test_case.get('input') or '').encode('utf-8'))
+        staged.append({**test_case, 'input_file': path})
+    return staged
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+scripts/speed_calibration.py
+러너 머신의 속도를 고정 기준 작업으로 재서 실행 시간을 기준 머신 기준으로 환산합니다.
+
+작업을 시작할 때 scripts/java/SpeedCalibration.java 로 JVM 시작 시간과 CPU 위주 작업 시간을 여러 번 재고,
+저장소에 커밋한 기준 값(scripts/calibration_baseline.json, 기준 머신에서 잰 값)과 비교하여 보정 계수를 만듭니다.
+기준 값은 캐시와 달리 지워지거나 러너마다 달라지지 않으므로, 정규화한 시간을 주와 러너가 달라도 비교할 수 있습니다.
+기준 값 파일이 아직 없으면 보정하지 않습니다. (시간 제한은 그대로 두고, 실행 시간은 환산하지 않은 값만 기록합니다)
+- factor: 두 비율(시작 시간, 작업 시간)의 기하 평균. 1보다 크면 기준 머신보다 느린 머신입니다.
+- limit_factor: 시간 제한에 곱하는 값. 측정 잡음 때문에 판정과 캐시 키가 매번 바뀌지 않도록 LIMIT_FACTOR_STEP 단위로 맞추고,
+  1보다 작게 하지 않습니다. (기준 머신보다 빠른 머신에서 시간 제한을 줄이면 측정 오차만으로 시간 초과가 날 수 있습니다)
+실행 시간을 factor 로 나누면 기준 머신에서의 시간(정규화한 시간)이 되어 주마다 비교할 수 있습니다.
+
+마지막 측정은 <캐시 디렉토리>/calibration.json 에 저장합니다. (--resume 으로 이어서 실행할 때 사용합니다)
+기준 값을 기준 머신에서 다시 재려면: python scripts/speed_calibration.py --write-baseline --origin "<기준 머신 설명>"
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from jvm_startup import get_java_version
+from process_runner import run_measured
+from resource_limits import ResourceProfile
+
+CALIBRATION_SOURCE = Path(__file__).resolve().parent / 'java' / 'SpeedCalibration.java'
+CALIBRATION_CLASS = 'SpeedCalibration'
+
+CALIBRATION_FILE = 'calibration.json'
+
+# 저장소에 커밋한 기준 머신의 측정값
+REFERENCE_BASELINE_FILE = Path(__file__).resolve().parent / 'calibration_baseline.json'
+
+# 저장 형식이 바뀌면 올려서 이전 측정을 사용하지 않게 합니다.
+CALIBRATION_FORMAT_VERSION = 2
+
+# 기준 작업을 실행하는 횟수 (중앙값을 사용합니다)
+CALIBRATION_RUNS = 3
+
+# 기준 작업 한 번의 제한 시간 (초)
+CALIBRATION_TIMEOUT_SECONDS = 60
+
+# 보정 계수의 허용 범위. 측정이 크게 잘못되어도 환산한 시간과 시간 제한이 터무니없이 바뀌지 않게 합니다.
+MIN_FACTOR = 0.5
+MAX_FACTOR = 4.0
+
+# 시간 제한에 곱하는 계수의 단위와 하한
+LIMIT_FACTOR_STEP = 0.25
+MIN_LIMIT_FACTOR = 1.0
+
+
+def _compile_workload(build_dir):
+    result = subprocess.run(['javac', '-encoding', 'UTF-8', '-d', build_dir, str(CALIBRATION_SOURCE)],
+                            capture_output=True, text=True, timeout=CALIBRATION_TIMEOUT_SECONDS)
+    if result.returncode != 0:
+        raise RuntimeError(f"기준 작업 컴파일 실패: {(result.stderr or result.stdout)[:500]}")
+
+
+def measure_reference_workload(runs=CALIBRATION_RUNS):
+    """기준 작업을 runs 번 실행하여 {'jvm_startup': 초, 'kernel': 초} (각각 중앙값) 을 반환합니다."""
+    build_dir = tempfile.mkdtemp(prefix='calibration_')
+    try:
+        try:
+            _compile_workload(build_dir)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise RuntimeError(f"기준 작업 컴파일 실패: {e}")
+        base_cmd = ['java', *ResourceProfile(cap_address_space=False).jvm_options(), '-cp', build_dir,
+                    CALIBRATION_CLASS]
+        startups, kernels = [], []
+        for _ in range(runs):
+            # 시작 시간과 작업 시간을 번갈아 재서 측정 중의 부하 변화가 한쪽에만 몰리지 않게 합니다.
+            outcome = run_measured([*base_cmd, 'startup'], b'', CALIBRATION_TIMEOUT_SECONDS)
+            if outcome.returncode != 0:
+                raise RuntimeError(f"JVM 시작 실패: {outcome.stderr.decode('utf-8', errors='replace')[:500]}")
+            startups.append(outcome.wall_time)
+            outcome = run_measured(base_cmd, b'', CALIBRATION_TIMEOUT_SECONDS)
+            fields = outcome.stdout.decode('ascii', errors='replace').split()
+            if outcome.returncode != 0 or len(fields) != 3 or fields[0] != 'KERNEL':
+                raise RuntimeError(f"기준 작업 실행 실패: {outcome.stderr.decode('utf-8', errors='replace')[:500]}")
+            kernels.append(int(fields[1]) / 1e9)
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return {'jvm_startup': statistics.median(startups), 'kernel': statistics.median(kernels), 'runs': runs}
+
+
+def java_major_version(version_text):
+    """java -version 출력의 첫 줄에서 주 버전(예: '11')을 반환합니다. 찾지 못하면 None 을 반환합니다."""
+    match = re.search(r'(\d+)(?:\.(\d+))?', version_text.splitlines()[0]) if version_text else None
+    if match is None:
+        return None
+    # 1.8 이하는 두 번째 숫자가 주 버전입니다.
+    return match.group(2) if match.group(1) == '1' and match.group(2) else match.group(1)
+
+
+def load_reference_baseline(path=REFERENCE_BASELINE_FILE):
+    """저장소에 커밋한 기준 값을 읽습니다. 파일이 없으면 None 을 반환합니다.
+
+    형식이 맞지 않거나 --write-baseline 으로 잰 값이 아니면(measured_at 이 없으면) RuntimeError 를 일으킵니다.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RuntimeError(f"기준 값 파일을 읽을 수 없습니다: {e}")
+    if not isinstance(baseline, dict) or not all(
+            isinstance(baseline.get(key), (int, float)) and baseline[key] > 0 for key in ('jvm_startup', 'kernel')):
+        raise RuntimeError(f"기준 값 파일 형식이 올바르지 않습니다: {path}")
+    if not baseline.get('measured_at'):
+        raise RuntimeError(f"기준 머신에서 잰 기준 값이 아닙니다 (measured_at 없음): {path}")
+    baseline.setdefault('origin', str(path))
+    return baseline
+
+
+def compute_calibration(measurement, baseline):
+    """측정값과 기준 값으로 보정 계수를 계산합니다."""
+    startup_ratio = measurement['jvm_startup'] / baseline['jvm_startup']
+    kernel_ratio = measurement['kernel'] / baseline['kernel']
+    factor = min(MAX_FACTOR, max(MIN_FACTOR, math.sqrt(startup_ratio * kernel_ratio)))
+    limit_factor = max(MIN_LIMIT_FACTOR, round(factor / LIMIT_FACTOR_STEP) * LIMIT_FACTOR_STEP)
+    return {
+        'factor': factor, 'limit_factor': limit_factor,
+        'jvm_startup': measurement['jvm_startup'], 'kernel': measurement['kernel'],
+        'jvm_startup_ratio': startup_ratio, 'kernel_ratio': kernel_ratio,
+        'baseline': baseline,
+    }
+
+
+def normalize_seconds(seconds, factor):
+    """이 머신에서 잰 시간을 기준 머신에서의 시간으로 환산합니다."""
+    if seconds is None or not factor:
+        return seconds
+    return seconds / factor
+
+
+class SpeedCalibrator:
+    """커밋한 기준 값으로 이 머신의 보정 계수를 구하고, 마지막 측정을 <캐시 디렉토리>/calibration.json 에 저장합니다."""
+
+    def __init__(self, cache_dir, baseline):
+        self.path = Path(cache_dir) / CALIBRATION_FILE
+        self.baseline = baseline
+        self.data = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict) or data.get('format') != CALIBRATION_FORMAT_VERSION:
+            data = {'format': CALIBRATION_FORMAT_VERSION}
+        return data
+
+    def _save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix=f'.{self.path.name}_', dir=self.path.parent)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ 속도 보정 기록 저장 실패: {e}")
+
+    def calibrate(self, reuse_last=False, measure=measure_reference_workload):
+        """보정 결과(dict)를 반환합니다. java 가 없거나 측정에 실패하면 RuntimeError 를 일으킵니다.
+
+        reuse_last 가 참이면 (같은 JDK 와 같은 기준 값으로 잰) 마지막 측정을 다시 사용합니다. (--resume 으로 이어서
+        실행할 때 시간 제한과 러너 버전이 처음 실행과 같도록 하기 위함입니다)
+        결과의 baseline 에는 기준 값과 그 출처(origin)가 들어 있고, 기준 값을 잰 JDK 와 주 버전이 다르면
+        baseline_jdk_mismatch 가 참입니다. (JDK 차이도 속도 차이로 섞여 들어갑니다)
+        """
+        java_version = get_java_version()
+        if java_version is None:
+            raise RuntimeError("java 를 찾을 수 없습니다.")
+        version_key = java_version.splitlines()[0]
+        last = self.data.get('last')
+        if (reuse_last and last is not None and last.get('java_version') == version_key
+                and last.get('baseline') == self.baseline):
+            return {**last, 'reused': True}
+        measurement = measure()
+        calibration = compute_calibration(measurement, self.baseline)
+        calibration['java_version'] = version_key
+        baseline_major = self.baseline.get('java_version')
+        calibration['baseline_jdk_mismatch'] = bool(baseline_major) and \
+            java_major_version(java_version) != str(baseline_major)
+        self.data['last'] = calibration
+        self._save()
+        return calibration
+
+
+def write_reference_baseline(origin, path=REFERENCE_BASELINE_FILE, runs=CALIBRATION_RUNS):
+    """이 머신에서 기준 작업을 재서 기준 값 파일을 만듭니다. (기준 머신에서 실행하고 결과를 커밋합니다)"""
+    java_version = get_java_version()
+    if java_version is None:
+        raise RuntimeError("java 를 찾을 수 없습니다.")
+    measurement = measure_reference_workload(runs)
+    baseline = {
+        'origin': origin, 'java_version': java_major_version(java_version),
+        'java_version_text': java_version.splitlines()[0],
+        'jvm_startup': round(measurement['jvm_startup'], 4), 'kernel': round(measurement['kernel'], 4),
+        'runs': runs, 'measured_at': time.strftime('%Y-%m-%dT%H:%M:%S%z')
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description='머신 속도 보정 기준 값 확인 및 측정')
+    parser.add_argument('--write-baseline', action='store_true',
+                        help='이 머신에서 기준 작업을 재서 scripts/calibration_baseline.json 을 만듭니다')
+    parser.add_argument('--origin', help='기준 값의 출처 설명 (예: "GitHub Actions ubuntu-latest, Temurin 11")')
+    parser.add_argument('--runs', type=int, default=CALIBRATION_RUNS * 3, help='기준 작업 실행 횟수')
+    args = parser.parse_args()
+
+    if args.write_baseline:
+        if not args.origin:
+            parser.error('--write-baseline 에는 --origin 이 필요합니다')
+        baseline = write_reference_baseline(args.origin, runs=max(1, args.runs))
+        print(f"💾 기준 값 저장: {REFERENCE_BASELINE_FILE}")
+    else:
+        baseline = load_reference_baseline()
+        if baseline is None:
+            print(f"⚠️ 기준 값 파일이 없습니다: {REFERENCE_BASELINE_FILE}")
+            return
+    print(f"📏 기준 값 ({baseline['origin']}): JVM 시작 {baseline['jvm_startup']:.3f}초, "
+          f"CPU 작업 {baseline['kernel']:.3f}초")
+
+
+if __name__ == '__main__':
+    main()
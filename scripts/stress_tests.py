@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+scripts/stress_tests.py
+생성기 스크립트 + 시드로 표현되는 대용량(스트레스) 테스트케이스 지원
+
+스트레스 테스트케이스 형식:
+    {"type": "stress", "generator": "<Python 코드>", "seed": 1, "description": "..."}
+
+생성기는 sys.argv[1] 로 시드를 받아 입력 전체를 표준 출력으로 내보냅니다.
+생성기는 LLM 이 만든 코드이므로 토큰 등 러너의 환경 변수를 넘기지 않고, 풀이와 같은 자원 상한(prlimit)과
+출력 크기 상한 아래에서 실행합니다.
+입력은 메모리에 올리지 않고 파일로 받아 풀이의 표준 입력에 연결하며,
+예상 출력은 참고 풀이(references/<문제번호>/*.java) 또는 같은 문제를 푼 다른 참가자 풀이들의 다수결로 만듭니다.
+"""
+
+import glob
+import hashlib
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+from output_compare import iter_lines_from_file, iter_records
+from process_runner import run_measured
+from resource_limits import ResourceProfile
+
+STRESS_TEST_TYPE = 'stress'
+
+# 문제별 참고(정답) 풀이를 두는 디렉토리
+REFERENCE_DIR = 'references'
+
+# 생성기 한 번 실행의 제한 시간 (초)
+GENERATOR_TIMEOUT_SECONDS = 30
+
+# Gemini가 만든 생성기 코드의 최대 크기 (바이트)
+MAX_GENERATOR_SOURCE_BYTES = 64 * 1024
+
+# 생성기가 만들 수 있는 입력의 최대 크기 (바이트). 작업 디렉토리(tmpfs)를 가득 채우지 않도록 넘으면 바로 종료합니다.
+MAX_GENERATED_INPUT_BYTES = 256 * 1024 * 1024
+
+# 생성기에 넘기는 환경 변수. 러너의 환경(GEMINI_API_KEY, GITHUB_TOKEN 등)은 넘기지 않습니다.
+# 같은 시드는 항상 같은 입력을 만들도록 해시 시드를 고정합니다.
+GENERATOR_ENV = {'PYTHONHASHSEED': '0', 'PYTHONIOENCODING': 'utf-8', 'LANG': 'C.UTF-8', 'PATH': os.defpath}
+
+# 참고 풀이가 없을 때 다수결에 사용할 다른 참가자 풀이 수 (이 수의 과반, 최소 두 풀이의 출력이 같아야 합니다)
+CONSENSUS_SIZE = 3
+
+
+def is_stress_test(test_case):
+    """생성기로 입력을 만드는 스트레스 테스트인지 확인합니다."""
+    return test_case.get('type') == STRESS_TEST_TYPE
+
+
+def run_generator(generator_source, seed, work_dir, timeout=GENERATOR_TIMEOUT_SECONDS, profile=None,
+                  output_limit=MAX_GENERATED_INPUT_BYTES):
+    """생성기를 실행하여 입력 파일 경로를 반환합니다. 실패하면 RuntimeError 를 발생시킵니다.
+
+    profile(ResourceProfile)의 prlimit 상한을 적용하며, 없으면 기본 프로필을 사용합니다.
+    """
+    if profile is None:
+        profile = ResourceProfile()
+    source_hash = hashlib.sha256(generator_source.encode('utf-8')).hexdigest()[:12]
+    generator_path = os.path.join(work_dir, f'gen_{source_hash}.py')
+    if not os.path.exists(generator_path):
+        with open(generator_path, 'w', encoding='utf-8') as f:
+            f.write(generator_source)
+    input_path = os.path.join(work_dir, f'input_{source_hash}_{seed}.txt')
+    cmd = [*profile.command_prefix(), sys.executable, generator_path, str(seed)]
+    env = {**GENERATOR_ENV, 'HOME': work_dir}
+    with open(input_path, 'wb') as out:
+        outcome = run_measured(cmd, b'', timeout, stdout_sink=out.write, output_limit=output_limit, env=env,
+                               cwd=work_dir)
+    if outcome.timed_out or outcome.output_exceeded or outcome.returncode != 0:
+        os.remove(input_path)
+    if outcome.timed_out:
+        raise RuntimeError(f"생성기 실행 시간 초과 ({timeout}초)")
+    if outcome.output_exceeded:
+        raise RuntimeError(f"생성기 출력 크기 초과 ({output_limit // (1024 * 1024)}MB)")
+    if outcome.returncode != 0:
+        error = outcome.stderr.decode('utf-8', errors='replace').strip()
+        raise RuntimeError(f"생성기 실행 실패: {error or outcome.returncode}")
+    return input_path
+
+
+def find_reference_solutions(problem_id, code_file, root='.'):
+    """참고 풀이 목록과 참고 풀이 여부를 반환합니다.
+
+    references/<문제번호>/*.java 가 있으면 그것만 사용하고(신뢰),
+    없으면 같은 문제를 푼 다른 참가자의 풀이(<작성자>/<문제번호>/*.java, <작성자>/<문제번호>.java)를 사용합니다.
+    """
+    references = sorted(glob.glob(os.path.join(root, REFERENCE_DIR, str(problem_id), '*.java')))
+    if references:
+        return references, True
+    own = os.path.abspath(code_file)
+    peers = set(glob.glob(os.path.join(root, '*', str(problem_id), '*.java')))
+    peers.update(glob.glob(os.path.join(root, '*', f'{problem_id}.java')))
+    peers = sorted(
+        path for path in peers
+        if os.path.abspath(path) != own and Path(os.path.relpath(path, root)).parts[0] not in ('scripts', REFERENCE_DIR)
+    )
+    return peers, False
+
+
+def output_fingerprint(output_path):
+    """비교 규칙(줄 앞뒤 공백, 앞뒤 빈 줄 무시)을 적용한 출력 파일의 해시"""
+    digest = hashlib.sha256()
+    for _, blanks, stripped in iter_records(iter_lines_from_file(output_path)):
+        digest.update(b'\n' * blanks + stripped + b'\n')
+    return digest.hexdigest()
+
+
+class ReferenceOracle:
+    """스트레스 테스트 입력에 대한 예상 출력을 만드는 참고 풀이 모음
+
+    run_solution(code_dir, class_name, input_path, output_path) 는 풀이를 실행해 출력을 파일로 저장하고
+    정상 종료 여부를 반환해야 합니다.
+    """
+
+    def __init__(self, solutions, trusted, run_solution):
+        self.solutions = list(solutions)
+        self.trusted = trusted
+        self.run_solution = run_solution
+
+    def describe(self):
+        if not self.solutions:
+            return "참고 풀이 없음"
+        kind = "참고 풀이" if self.trusted else "다른 참가자 풀이 다수결"
+        return f"{kind} {len(self.solutions)}개"
+
+    def expected_output(self, input_path):
+        """(예상 출력 파일 경로 또는 None, 설명) 을 반환합니다. 출력 파일은 입력 파일 옆에 만듭니다."""
+        candidates = self.solutions[:1] if self.trusted else self.solutions[:CONSENSUS_SIZE]
+        outputs = {}
+        for index, (code_dir, class_name) in enumerate(candidates):
+            output_path = f'{input_path}.ref{index}.out'
+            if self.run_solution(code_dir, class_name, input_path, output_path):
+                outputs[output_path] = output_fingerprint(output_path)
+        if not outputs:
+            return None, "참고 풀이 실행 실패"
+        if self.trusted:
+            return next(iter(outputs)), "참고 풀이"
+        # 신뢰할 수 있는 참고 풀이가 없으면, 실행에 성공한 풀이 수가 아니라 CONSENSUS_SIZE 기준의 과반이
+        # (그리고 적어도 두 풀이가) 같은 출력을 내야 예상 출력으로 인정합니다.
+        # 다른 풀이가 실패했다고 풀이 하나의 출력을 정답으로 삼지 않기 위함입니다.
+        votes = Counter(outputs.values())
+        fingerprint, count = votes.most_common(1)[0]
+        if count < 2 or count * 2 <= CONSENSUS_SIZE:
+            return None, f"참고 풀이 출력 합의 부족 ({len(outputs)}개 실행, 최다 일치 {count}개)"
+        chosen = next(path for path, value in outputs.items() if value == fingerprint)
+        return chosen, f"다수결 {count}/{len(outputs)}"
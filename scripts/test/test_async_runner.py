@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+test/test_async_runner.py
+asyncio 기반 프로세스 실행 코어를 테스트하는 코드
+"""
+
+import unittest
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from async_runner import run_measured_async
+from process_runner import STDERR_RETAIN_BYTES, run_measured
+
+
+class TestAsyncRunner(unittest.TestCase):
+    """비동기 실행 코어 테스트"""
+
+    def test_streams_stdin_and_stdout(self):
+        chunks = []
+        data = b"0123456789" * 50000
+        outcome = asyncio.run(run_measured_async(['cat'], data, 5, stdout_sink=chunks.append))
+        self.assertEqual(outcome.returncode, 0)
+        self.assertEqual(b''.join(chunks), data)
+        self.assertFalse(outcome.timed_out)
+
+    def test_memory_input_is_attached_as_file_descriptor(self):
+        """메모리 입력은 파이프가 아니라 탐색 가능한 파일(memfd)로 연결됩니다"""
+        data = b"\xea\xb0\x80" * 1000000
+        for run in (run_measured, lambda *args, **kwargs: asyncio.run(run_measured_async(*args, **kwargs))):
+            outcome = run(['sh', '-c', 'wc -c; test -p /dev/stdin && echo pipe || echo file'], data, timeout=5)
+            self.assertEqual(outcome.stdout.split(), [str(len(data)).encode(), b'file'])
+
+    def test_stdin_from_file(self):
+        with tempfile.NamedTemporaryFile(suffix='.in') as f:
+            f.write(b"from file\n")
+            f.flush()
+            outcome = asyncio.run(run_measured_async(['cat'], timeout=5, stdin_path=f.name))
+        self.assertEqual(outcome.stdout, b"from file\n")
+
+    def test_timeout_kills_process(self):
+        start = time.time()
+        outcome = asyncio.run(run_measured_async(['sleep', '10'], timeout=0.3))
+        self.assertTrue(outcome.timed_out)
+        self.assertLess(time.time() - start, 5)
+
+    def test_cancellation_kills_process(self):
+        async def cancel_soon():
+            task = asyncio.ensure_future(run_measured_async(['sleep', '10'], timeout=30))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        start = time.time()
+        asyncio.run(cancel_soon())
+        self.assertLess(time.time() - start, 5)
+
+    def test_output_limit_kills_runaway_process(self):
+        """출력 제한을 넘으면 제한 시간을 기다리지 않고 종료하며, 보관하는 출력은 제한 이하입니다"""
+        for run in (run_measured, lambda *args, **kwargs: asyncio.run(run_measured_async(*args, **kwargs))):
+            start = time.time()
+            outcome = run(['yes'], timeout=30, output_limit=1 << 20)
+            self.assertTrue(outcome.output_exceeded)
+            self.assertFalse(outcome.timed_out)
+            self.assertLessEqual(len(outcome.stdout), 1 << 20)
+            self.assertLess(time.time() - start, 5)
+
+            outcome = run(['sh', '-c', 'head -c 100000 /dev/zero >&2'], timeout=5, output_limit=1 << 20)
+            self.assertFalse(outcome.output_exceeded)
+            self.assertEqual(len(outcome.stderr), STDERR_RETAIN_BYTES)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
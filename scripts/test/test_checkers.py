@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+test/test_checkers.py
+문제별 채점기와 허용 오차 감지를 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from checkers import create_checker, detect_checker_spec
+
+
+class TestDetectCheckerSpec(unittest.TestCase):
+    """문제 설명에서 허용 오차 감지 테스트"""
+
+    def test_absolute_and_relative(self):
+        spec = detect_checker_spec("정답과의 절대/상대 오차는 10-9까지 허용한다.")
+        self.assertEqual(spec, {'type': 'float', 'abs_eps': 1e-9, 'rel_eps': 1e-9})
+
+    def test_caret_notation(self):
+        spec = detect_checker_spec("절대 오차 또는 상대 오차가 10^-6 이하이면 정답이다.")
+        self.assertAlmostEqual(spec['abs_eps'], 1e-6)
+        self.assertAlmostEqual(spec['rel_eps'], 1e-6)
+
+    def test_relative_only(self):
+        spec = detect_checker_spec("상대 오차 10<sup>-2</sup>까지 허용")
+        self.assertEqual(spec['abs_eps'], 0.0)
+        self.assertAlmostEqual(spec['rel_eps'], 1e-2)
+
+    def test_english(self):
+        spec = detect_checker_spec("Answers with absolute or relative error at most 1e-4 are accepted.")
+        self.assertAlmostEqual(spec['abs_eps'], 1e-4)
+
+    def test_no_tolerance(self):
+        self.assertIsNone(detect_checker_spec("첫째 줄에 A+B를 출력한다."))
+        self.assertIsNone(detect_checker_spec(None))
+
+
+class TestCheckers(unittest.TestCase):
+    """채점기 비교 테스트"""
+
+    def test_default_is_line_exact(self):
+        checker = create_checker(None)
+        self.assertTrue(checker.check("1 2\n3", "1 2  \n3\n"))
+        self.assertFalse(checker.check("1 2\n3", "1 2 3"))
+
+    def test_token(self):
+        checker = create_checker('token')
+        self.assertTrue(checker.check("1 2\n3", "1\n2   3\n"))
+        self.assertFalse(checker.check("1 2 3", "1 2"))
+
+    def test_token_split_across_chunks(self):
+        session = create_checker('token').open({'output': "123 456"})
+        for chunk in (b"1", b"23", b" 4", b"5", b"6\n"):
+            session.feed(chunk)
+        self.assertTrue(session.finish())
+
+    def test_float(self):
+        checker = create_checker({'type': 'float', 'abs_eps': 1e-6, 'rel_eps': 0})
+        self.assertTrue(checker.check("0.3333333333", "0.333333"))
+        self.assertFalse(checker.check("0.3333333333", "0.3333"))
+        self.assertFalse(checker.check("nan", "0"))
+
+    def test_float_relative(self):
+        checker = create_checker({'type': 'float', 'abs_eps': 0, 'rel_eps': 1e-6})
+        self.assertTrue(checker.check("1000000000", "1000000500"))
+        self.assertFalse(checker.check("1", "1.00001"))
+
+    def test_unordered(self):
+        checker = create_checker('unordered')
+        self.assertTrue(checker.check("a\nb\nb", "b\na\nb\n"))
+        self.assertFalse(checker.check("a\nb\nb", "a\nb"))
+
+    def test_unknown_checker(self):
+        with self.assertRaises(ValueError):
+            create_checker('nope')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+test/test_checkpoint_journal.py
+체크포인트 저널 기록과 이어서 실행하기를 테스트하는 코드
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from checkpoint_journal import CheckpointJournal
+from result_records import Payload, TestRecord
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    """체크포인트 저널 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='checkpoint_test_')
+        self.path = os.path.join(self.work_dir, 'journal.jsonl')
+        self.code_file = os.path.join(self.work_dir, 'Main.java')
+        with open(self.code_file, 'w', encoding='utf-8') as f:
+            f.write('class Main {}\n')
+        self.problem = {'problem_id': '1000', 'author': 'alice', 'code_file': self.code_file}
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write_journal(self):
+        journal = CheckpointJournal(self.path, 'v1')
+        checkpoint = journal.for_problem(self.problem)
+        record = TestRecord('샘플 1', 'WA', error='출력 불일치', execution_time=0.5,
+                            input=Payload.from_text('1 2\n'), actual=Payload.from_text('x' * 1000))
+        checkpoint.record_test('샘플', {'input': '1 2\n', 'output': '3\n', 'input_file': '/tmp/a.in'}, record)
+        checkpoint.record_test_set('digest')
+        checkpoint.record_result({'problem_id': '1000', 'result': 'FAIL'})
+        journal.close()
+
+    def test_resume_restores_tests_and_results(self):
+        """이어서 실행하면 기록된 테스트와 문제 결과를 돌려줍니다 (입력 파일 경로가 달라도 같은 테스트)"""
+        self.write_journal()
+        journal = CheckpointJournal(self.path, 'v1', resume=True)
+        checkpoint = journal.for_problem(self.problem)
+        record = checkpoint.completed_test('샘플', {'input': '1 2\n', 'output': '3\n', 'input_file': '/tmp/b.in'})
+        journal.close()
+
+        self.assertIsInstance(record, TestRecord)
+        self.assertEqual((record['verdict'], record['execution_time']), ('WA', 0.5))
+        self.assertEqual(record.actual.size, 1000)
+        self.assertTrue(record.actual.truncated)
+        self.assertIsNone(checkpoint.completed_test('샘플', {'input': '1 2\n', 'output': '4\n'}))
+        self.assertIsNone(checkpoint.completed_test('생성', {'input': '1 2\n', 'output': '3\n'}))
+        self.assertTrue(checkpoint.test_set_ready('digest'))
+        self.assertEqual(checkpoint.completed_result()['result'], 'FAIL')
+
+    def test_changed_source_or_runner_is_not_resumed(self):
+        """소스나 러너 버전이 바뀌면 기록을 사용하지 않고, 새로 시작하면 이전 기록을 지웁니다"""
+        self.write_journal()
+        with open(self.code_file, 'a', encoding='utf-8') as f:
+            f.write('// changed\n')
+        journal = CheckpointJournal(self.path, 'v1', resume=True)
+        self.assertIsNone(journal.for_problem(self.problem).completed_result())
+        journal.close()
+
+        journal = CheckpointJournal(self.path, 'v2', resume=True)
+        self.assertEqual(journal.problems, {})
+        journal.close()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    def test_truncated_last_line_and_errors(self):
+        """쓰다 끊긴 마지막 줄은 무시하고, ERROR 결과는 완료로 기록하지 않습니다"""
+        self.write_journal()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"kind": "pro')
+        journal = CheckpointJournal(self.path, 'v1', resume=True)
+        other = journal.for_problem({**self.problem, 'problem_id': '1001'})
+        other.record_result({'problem_id': '1001', 'result': 'ERROR'})
+        journal.close()
+
+        journal = CheckpointJournal(self.path, 'v1', resume=True)
+        self.assertEqual(len(journal.problems), 1)
+        self.assertIsNone(journal.for_problem({**self.problem, 'problem_id': '1001'}).completed_result())
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
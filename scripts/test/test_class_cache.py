@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+test/test_class_cache.py
+소스 해시, javac 버전, 컴파일 옵션을 키로 하는 컴파일된 클래스 캐시를 테스트하는 코드
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from class_cache import CompiledClassCache
+
+
+class TestCompiledClassCache(unittest.TestCase):
+    """클래스 캐시 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='class_cache_test_')
+        self.cache_dir = os.path.join(self.work_dir, 'cache')
+        self.source = os.path.join(self.work_dir, 'Main.java')
+        self.write_source('public class Main {}')
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write_source(self, text):
+        with open(self.source, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def make_cache(self, javac_version='javac 17.0.9', flags=('-encoding', 'UTF-8')):
+        return CompiledClassCache(self.cache_dir, javac_version, flags)
+
+    def compiled_dir(self, name):
+        """클래스 파일 두 개(중첩 클래스 포함)와 클래스가 아닌 파일이 있는 컴파일 결과 디렉토리를 만듭니다."""
+        output_dir = Path(self.work_dir) / name
+        (output_dir / 'pkg').mkdir(parents=True)
+        (output_dir / 'Main.class').write_bytes(b'\xca\xfe\xba\xbe main')
+        (output_dir / 'pkg' / 'Main$Inner.class').write_bytes(b'\xca\xfe\xba\xbe inner')
+        (output_dir / 'input.txt').write_text('not a class')
+        return output_dir
+
+    def test_key_depends_on_source_javac_version_and_flags(self):
+        cache = self.make_cache()
+        key = cache.key_for(self.source)
+        self.assertEqual(key, self.make_cache().key_for(self.source))
+        self.assertNotEqual(key, self.make_cache(javac_version='javac 21.0.1').key_for(self.source))
+        self.assertNotEqual(key, self.make_cache(flags=('-encoding', 'UTF-8', '-g')).key_for(self.source))
+        self.write_source('public class Main { }')
+        self.assertNotEqual(key, cache.key_for(self.source))
+
+    def test_store_then_restore_copies_only_class_files(self):
+        cache = self.make_cache()
+        key = cache.key_for(self.source)
+        restored = Path(self.work_dir) / 'restored'
+        self.assertFalse(cache.restore(key, restored))
+
+        cache.store(key, self.compiled_dir('compiled'))
+        self.assertTrue(cache.restore(key, restored))
+        self.assertEqual((restored / 'Main.class').read_bytes(), b'\xca\xfe\xba\xbe main')
+        self.assertEqual((restored / 'pkg' / 'Main$Inner.class').read_bytes(), b'\xca\xfe\xba\xbe inner')
+        self.assertFalse((restored / 'input.txt').exists())
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1})
+
+    def test_existing_entry_is_not_overwritten_and_no_staging_is_left(self):
+        """같은 키를 다시 저장해도 기존 항목을 유지하고, 임시 디렉토리를 남기지 않습니다"""
+        cache = self.make_cache()
+        key = cache.key_for(self.source)
+        cache.store(key, self.compiled_dir('first'))
+        second = self.compiled_dir('second')
+        (second / 'Main.class').write_bytes(b'other')
+        cache.store(key, second)
+
+        restored = Path(self.work_dir) / 'restored'
+        cache.restore(key, restored)
+        self.assertEqual((restored / 'Main.class').read_bytes(), b'\xca\xfe\xba\xbe main')
+        self.assertEqual(os.listdir(Path(self.cache_dir) / 'classes' / key[:2]), [key])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+test/test_cost_model.py
+테스트 소요 시간 예측과 실행 순서 결정을 테스트하는 코드
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from cost_model import (
+    DEFAULT_STRESS_SECONDS, ESTIMATE_HISTORY, ESTIMATE_SIZE, TestCostModel, simulate_makespan
+)
+
+
+class TestCostModelScheduling(unittest.TestCase):
+    """소요 시간 예측 테스트"""
+
+    def setUp(self):
+        self.history_dir = tempfile.mkdtemp(prefix='cost_model_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.history_dir, ignore_errors=True)
+
+    def test_simulate_makespan(self):
+        self.assertAlmostEqual(simulate_makespan([1, 1, 1, 3], 2), 4)
+        self.assertAlmostEqual(simulate_makespan([3, 1, 1, 1], 2), 3)
+        self.assertEqual(simulate_makespan([], 4), 0.0)
+
+    def test_longest_first_by_input_size(self):
+        model = TestCostModel(None, '1000')
+        cases = [{'input': '1'}, {'input': 'x' * (8 << 20)}, {'type': 'stress', 'generator': 'print(1)'}]
+        order, schedule = model.plan(cases, 2)
+        self.assertEqual(order[0], 1 if model.estimate(cases[1])[0] > DEFAULT_STRESS_SECONDS else 2)
+        self.assertEqual(order[-1], 0)
+        self.assertEqual(schedule['estimated_from_size'], 3)
+        self.assertLessEqual(schedule['predicted_makespan'], schedule['naive_predicted_makespan'])
+
+    def test_history_overrides_size_and_persists(self):
+        model = TestCostModel(self.history_dir, '1000')
+        short, slow, unseen = {'input': 'x' * 1000}, {'input': '1'}, {'input': '2'}
+        model.record(short, 0.1)
+        model.record(slow, 4.0)
+        model.record(slow, 2.0)
+        model.save()
+
+        reloaded = TestCostModel(self.history_dir, '1000')
+        self.assertEqual(reloaded.estimate(slow), (3.0, ESTIMATE_HISTORY))
+        self.assertEqual(reloaded.estimate(unseen)[1], ESTIMATE_SIZE)
+        order, schedule = reloaded.plan([short, slow, unseen], 2)
+        self.assertEqual(order[0], 1)
+        self.assertEqual(schedule['estimated_from_history'], 2)
+
+    def test_history_is_stored_in_reference_machine_time(self):
+        slow_machine = TestCostModel(self.history_dir, '1000', speed_factor=2.0)
+        slow_machine.record({'input': '1'}, 4.0)
+        slow_machine.save()
+
+        fast_machine = TestCostModel(self.history_dir, '1000', speed_factor=0.5)
+        self.assertEqual(fast_machine.estimate({'input': '1'}), (1.0, ESTIMATE_HISTORY))
+
+    def test_description_and_staged_file_do_not_change_key(self):
+        model = TestCostModel(None, '1000')
+        model.record({'input': '5', 'description': '예제 1'}, 1.5)
+        self.assertEqual(model.estimate({'input': '5', 'description': '다른 설명'}), (1.5, ESTIMATE_HISTORY))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
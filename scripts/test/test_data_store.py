@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+test/test_data_store.py
+압축된 파일 테스트 데이터를 스트리밍으로 읽는 기능을 테스트하는 코드
+"""
+
+import unittest
+import gzip
+import lzma
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+import data_store
+from checkers import ExactChecker, TokenChecker
+from data_store import StreamedInput, load_data_tests, take_decompression_stats
+from result_records import Payload, PayloadBuilder
+
+
+class TestDataStore(unittest.TestCase):
+    """파일 테스트 데이터 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='data_store_test_')
+        self.data_dir = os.path.join(self.work_dir, '1000')
+        os.makedirs(self.data_dir)
+        self.original_dir = data_store.TEST_DATA_DIR
+        data_store.TEST_DATA_DIR = self.work_dir
+
+    def tearDown(self):
+        data_store.TEST_DATA_DIR = self.original_dir
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write(self, name, data, opener=open):
+        path = os.path.join(self.data_dir, name)
+        with opener(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_load_pairs_inputs_with_outputs(self):
+        """입력과 예상 출력은 압축 형식과 관계없이 이름으로 짝지어지고, 예상 출력이 없으면 출력을 확인하지 않습니다"""
+        self.write('a.in.gz', b'1 2\n', gzip.open)
+        self.write('a.out.xz', b'3\n', lzma.open)
+        self.write('b.in', b'5\n')
+        self.write('notes.txt', b'ignored')
+
+        tests = load_data_tests('1000')
+
+        self.assertEqual([t['data'] for t in tests], ['a', 'b'])
+        self.assertTrue(tests[0]['output_file'].endswith('a.out.xz'))
+        self.assertTrue(tests[1]['no_expected'])
+        self.assertEqual(Payload.from_file(tests[0]['output_file']).sha256, Payload.from_bytes(b'3\n').sha256)
+
+    def test_compressed_expected_output_streams_into_checkers(self):
+        """압축된 예상 출력을 조각 경계에 걸친 줄과 토큰까지 그대로 비교하고, 압축률과 압축 해제 시간을 집계합니다"""
+        expected = b''.join(b'%d %s\n' % (i, b'x' * (i % 50)) for i in range(20000))
+        path = self.write('big.out.gz', expected, gzip.open)
+        test_case = {'output_file': path}
+
+        for checker in (ExactChecker(), TokenChecker()):
+            session = checker.open(test_case)
+            for start in range(0, len(expected), 7777):
+                session.feed(expected[start:start + 7777])
+            self.assertTrue(session.finish(), checker.name)
+
+        session = ExactChecker().open(test_case)
+        session.feed(expected.replace(b'19999 ', b'19998 '))
+        self.assertFalse(session.finish())
+        del session
+
+        stats = take_decompression_stats([path])
+        self.assertEqual(stats['raw_bytes'], len(expected))
+        self.assertEqual(stats['compressed_bytes'], os.path.getsize(path))
+        self.assertGreater(stats['ratio'], 1)
+        self.assertEqual(stats['passes'], 3)
+        self.assertIsNone(take_decompression_stats(['plain.out']))
+
+    def test_streamed_input_does_not_block_on_early_exit(self):
+        """풀이가 입력 일부만 읽거나 전혀 열지 않아도 멈추지 않고, 입력 요약은 전체 내용으로 계산합니다"""
+        data = os.urandom(1 << 20).hex().encode('ascii')
+        path = self.write('big.in.xz', data, lzma.open)
+
+        builder = PayloadBuilder()
+        with StreamedInput(path, on_chunk=builder.feed) as stream:
+            with open(stream.path, 'rb') as stdin:
+                head = subprocess.run(['head', '-c', '10'], stdin=stdin, stdout=subprocess.PIPE, timeout=10).stdout
+        self.assertEqual(head, data[:10])
+        self.assertIsNone(stream.error)
+        self.assertEqual(builder.build().sha256, Payload.from_bytes(data).sha256)
+
+        builder = PayloadBuilder()
+        stream = StreamedInput(path, on_chunk=builder.feed)
+        stream.close()
+        self.assertEqual(builder.build().size, len(data))
+        self.assertFalse(os.path.exists(stream.work_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
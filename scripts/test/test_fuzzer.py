@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+test/test_fuzzer.py
+퍼징 루프와 반례 저장을 테스트하는 코드
+"""
+
+import unittest
+import json
+import os
+import sys
+import shutil
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from fuzzer import append_generated_test, find_fuzz_generator, fuzz
+
+
+class TestFuzzer(unittest.TestCase):
+    """퍼징 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_stops_at_first_failure(self):
+        report = fuzz(lambda seed: {'seed': seed} if seed >= 10 else None, 30, 4)
+        self.assertEqual(report['seed'], 10)
+        self.assertEqual(report['failure'], {'seed': 10})
+        self.assertGreaterEqual(report['cases'], 10)
+
+    def test_budget_without_failure(self):
+        report = fuzz(lambda seed: None, 0.2, 2, start_seed=5)
+        self.assertIsNone(report['seed'])
+        self.assertGreater(report['cases'], 0)
+
+    def test_append_generated_test(self):
+        path = os.path.join(self.work_dir, 'tests_1000.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'problem_id': '1000', 'test_cases': [{'input': '1 2', 'output': '3'}]}, f)
+        append_generated_test(path, '1000', {'input': '0 0', 'output': '0'})
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(len(data['test_cases']), 2)
+        self.assertEqual(data['total_generated'], 2)
+
+    def test_missing_generator(self):
+        self.assertIsNone(find_fuzz_generator('1000', root=self.work_dir))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
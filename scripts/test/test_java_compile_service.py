@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+test/test_java_compile_service.py
+여러 Java 소스를 하나의 컴파일러 프로세스로 묶어서 컴파일하는 서비스를 테스트하는 코드
+
+java 가 없어도 실행되도록 같은 규약으로 응답하는 파이썬 가짜 서비스를 띄워 검사하고,
+javac 가 있으면 실제 BatchJavaCompiler.java 로도 검사합니다.
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import threading
+from unittest import mock
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+import java_compile_service
+from java_compile_service import JavaCompileService
+
+# BatchJavaCompiler 와 같은 규약으로 응답하는 가짜 서비스.
+# 소스 파일 이름에 'broken' 이 있으면 컴파일 에러, 'die' 가 있으면 응답하지 않고 종료하고,
+# 'chatty' 가 있으면 파이프 버퍼보다 긴 진단 메시지를 보냅니다.
+FAKE_SERVICE = textwrap.dedent('''
+    import os, sys
+    sys.stdout.buffer.write(b"READY\\n")
+    sys.stdout.buffer.flush()
+    for line in sys.stdin:
+        parts = line.rstrip("\\n").split("\\t")
+        if len(parts) != 3 or parts[0] != "COMPILE":
+            continue
+        name = os.path.basename(parts[1])
+        if "die" in name:
+            os._exit(1)
+        body = ("%s: error: 컴파일 에러" % name).encode() if "broken" in name else b""
+        status = "FAIL" if body else "OK"
+        if "chatty" in name:
+            body = b"warning: " + b"x" * (256 * 1024)
+        sys.stdout.buffer.write(("RESULT %s %d\\n" % (status, len(body))).encode() + body)
+        sys.stdout.buffer.flush()
+''')
+
+
+class TestJavaCompileService(unittest.TestCase):
+    """가짜 서비스로 검사하는 컴파일 서비스 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='compile_service_test_')
+        self.fake_path = os.path.join(self.work_dir, 'fake_service.py')
+        with open(self.fake_path, 'w', encoding='utf-8') as f:
+            f.write(FAKE_SERVICE)
+        self.javac_calls = []
+        patcher = mock.patch.object(java_compile_service, 'compile_with_javac', self.fake_javac)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def fake_javac(self, source_file, output_dir, timeout=None):
+        self.javac_calls.append(os.path.basename(source_file))
+        return True, "javac"
+
+    def jobs(self, *names):
+        return [(os.path.join(self.work_dir, f'{name}.java'), os.path.join(self.work_dir, name)) for name in names]
+
+    def start_service(self, command=None):
+        service = JavaCompileService(command or [sys.executable, self.fake_path])
+        self.addCleanup(service.close)
+        return service
+
+    def test_batch_results_follow_request_order(self):
+        service = self.start_service()
+        outcomes = service.compile_batch(self.jobs('a', 'broken', 'c'))
+        self.assertEqual([ok for ok, _ in outcomes], [True, False, True])
+        self.assertIn('컴파일 에러', outcomes[1][1])
+        self.assertEqual(self.javac_calls, [])
+        # 서비스 프로세스는 다음 묶음에서도 재사용합니다.
+        process = service.process
+        service.compile_batch(self.jobs('d'))
+        self.assertIs(service.process, process)
+
+    def test_service_dying_mid_batch_falls_back_to_javac_for_unanswered_files(self):
+        """응답 도중 서비스가 죽으면 그 파일과 남은 파일은 javac 로 컴파일하고 컴파일 에러로 판정하지 않습니다"""
+        service = self.start_service()
+        outcomes = service.compile_batch(self.jobs('a', 'die', 'c'))
+        self.assertEqual(outcomes, [(True, ''), (True, 'javac'), (True, 'javac')])
+        self.assertEqual(self.javac_calls, ['die.java', 'c.java'])
+        self.assertIsNone(service.process)
+
+        # 다음 묶음은 새 서비스 프로세스로 컴파일합니다.
+        self.assertEqual(service.compile_batch(self.jobs('e')), [(True, '')])
+        self.assertEqual(self.javac_calls, ['die.java', 'c.java'])
+
+    def test_large_batch_with_long_replies_does_not_deadlock(self):
+        """요청과 응답이 모두 파이프 버퍼보다 커도 서로 기다리며 멈추지 않습니다"""
+        service = self.start_service()
+        jobs = self.jobs('chatty', *[f'file_{i:04d}_{"p" * 40}' for i in range(2000)])
+        outcomes = []
+        worker = threading.Thread(target=lambda: outcomes.extend(service.compile_batch(jobs)), daemon=True)
+        worker.start()
+        worker.join(20)
+        if worker.is_alive():
+            service.process.kill()
+            self.fail("컴파일 서비스와의 통신이 멈췄습니다")
+        self.assertEqual(len(outcomes), len(jobs))
+        self.assertTrue(all(ok for ok, _ in outcomes))
+        self.assertEqual(self.javac_calls, [])
+
+    def test_unavailable_service_compiles_every_file_with_javac(self):
+        with mock.patch('builtins.print'):
+            service = self.start_service([sys.executable, '-c', 'print("UNAVAILABLE")'])
+            outcomes = service.compile_batch(self.jobs('a', 'b'))
+        self.assertEqual(outcomes, [(True, 'javac'), (True, 'javac')])
+        self.assertFalse(service.available)
+
+
+@unittest.skipUnless(shutil.which('javac') and shutil.which('java'), "javac 가 필요합니다")
+class TestBatchJavaCompiler(unittest.TestCase):
+    """실제 BatchJavaCompiler.java 로 검사하는 컴파일 서비스 테스트"""
+
+    def test_compiles_valid_and_reports_invalid_sources(self):
+        work_dir = tempfile.mkdtemp(prefix='batch_compiler_test_')
+        self.addCleanup(shutil.rmtree, work_dir, True)
+        sources = {
+            'Main': 'public class Main { public static void main(String[] a) { System.out.println(1); } }',
+            'Broken': 'public class Broken { int x = ; }',
+        }
+        jobs = []
+        for name, source in sources.items():
+            source_dir = os.path.join(work_dir, name)
+            os.makedirs(source_dir)
+            path = os.path.join(source_dir, f'{name}.java')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(source)
+            jobs.append((path, os.path.join(source_dir, 'out')))
+
+        service = JavaCompileService()
+        self.addCleanup(service.close)
+        (main_ok, _), (broken_ok, message) = service.compile_batch(jobs)
+        self.assertTrue(service.available)
+        self.assertTrue(main_ok)
+        self.assertTrue(os.path.exists(os.path.join(work_dir, 'Main', 'out', 'Main.class')))
+        self.assertFalse(broken_ok)
+        self.assertIn('Broken.java', message)
+
+
+if __name__ == '__main__':
+    unittest.main()
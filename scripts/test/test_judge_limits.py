@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+test/test_judge_limits.py
+문제 제한사항 파싱과 BOJ 기준 자원 제한 프로필을 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from fetch_boj_problem import parse_limits
+from resource_limits import ResourceProfile, DEFAULT_TIMEOUT_SECONDS
+
+
+# BOJ 문제 페이지의 #problem-info 표 (시간 제한과 메모리 제한이 서로 다른 칸에 있습니다)
+PROBLEM_INFO_HTML = """
+<div class="table-responsive">
+<table class="table" id="problem-info">
+<thead>
+<tr>
+<th style="width:16%;">시간 제한</th>
+<th style="width:16%;">메모리 제한</th>
+<th style="width:17%;">제출</th>
+<th style="width:17%;">정답</th>
+<th style="width:17%;">맞힌 사람</th>
+<th style="width:17%;">정답 비율</th>
+</tr>
+</thead>
+<tbody>
+<tr>
+<td>{time}</td>
+<td>{memory}</td>
+<td>306245</td>
+<td>112081</td>
+<td>81296</td>
+<td>36.115%</td>
+</tr>
+</tbody>
+</table>
+</div>
+"""
+
+
+class TestParseLimits(unittest.TestCase):
+    """제한사항 문자열 파싱 테스트"""
+
+    def test_korean_limits(self):
+        parsed = parse_limits("시간 제한 1 초, 메모리 제한 128 MB")
+        self.assertEqual(parsed, {'time_limit_ms': 1000, 'memory_limit_mb': 128})
+
+    def test_fractional_time_without_extra_time(self):
+        parsed = parse_limits("시간 제한: 0.5 초 (추가 시간 없음), 메모리 제한: 512 MB")
+        self.assertEqual(parsed['time_limit_ms'], 500)
+        self.assertEqual(parsed['memory_limit_mb'], 512)
+        self.assertTrue(parsed['no_extra_time'])
+
+    def test_dict_limits(self):
+        parsed = parse_limits({"시간 제한": "2 초", "메모리 제한": "256 MB"})
+        self.assertEqual(parsed, {'time_limit_ms': 2000, 'memory_limit_mb': 256})
+
+    def test_english_limits(self):
+        parsed = parse_limits("Time limit: 1 second, Memory limit: 1024 MB")
+        self.assertEqual(parsed, {'time_limit_ms': 1000, 'memory_limit_mb': 1024})
+
+    def test_problem_info_table_markup(self):
+        """#problem-info 표는 머리글과 같은 열의 칸에서 값을 읽습니다"""
+        parsed = parse_limits(PROBLEM_INFO_HTML.format(time='2 초 ', memory='128 MB'))
+        self.assertEqual(parsed, {'time_limit_ms': 2000, 'memory_limit_mb': 128})
+
+        parsed = parse_limits(PROBLEM_INFO_HTML.format(
+            time='1 초 <span class="problem-limit-extra">(추가 시간 없음)</span> ', memory='1024 MB (하단 참고)'))
+        self.assertEqual(parsed, {'time_limit_ms': 1000, 'memory_limit_mb': 1024, 'no_extra_time': True})
+
+    def test_text_table_rows(self):
+        """표를 텍스트로 옮긴 경우(머리글 행 다음에 값 행)도 열 단위로 읽습니다"""
+        text = "시간 제한\t메모리 제한\t제출\t정답\t맞힌 사람\t정답 비율\n1 초\t256 MB\t51234\t20321\t15000\t39.8%"
+        self.assertEqual(parse_limits(text), {'time_limit_ms': 1000, 'memory_limit_mb': 256})
+
+        markdown = ("| 시간 제한 | 메모리 제한 | 제출 | 정답 |\n|---|---|---|---|\n"
+                    "| 0.25 초 (추가 시간 없음) | 512 MB | 100 | 50 |")
+        self.assertEqual(parse_limits(markdown), {'time_limit_ms': 250, 'memory_limit_mb': 512, 'no_extra_time': True})
+
+        flattened = "시간 제한 메모리 제한 제출 정답 맞힌 사람 정답 비율 1 초 128 MB 306245 112081 81296 36.115%"
+        self.assertEqual(parse_limits(flattened), {'time_limit_ms': 1000, 'memory_limit_mb': 128})
+
+    def test_unparseable_limits(self):
+        self.assertEqual(parse_limits("정보 없음"), {})
+        self.assertEqual(parse_limits(None), {})
+
+
+class TestResourceProfile(unittest.TestCase):
+    """자원 제한 프로필 테스트"""
+
+    def test_java_time_rule(self):
+        profile = ResourceProfile(time_limit_ms=1000)
+        self.assertAlmostEqual(profile.timeout_seconds(), 3.0)
+
+    def test_no_extra_time(self):
+        profile = ResourceProfile(time_limit_ms=500, no_extra_time=True)
+        self.assertAlmostEqual(profile.timeout_seconds(), 0.5)
+
+    def test_speed_factor(self):
+        profile = ResourceProfile(time_limit_ms=1000, speed_factor=1.5)
+        self.assertAlmostEqual(profile.timeout_seconds(), 4.5)
+
+    def test_default_timeout(self):
+        self.assertEqual(ResourceProfile().timeout_seconds(), DEFAULT_TIMEOUT_SECONDS)
+
+    def test_jvm_options_follow_memory_limit(self):
+        profile = ResourceProfile(memory_limit_mb=128)
+        self.assertIn('-Xmx128m', profile.jvm_options())
+        # 스택 크기는 -Xss 가 아니라 메인 스레드 실행기 인자로 줍니다.
+        self.assertEqual(profile.main_stack_bytes(), 128 * 1024 * 1024)
+        self.assertEqual(ResourceProfile(memory_limit_mb=1024).main_stack_bytes(), 512 * 1024 * 1024)
+
+    def test_memory_exceeded_detection(self):
+        profile = ResourceProfile()
+        self.assertTrue(profile.is_memory_exceeded('java.lang.OutOfMemoryError: Java heap space'))
+        self.assertFalse(profile.is_memory_exceeded('java.lang.StackOverflowError'))
+        self.assertFalse(profile.is_memory_exceeded(''))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
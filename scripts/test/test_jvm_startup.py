@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+test/test_jvm_startup.py
+CDS 아카이브 옵션과 JVM 옵션 프로필을 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from jvm_startup import (
+    JVM_FLAGS_DEFAULT, JVM_FLAGS_STARTUP, StartupOptions, cds_options, jvm_flag_profile_options
+)
+
+
+class TestJvmStartup(unittest.TestCase):
+    """JVM 시작 옵션 테스트"""
+
+    def test_flag_profiles(self):
+        self.assertEqual(jvm_flag_profile_options(JVM_FLAGS_DEFAULT), [])
+        self.assertIn('-XX:TieredStopAtLevel=1', jvm_flag_profile_options(JVM_FLAGS_STARTUP))
+        with self.assertRaises(ValueError):
+            jvm_flag_profile_options('fastest')
+
+    def test_without_cache_dir_only_flags_are_used(self):
+        options = StartupOptions(None, JVM_FLAGS_STARTUP)
+        self.assertEqual(options.options(), jvm_flag_profile_options(JVM_FLAGS_STARTUP))
+        self.assertEqual(options.options(JVM_FLAGS_DEFAULT), [])
+
+    def test_archive_options(self):
+        options = StartupOptions(None)
+        options.checked, options.archive = True, '/tmp/app.jsa'
+        self.assertEqual(options.options(), cds_options('/tmp/app.jsa'))
+        self.assertIn('-Xshare:auto', options.options())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
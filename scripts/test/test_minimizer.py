@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+test/test_minimizer.py
+실패 입력 최소화(델타 디버깅)를 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from minimizer import minimize_input
+
+
+def count_matches_lines(data):
+    lines = data.split(b'\n')
+    body = [line for line in lines[1:] if line]
+    return int(lines[0]) == len(body), body
+
+
+class TestMinimizer(unittest.TestCase):
+    """입력 최소화 테스트"""
+
+    def test_drop_lines_and_update_count(self):
+        data = b"6\n1\n2\n7\n3\n4\n5\n"
+
+        def still_fails(candidate):
+            valid, body = count_matches_lines(candidate)
+            return valid and b'7' in body
+
+        minimized, tests = minimize_input(data, still_fails, workers=2)
+        self.assertEqual(minimized, b"1\n7\n")
+        self.assertGreater(tests, 0)
+
+    def test_drop_tokens_and_update_count(self):
+        data = b"8\n5 3 9 -1 2 8 4 6\n"
+
+        def still_fails(candidate):
+            header, values = candidate.split(b'\n')[:2]
+            tokens = values.split()
+            return int(header) == len(tokens) and b'-1' in tokens
+
+        minimized, _ = minimize_input(data, still_fails, workers=3)
+        self.assertEqual(minimized, b"1\n-1\n")
+
+    def test_predicate_errors_are_not_failures(self):
+        minimized, _ = minimize_input(b"a\nb\n", lambda candidate: int(candidate) > 0)
+        self.assertEqual(minimized, b"a\nb\n")
+
+    def test_never_grows(self):
+        minimized, _ = minimize_input(b"x", lambda candidate: True)
+        self.assertEqual(minimized, b"x")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+test/test_multi_test_runner.py
+다중 문제 테스트 러너의 테스트 스위트 실행을 테스트하는 코드
+(풀이 실행은 가짜 코루틴으로 바꿔서 java 없이 실행합니다)
+"""
+
+import unittest
+import asyncio
+import io
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+import multi_test_runner
+from cost_model import TestCostModel
+from process_runner import STDOUT_RETAIN_BYTES, ExecutionResult, VERDICT_OK
+from resource_limits import ResourceProfile
+
+
+class FakeSolution:
+    """입력 첫 줄의 초만큼 기다린 뒤 입력을 그대로 출력하는 가짜 풀이. 동시에 실행된 최대 개수를 기록합니다."""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.finished = []
+
+    async def __call__(self, code_dir, class_name, input_data, timeout=5, profile=None, stdout_sink=None,
+                      input_file=None, jvm_flags=None, **kwargs):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(float(input_data.split()[0]))
+        finally:
+            self.running -= 1
+        self.finished.append(input_data)
+        if stdout_sink is not None:
+            stdout_sink(input_data)
+        return ExecutionResult(VERDICT_OK, input_data, 0.01)
+
+
+class TestRunTestSuite(unittest.TestCase):
+    """테스트 스위트 실행 테스트"""
+
+    def run_suite(self, jobs, delays):
+        fake = FakeSolution()
+        test_cases = [{'input': f'{delay}\n', 'output': f'{delay}\n', 'description': f'테스트 {i}'}
+                      for i, delay in enumerate(delays)]
+        output = io.StringIO()
+        with mock.patch.dict(multi_test_runner.RUNNER_OPTIONS, {'jobs': jobs, 'repeat': 1}), \
+                mock.patch.object(multi_test_runner, 'run_java_program_async', fake), \
+                redirect_stdout(output):
+            results = multi_test_runner.run_test_suite('.', 'Main', test_cases, '샘플',
+                                                       profile=ResourceProfile(cap_address_space=False))
+        return fake, results, output.getvalue()
+
+    def test_jobs_run_concurrently_but_logs_stay_in_test_order(self):
+        """--jobs 만큼 동시에 실행하고, 늦게 시작한 테스트가 먼저 끝나도 로그와 결과는 테스트 순서를 따릅니다"""
+        delays = [0.3, 0.2, 0.0, 0.1]
+        fake, results, output = self.run_suite(2, delays)
+        self.assertEqual(fake.max_running, 2)
+        self.assertNotEqual(fake.finished, [f'{delay}\n'.encode() for delay in delays])
+        self.assertEqual(results['passed'], 4)
+        self.assertEqual([record['description'] for record in results['details']],
+                         [f'테스트 {i}' for i in range(4)])
+
+        positions = [output.index(f'🧪 테스트 {i}') for i in range(4)]
+        self.assertEqual(positions, sorted(positions))
+        # 한 테스트의 로그 줄은 다른 테스트의 로그와 섞이지 않습니다.
+        for i in range(3):
+            block = output[positions[i]:positions[i + 1]]
+            self.assertEqual(block.count('🧪'), 1)
+            self.assertIn('✅ 통과', block)
+
+    def test_single_job_runs_one_at_a_time(self):
+        fake, results, _ = self.run_suite(1, [0.05, 0.0, 0.05])
+        self.assertEqual(fake.max_running, 1)
+        self.assertEqual(results['passed'], 3)
+
+
+class TestCostModelRecording(unittest.TestCase):
+    """테스트 소요 시간 기록 테스트"""
+
+    def test_repeated_tests_record_a_single_run(self):
+        """--repeat 로 여러 번 실행한 테스트도 한 번 실행한 시간을 기록합니다"""
+        async def solution(code_dir, class_name, input_data, timeout=5, profile=None, stdout_sink=None,
+                           *args, **kwargs):
+            await asyncio.sleep(0.1)
+            stdout_sink(input_data)
+            return ExecutionResult(VERDICT_OK, input_data, 0.1)
+
+        cost_model = TestCostModel(None, '1000')
+        test_cases = [{'input': f'{i}\n', 'output': f'{i}\n', 'description': f'테스트 {i}'} for i in range(2)]
+        with mock.patch.dict(multi_test_runner.RUNNER_OPTIONS, {'jobs': 2, 'repeat': 5}), \
+                mock.patch.object(multi_test_runner, 'run_java_program_async', solution), \
+                mock.patch.object(multi_test_runner, 'needs_repeat', return_value=True), \
+                redirect_stdout(io.StringIO()):
+            results = multi_test_runner.run_test_suite('.', 'Main', test_cases, '샘플', cost_model=cost_model,
+                                                       profile=ResourceProfile(cap_address_space=False))
+        self.assertEqual([record.timing['runs'] for record in results['details']], [5, 5])
+        self.assertEqual(results['passed'], 2)
+        self.assertEqual([entry['seconds'] for entry in cost_model.entries.values()], [0.1, 0.1])
+
+
+class TestFailedTestSpill(unittest.TestCase):
+    """실패한 테스트의 전체 실제 출력 저장 테스트"""
+
+    def test_actual_output_is_spilled_in_full(self):
+        """실행 결과에는 출력 앞부분만 남아도, 결과 디렉토리의 actual.txt 에는 전체 출력이 저장됩니다"""
+        output = b'1234567\n' * (STDOUT_RETAIN_BYTES // 4)
+
+        async def flood(code_dir, class_name, input_data, timeout=5, profile=None, stdout_sink=None, *args, **kwargs):
+            for start in range(0, len(output), 1 << 16):
+                stdout_sink(output[start:start + (1 << 16)])
+            return ExecutionResult(VERDICT_OK, output[:STDOUT_RETAIN_BYTES], 0.01)
+
+        artifact_dir = tempfile.mkdtemp(prefix='spill_test_')
+        self.addCleanup(shutil.rmtree, artifact_dir, True)
+        test_cases = [{'input': '1\n', 'output': '1\n', 'description': '큰 출력'}]
+        with mock.patch.dict(multi_test_runner.RUNNER_OPTIONS, {'jobs': 1, 'repeat': 1, 'artifact_dir': artifact_dir}), \
+                mock.patch.object(multi_test_runner, 'run_java_program_async', flood), \
+                redirect_stdout(io.StringIO()):
+            results = multi_test_runner.run_test_suite('.', 'Main', test_cases, '샘플', problem_id='1000',
+                                                       profile=ResourceProfile(cap_address_space=False))
+        record = results['details'][0]
+        self.assertEqual(record['verdict'], 'WA')
+        self.assertEqual(record.actual.size, len(output))
+        with open(record.actual.file, 'rb') as f:
+            self.assertEqual(f.read(), output)
+
+
+class TestSpeedCalibrationFallback(unittest.TestCase):
+    """속도 기준 값이 없을 때의 동작 테스트"""
+
+    def test_without_baseline_times_are_raw_and_limits_unscaled(self):
+        """기준 머신에서 잰 기준 값이 없으면 시간 제한을 보정하지 않고, 환산한 시간도 기록하지 않습니다"""
+        with mock.patch.dict(multi_test_runner.RUNNER_OPTIONS, {'calibration': None, 'speed_factor': 1.0}), \
+                mock.patch.object(multi_test_runner, 'load_reference_baseline', return_value=None), \
+                mock.patch.object(multi_test_runner, 'SpeedCalibrator') as calibrator, \
+                redirect_stdout(io.StringIO()):
+            multi_test_runner.calibrate_machine_speed(None)
+            self.assertIsNone(multi_test_runner.RUNNER_OPTIONS['calibration'])
+            self.assertEqual(multi_test_runner.RUNNER_OPTIONS['speed_factor'], 1.0)
+            performance = multi_test_runner.summarize_performance([{'wall_time': 1.5}])
+        calibrator.assert_not_called()
+        self.assertEqual(performance['wall_time']['max'], 1.5)
+        self.assertIsNone(performance['normalized'])
+
+
+class TestMinimizeFailure(unittest.TestCase):
+    """실패 입력 최소화 대상 선택 테스트"""
+
+    def test_wa_without_references_does_not_stop_later_failures(self):
+        """참고 풀이가 없어 오답을 최소화할 수 없어도, 뒤의 런타임 에러는 최소화합니다"""
+        test_cases = [{'input': 'wa\n', 'description': '오답'}, {'input': 'crash\n', 'description': '에러'}]
+        details = [{'passed': False, 'verdict': 'WA', 'description': '오답'},
+                   {'passed': False, 'verdict': 'RE', 'description': '에러'}]
+        ctx = {'result': {'problem_id': '1000'}, 'problem_info': {'code_file': 'Main.java'},
+               'code_dir': '.', 'class_name': 'Main'}
+        no_references = mock.Mock(solutions=[])
+        reproduced = []
+
+        def reproduce(repro_ctx, data):
+            reproduced.append((repro_ctx['verdict'], data))
+            return True, None, None
+
+        with mock.patch.object(multi_test_runner, 'build_reference_oracle', return_value=no_references), \
+                mock.patch.object(multi_test_runner, 'reproduce_failure', side_effect=reproduce), \
+                mock.patch.object(multi_test_runner, 'minimize_input', return_value=(b'c', 4)), \
+                redirect_stdout(io.StringIO()):
+            summary = multi_test_runner.minimize_failure(ctx, ResourceProfile(cap_address_space=False), None, None,
+                                                         [(test_cases, details)])
+        self.assertEqual(summary['description'], '에러')
+        self.assertEqual(summary['verdict'], 'RE')
+        self.assertEqual(summary['input'], 'c')
+        self.assertEqual(reproduced[0], ('RE', b'crash\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
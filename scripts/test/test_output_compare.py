@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+test/test_output_compare.py
+스트리밍 출력 비교기를 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from output_compare import StreamingComparator
+
+
+def compare(expected, actual, chunk_size=3):
+    comparator = StreamingComparator.from_text(expected)
+    data = actual.encode('utf-8')
+    for start in range(0, len(data), chunk_size):
+        comparator.feed(data[start:start + chunk_size])
+    return comparator.finish(), comparator
+
+
+class TestStreamingComparator(unittest.TestCase):
+    """스트리밍 비교 테스트"""
+
+    def test_trailing_whitespace_ignored(self):
+        self.assertTrue(compare("1 2\n3", "1 2   \r\n3\n\n\n")[0])
+
+    def test_leading_blank_lines_ignored(self):
+        self.assertTrue(compare("1\n2", "\n\n1\n2")[0])
+
+    def test_inner_blank_lines_compared(self):
+        self.assertFalse(compare("1\n2", "1\n\n2")[0])
+
+    def test_first_mismatch_position(self):
+        matched, comparator = compare("a\nb\nc", "a\nx\ny")
+        self.assertFalse(matched)
+        self.assertEqual(comparator.mismatch, {'line': 2, 'expected': 'b', 'actual': 'x'})
+
+    def test_shorter_and_longer_output(self):
+        matched, comparator = compare("a\nb", "a")
+        self.assertFalse(matched)
+        self.assertIsNone(comparator.mismatch['actual'])
+        matched, comparator = compare("a", "a\nb")
+        self.assertFalse(matched)
+        self.assertIsNone(comparator.mismatch['expected'])
+
+    def test_expected_from_file(self):
+        with tempfile.NamedTemporaryFile('wb', suffix='.out', delete=False) as f:
+            f.write(b"10\n20\n")
+        try:
+            comparator = StreamingComparator.from_file(f.name)
+            comparator.feed(b"10\n2")
+            comparator.feed(b"0")
+            self.assertTrue(comparator.finish())
+        finally:
+            os.unlink(f.name)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+test/test_pipeline_scheduler.py
+작업 의존 관계(DAG)에 따라 I/O 작업과 CPU 작업을 겹쳐 실행하는 스케줄러를 테스트하는 코드
+"""
+
+import unittest
+import io
+import os
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from pipeline_scheduler import CPU, IO, PipelineScheduler
+
+
+class TestPipelineScheduler(unittest.TestCase):
+    """파이프라인 스케줄러 테스트"""
+
+    def setUp(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def step(self, name, result=True, seconds=0.0):
+        def run():
+            with self.lock:
+                self.events.append(('start', name))
+            time.sleep(seconds)
+            with self.lock:
+                self.events.append(('end', name))
+            return result
+        return run
+
+    def position(self, kind, name):
+        return self.events.index((kind, name))
+
+    def test_tasks_start_only_after_their_dependencies_finish(self):
+        """문제마다 검색 → 테스트 생성 → 실행 순서를 지키고, 다른 문제의 I/O 작업은 CPU 작업과 겹쳐 실행합니다"""
+        scheduler = PipelineScheduler(io_workers=2, cpu_workers=1)
+        for problem in ('A', 'B'):
+            scheduler.add_task(f'fetch {problem}', self.step(f'fetch {problem}', seconds=0.05), kind=IO)
+            scheduler.add_task(f'compile {problem}', self.step(f'compile {problem}', seconds=0.1), kind=CPU)
+            scheduler.add_task(f'generate {problem}', self.step(f'generate {problem}', seconds=0.05),
+                               deps=[f'fetch {problem}'], kind=IO)
+            scheduler.add_task(f'run {problem}', self.step(f'run {problem}'),
+                               deps=[f'compile {problem}', f'generate {problem}'], kind=CPU)
+        results = scheduler.run()
+
+        self.assertTrue(all(results.values()))
+        for problem in ('A', 'B'):
+            self.assertLess(self.position('end', f'fetch {problem}'), self.position('start', f'generate {problem}'))
+            for dep in ('compile', 'generate'):
+                self.assertLess(self.position('end', f'{dep} {problem}'), self.position('start', f'run {problem}'))
+        # 첫 CPU 작업(컴파일)이 끝나기 전에 두 문제의 검색이 모두 시작됩니다.
+        self.assertLess(self.position('start', 'fetch B'), self.position('end', 'compile A'))
+
+    def test_failed_dependency_skips_dependents_but_not_ordering_only_tasks(self):
+        """의존 작업이 실패하면 뒤 작업은 실행하지 않고 False 로 기록하며, 순서 의존(after) 작업은 그대로 실행합니다"""
+        scheduler = PipelineScheduler()
+        scheduler.add_task('compile', self.step('compile', result=False))
+        scheduler.add_task('run', self.step('run'), deps=['compile'])
+        scheduler.add_task('report', self.step('report'), deps=['run'])
+        scheduler.add_task('next', self.step('next'), after=['compile'])
+        results = scheduler.run()
+
+        self.assertEqual(results, {'compile': False, 'run': False, 'report': False, 'next': True})
+        self.assertNotIn(('start', 'run'), self.events)
+        self.assertNotIn(('start', 'report'), self.events)
+        self.assertLess(self.position('end', 'compile'), self.position('start', 'next'))
+
+    def test_exception_counts_as_failure(self):
+        def broken():
+            raise RuntimeError("boom")
+
+        scheduler = PipelineScheduler()
+        scheduler.add_task('broken', broken, kind=IO)
+        scheduler.add_task('after', self.step('after'), deps=['broken'])
+        with redirect_stdout(io.StringIO()):
+            results = scheduler.run()
+        self.assertEqual(results, {'broken': False, 'after': False})
+
+    def test_registration_errors(self):
+        scheduler = PipelineScheduler()
+        scheduler.add_task('a', self.step('a'))
+        with self.assertRaises(ValueError):
+            scheduler.add_task('a', self.step('a'))
+        with self.assertRaises(ValueError):
+            scheduler.add_task('b', self.step('b'), deps=['missing'])
+        with self.assertRaises(ValueError):
+            scheduler.add_task('c', self.step('c'), kind='gpu')
+        self.assertEqual(PipelineScheduler().run(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
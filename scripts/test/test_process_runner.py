@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+test/test_process_runner.py
+풀이 프로세스를 실행하며 CPU 시간과 최대 메모리(wait4 rusage)를 재는 기능을 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+import time
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from process_runner import percentile, run_measured
+
+# CPU 를 약 0.3초 사용하는 작업
+BUSY_LOOP = 'import time\nend = time.process_time() + 0.3\nwhile time.process_time() < end: pass'
+
+# 200MB 를 할당하고 실제로 건드려 RSS 에 잡히게 하는 작업
+ALLOCATE_200MB = 'data = bytearray(200 * 1024 * 1024)\nfor i in range(0, len(data), 4096): data[i] = 1'
+
+
+@unittest.skipUnless(hasattr(os, 'wait4'), "wait4 가 필요합니다")
+class TestRunMeasured(unittest.TestCase):
+    """run_measured 자원 사용량 측정 테스트"""
+
+    def test_cpu_time_comes_from_the_child(self):
+        """사용자 CPU 시간은 자식이 쓴 시간이고, 잠만 잔 자식은 CPU 시간이 거의 없습니다"""
+        busy = run_measured([sys.executable, '-c', BUSY_LOOP], timeout=10)
+        self.assertEqual(busy.returncode, 0)
+        self.assertGreaterEqual(busy.user_time + busy.sys_time, 0.25)
+        self.assertGreaterEqual(busy.wall_time, 0.25)
+
+        sleeping = run_measured([sys.executable, '-c', 'import time; time.sleep(0.3)'], timeout=10)
+        self.assertGreaterEqual(sleeping.wall_time, 0.3)
+        self.assertLess(sleeping.user_time + sleeping.sys_time, 0.2)
+
+    def test_peak_rss_is_per_process(self):
+        big = run_measured([sys.executable, '-c', ALLOCATE_200MB], timeout=30)
+        small = run_measured([sys.executable, '-c', 'pass'], timeout=30)
+        self.assertGreaterEqual(big.peak_rss_kb, 200 * 1024)
+        self.assertLess(small.peak_rss_kb, 100 * 1024)
+        self.assertEqual(set(big.metrics()), {'wall_time', 'user_time', 'sys_time', 'peak_rss_kb'})
+
+    def test_exit_code_and_streams(self):
+        outcome = run_measured(['sh', '-c', 'cat; echo oops >&2; exit 3'], b'hello', timeout=5)
+        self.assertEqual(outcome.returncode, 3)
+        self.assertEqual(outcome.stdout, b'hello')
+        self.assertEqual(outcome.stderr, b'oops\n')
+        self.assertFalse(outcome.timed_out)
+
+    def test_timeout_kills_the_whole_process_group(self):
+        """시간 초과 시 자식이 만든 프로세스까지 종료되어 출력 파이프를 잡고 있지 않습니다"""
+        start = time.time()
+        outcome = run_measured(['sh', '-c', 'sleep 30 & sleep 30'], timeout=0.3)
+        self.assertTrue(outcome.timed_out)
+        self.assertLess(time.time() - start, 5)
+        self.assertIsNotNone(outcome.peak_rss_kb)
+
+
+class TestPercentile(unittest.TestCase):
+    """최근접 순위 백분위수 테스트"""
+
+    def test_nearest_rank(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(percentile(values, 0.95), 5)
+        self.assertEqual(percentile(values, 0.5), 3)
+        self.assertEqual(percentile([7], 0.95), 7)
+        self.assertIsNone(percentile([], 0.95))
+
+
+if __name__ == '__main__':
+    unittest.main()
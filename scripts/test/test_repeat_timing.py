@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+test/test_repeat_timing.py
+반복 측정으로 실행 시간 요약과 판정을 만드는 기능을 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from repeat_timing import combine_runs, needs_repeat
+from result_records import TestRecord
+
+
+def make_record(verdict, seconds):
+    return TestRecord('테스트', verdict, passed=verdict == 'AC', execution_time=seconds)
+
+
+class TestRepeatTiming(unittest.TestCase):
+    """반복 측정 테스트"""
+
+    def test_only_runs_near_the_limit_are_repeated(self):
+        """시간 제한 근처에서 통과했거나 시간 초과된 테스트만 반복합니다"""
+        self.assertTrue(needs_repeat(make_record('AC', 0.9), 1.0, 3))
+        self.assertTrue(needs_repeat(make_record('TLE', 1.0), 1.0, 3))
+        self.assertFalse(needs_repeat(make_record('AC', 0.1), 1.0, 3))
+        self.assertFalse(needs_repeat(make_record('WA', 0.9), 1.0, 3))
+        self.assertFalse(needs_repeat(make_record('AC', 0.9), 1.0, 1))
+
+    def test_one_unlucky_timeout_does_not_decide_the_verdict(self):
+        """한 번만 시간 초과되면 중앙값 실행의 판정(AC)을 사용하고, 과반이 시간 초과되면 TLE 입니다"""
+        record = combine_runs([make_record('TLE', 1.0), make_record('AC', 0.9), make_record('AC', 0.92)])
+        self.assertEqual(record['verdict'], 'AC')
+        self.assertEqual(record['execution_time'], 0.92)
+        self.assertEqual((record.timing['min'], record.timing['max'], record.timing['timeouts']), (0.9, 1.0, 1))
+        self.assertAlmostEqual(record.timing['spread'], 0.1)
+
+        record = combine_runs([make_record('AC', 0.95), make_record('TLE', 1.0), make_record('TLE', 1.0)])
+        self.assertEqual(record['verdict'], 'TLE')
+        self.assertFalse(record['passed'])
+
+    def test_high_variance_is_flagged_unstable(self):
+        """변동 계수가 기준을 넘으면 불안정으로 표시하고, 결과 기록에도 남습니다"""
+        stable = combine_runs([make_record('AC', t) for t in (0.50, 0.51, 0.52)], unstable_cv=0.1)
+        noisy = combine_runs([make_record('AC', t) for t in (0.3, 0.5, 0.9)], unstable_cv=0.1)
+        self.assertFalse(stable.timing['unstable'])
+        self.assertTrue(noisy.timing['unstable'])
+        self.assertEqual(TestRecord.from_dict(noisy.to_dict()).timing['median'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
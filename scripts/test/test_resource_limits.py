@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+test/test_resource_limits.py
+BOJ와 비슷한 자원 제한 프로필(힙/스택 크기, 주소 공간 상한, 스레드 수 상한)을 테스트하는 코드
+"""
+
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+from unittest import mock
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+import resource_limits
+from process_runner import run_measured
+from resource_limits import LAUNCHER_CLASS, MAX_STACK_MB, ResourceProfile, compile_launcher, default_max_tasks
+
+# 메인 스레드에서 깊이 재귀하고(큰 스택 필요), 크기를 지정하지 않은 스레드도 여러 개 만드는 풀이
+DEEP_RECURSION = '''
+    import java.io.*;
+    public class Main {
+        static int depth(int n) { return n == 0 ? 0 : depth(n - 1) + 1; }
+        public static void main(String[] args) throws Exception {
+            BufferedReader br = new BufferedReader(new InputStreamReader(System.in));
+            int n = Integer.parseInt(br.readLine().trim());
+            Thread[] workers = new Thread[16];
+            for (int i = 0; i < workers.length; i++) {
+                workers[i] = new Thread(() -> depth(1000));
+                workers[i].start();
+            }
+            for (Thread worker : workers) worker.join();
+            System.out.println(depth(n));
+        }
+    }
+'''
+
+
+class TestResourceProfile(unittest.TestCase):
+    """자원 제한 프로필 테스트"""
+
+    def test_big_stack_goes_only_to_the_main_thread(self):
+        """-Xss 로 모든 스레드에 큰 스택을 주지 않고, 실행기 인자로 메인 스레드에만 줍니다"""
+        profile = ResourceProfile(memory_limit_mb=1024)
+        self.assertEqual(profile.stack_mb, MAX_STACK_MB)
+        self.assertFalse([option for option in profile.jvm_options() if option.startswith('-Xss')])
+        self.assertIn('-Xmx1024m', profile.jvm_options())
+        self.assertEqual(profile.launch_args('/launcher', '/code', 'Main'),
+                         ['-cp', f'/launcher{os.pathsep}/code', LAUNCHER_CLASS, str(512 * 1024 * 1024), 'Main'])
+
+    def test_address_space_counts_the_main_stack_once(self):
+        profile = ResourceProfile(memory_limit_mb=128)
+        self.assertEqual(profile.stack_mb, 128)
+        self.assertEqual(profile.address_space_limit_bytes(),
+                         (128 + 128 + resource_limits.JVM_ADDRESS_SPACE_OVERHEAD_MB) * 1024 * 1024)
+
+    def test_thread_limit_is_not_applied_as_root(self):
+        """RLIMIT_NPROC 은 root 에게 적용되지 않으므로 root 로 실행하면 스레드 수 상한을 걸지 않습니다"""
+        with mock.patch.object(resource_limits.os, 'geteuid', return_value=0):
+            self.assertIsNone(default_max_tasks(4))
+        with mock.patch.object(resource_limits.os, 'geteuid', return_value=1000), \
+                mock.patch.object(resource_limits, 'count_user_tasks', return_value=10):
+            self.assertEqual(default_max_tasks(2), 10 + 2 * resource_limits.TASKS_PER_RUN)
+
+
+@unittest.skipUnless(shutil.which('javac') and shutil.which('java') and shutil.which('prlimit'),
+                     "javac 와 prlimit 이 필요합니다")
+class TestMainThreadLauncher(unittest.TestCase):
+    """512MB 스택 프로필을 주소 공간 상한 아래에서 실제로 실행하는 테스트"""
+
+    def test_512mb_stack_profile_runs_under_address_space_cap(self):
+        work_dir = tempfile.mkdtemp(prefix='launcher_test_')
+        self.addCleanup(shutil.rmtree, work_dir, True)
+        launcher_dir = os.path.join(work_dir, 'launcher')
+        code_dir = os.path.join(work_dir, 'code')
+        os.makedirs(code_dir)
+        ok, error_msg = compile_launcher(launcher_dir)
+        self.assertTrue(ok, error_msg)
+        source = os.path.join(code_dir, 'Main.java')
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write(textwrap.dedent(DEEP_RECURSION))
+        subprocess.run(['javac', '-d', code_dir, source], check=True, capture_output=True)
+
+        profile = ResourceProfile(memory_limit_mb=512)
+        self.assertEqual(profile.stack_mb, 512)
+        cmd = [*profile.command_prefix(), 'java', *profile.jvm_options(),
+               *profile.launch_args(launcher_dir, code_dir, 'Main')]
+        outcome = run_measured(cmd, b'1000000\n', timeout=60)
+        self.assertEqual(outcome.returncode, 0, outcome.stderr.decode('utf-8', errors='replace'))
+        self.assertEqual(outcome.stdout.strip(), b'1000000')
+        self.assertFalse(profile.is_memory_exceeded(outcome.stderr.decode('utf-8', errors='replace')))
+
+    def test_uncaught_exception_exits_with_code_1(self):
+        work_dir = tempfile.mkdtemp(prefix='launcher_test_')
+        self.addCleanup(shutil.rmtree, work_dir, True)
+        ok, error_msg = compile_launcher(work_dir)
+        self.assertTrue(ok, error_msg)
+        source = os.path.join(work_dir, 'Boom.java')
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write('public class Boom { public static void main(String[] a) { throw new IllegalStateException("x"); } }')
+        subprocess.run(['javac', '-d', work_dir, source], check=True, capture_output=True)
+
+        profile = ResourceProfile()
+        outcome = run_measured(['java', *profile.jvm_options(), *profile.launch_args(work_dir, work_dir, 'Boom')],
+                               timeout=60)
+        self.assertEqual(outcome.returncode, 1)
+        self.assertIn(b'IllegalStateException', outcome.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+test/test_result_records.py
+고정 크기 테스트 결과 레코드를 테스트하는 코드
+"""
+
+import unittest
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from result_records import PREVIEW_BYTES, Payload, PayloadBuilder, TestRecord, record_to_json, spill_payload
+
+
+class TestPayload(unittest.TestCase):
+    """입력/출력 요약 테스트"""
+
+    def test_small_payload_keeps_everything(self):
+        payload = Payload.from_text("1 2\n")
+        self.assertEqual(payload.size, 4)
+        self.assertEqual(payload.sha256, hashlib.sha256(b"1 2\n").hexdigest())
+        self.assertFalse(payload.truncated)
+        self.assertEqual(payload.preview(), "1 2\n")
+        self.assertNotIn('tail', payload.to_dict())
+
+    def test_large_payload_keeps_head_and_tail(self):
+        data = b"a" * PREVIEW_BYTES + b"b" * 10000 + b"c" * PREVIEW_BYTES
+        builder = PayloadBuilder()
+        for start in range(0, len(data), 777):
+            builder.feed(data[start:start + 777])
+        payload = builder.build()
+
+        self.assertEqual(payload.size, len(data))
+        self.assertEqual(payload.sha256, hashlib.sha256(data).hexdigest())
+        self.assertEqual(payload.head, b"a" * PREVIEW_BYTES)
+        self.assertEqual(payload.tail, b"c" * PREVIEW_BYTES)
+        self.assertTrue(payload.truncated)
+        self.assertIn("생략", payload.preview())
+
+    def test_spill_payload_records_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            payload = Payload.from_bytes(b"wrong\n")
+            target = os.path.join(temp_dir, 'case', 'actual.txt')
+            spill_payload(payload, target, data=b"wrong\n")
+            with open(target, 'rb') as f:
+                self.assertEqual(f.read(), b"wrong\n")
+            self.assertEqual(payload.to_dict()['file'], target)
+
+
+class TestTestRecord(unittest.TestCase):
+    """테스트 결과 레코드 테스트"""
+
+    def test_dict_style_access_and_json(self):
+        record = TestRecord("예제 1", 'AC', passed=True, execution_time=0.1,
+                            metrics={'wall_time': 0.12, 'peak_rss_kb': 2048},
+                            input=Payload.from_text("1\n"))
+        self.assertEqual(record['verdict'], 'AC')
+        self.assertEqual(record.get('wall_time'), 0.12)
+        self.assertIsNone(record.get('user_time'))
+        self.assertEqual(record.get('missing', 'x'), 'x')
+        with self.assertRaises(KeyError):
+            record['missing']
+
+        data = json.loads(json.dumps(record, default=record_to_json))
+        self.assertEqual(data['input']['bytes'], 2)
+        self.assertEqual(data['peak_rss_kb'], 2048)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+test/test_scratch_space.py
+문제별 임시 작업 디렉토리를 테스트하는 코드
+"""
+
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from scratch_space import OWNER_FILE, SESSION_PREFIX, ScratchSpace, reap_stale_sessions, stage_test_inputs
+
+
+class TestScratchSpace(unittest.TestCase):
+    """임시 작업 디렉토리 테스트"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='scratch_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_dirs_live_in_session_and_are_cleaned(self):
+        scratch = ScratchSpace(self.root)
+        first, second = scratch.make_dir('build_1000_'), scratch.make_dir('build_1000_')
+        self.assertNotEqual(first, second)
+        self.assertEqual(os.path.dirname(first), scratch.session)
+        session = scratch.session
+        scratch.cleanup()
+        scratch.cleanup()
+        self.assertFalse(os.path.exists(session))
+
+    def test_reap_sessions_of_dead_processes(self):
+        dead = subprocess.Popen(['true'])
+        dead.wait()
+        stale = os.path.join(self.root, SESSION_PREFIX + 'stale')
+        live = os.path.join(self.root, SESSION_PREFIX + 'live')
+        for path, pid in ((stale, dead.pid), (live, os.getpid())):
+            os.makedirs(path)
+            with open(os.path.join(path, OWNER_FILE), 'w') as f:
+                f.write(str(pid))
+        self.assertEqual(reap_stale_sessions(self.root), 1)
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(live))
+
+    def test_stage_test_inputs(self):
+        cases = [{'input': '1 2\n', 'output': '3'}, {'type': 'stress', 'generator': 'print(1)'}]
+        staged = stage_test_inputs(cases, os.path.join(self.root, 'inputs'), 'sample')
+        with open(staged[0]['input_file'], 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), '1 2\n')
+        self.assertEqual(staged[0]['output'], '3')
+        self.assertIs(staged[1], cases[1])
+        self.assertNotIn('input_file', cases[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+test/test_speed_calibration.py
+기준 작업으로 머신 속도 보정 계수를 만드는 기능을 테스트하는 코드
+"""
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+import speed_calibration
+from speed_calibration import (
+    MAX_FACTOR, SpeedCalibrator, compute_calibration, java_major_version, load_reference_baseline, normalize_seconds
+)
+
+
+class TestSpeedCalibration(unittest.TestCase):
+    """속도 보정 테스트"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix='calibration_test_')
+        patcher = mock.patch.object(speed_calibration, 'get_java_version', return_value='openjdk 17.0.9\nextra')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_factor_combines_startup_and_kernel(self):
+        """보정 계수는 두 비율의 기하 평균이고, 시간 제한 계수는 0.25 단위로 맞추며 범위를 벗어나지 않습니다"""
+        baseline = {'jvm_startup': 0.1, 'kernel': 1.0}
+        calibration = compute_calibration({'jvm_startup': 0.2, 'kernel': 2.0}, baseline)
+        self.assertAlmostEqual(calibration['factor'], 2.0)
+        self.assertEqual(calibration['limit_factor'], 2.0)
+        self.assertEqual(compute_calibration({'jvm_startup': 0.11, 'kernel': 1.1}, baseline)['limit_factor'], 1.0)
+        self.assertEqual(compute_calibration({'jvm_startup': 10, 'kernel': 100}, baseline)['factor'], MAX_FACTOR)
+        self.assertAlmostEqual(normalize_seconds(3.0, calibration['factor']), 1.5)
+        self.assertIsNone(normalize_seconds(None, 2.0))
+
+    def test_faster_machine_never_shrinks_the_time_limit(self):
+        """기준 머신보다 빠르면 환산 계수는 1보다 작지만, 시간 제한은 줄이지 않습니다"""
+        calibration = compute_calibration({'jvm_startup': 0.05, 'kernel': 0.5}, {'jvm_startup': 0.1, 'kernel': 1.0})
+        self.assertAlmostEqual(calibration['factor'], 0.5)
+        self.assertEqual(calibration['limit_factor'], 1.0)
+        self.assertAlmostEqual(normalize_seconds(1.0, calibration['factor']), 2.0)
+
+    def test_committed_baseline_is_used_and_resume_reuses_last(self):
+        """캐시가 비어 있어도 커밋한 기준 값과 비교하고, 이어서 실행하면 마지막 측정을 다시 사용합니다"""
+        baseline = {'origin': '테스트 기준 머신', 'java_version': '17', 'jvm_startup': 0.1, 'kernel': 1.0,
+                    'measured_at': '2026-01-01T00:00:00+0000'}
+        slower = SpeedCalibrator(self.cache_dir, baseline).calibrate(
+            measure=lambda: {'jvm_startup': 0.15, 'kernel': 1.5})
+        self.assertAlmostEqual(slower['factor'], 1.5)
+        self.assertEqual(slower['limit_factor'], 1.5)
+        self.assertEqual(slower['baseline']['origin'], '테스트 기준 머신')
+        self.assertFalse(slower['baseline_jdk_mismatch'])
+
+        # 캐시를 지워도 처음 잰 머신이 새 기준이 되지 않습니다.
+        shutil.rmtree(self.cache_dir)
+        again = SpeedCalibrator(self.cache_dir, baseline).calibrate(
+            measure=lambda: {'jvm_startup': 0.15, 'kernel': 1.5})
+        self.assertAlmostEqual(again['factor'], 1.5)
+
+        def fail():
+            raise AssertionError("이어서 실행할 때는 다시 재지 않아야 합니다")
+
+        resumed = SpeedCalibrator(self.cache_dir, baseline).calibrate(reuse_last=True, measure=fail)
+        self.assertTrue(resumed['reused'])
+        self.assertAlmostEqual(resumed['factor'], 1.5)
+
+        # 기준 값이 바뀌면 마지막 측정을 다시 사용하지 않습니다.
+        changed = {**baseline, 'kernel': 1.5}
+        remeasured = SpeedCalibrator(self.cache_dir, changed).calibrate(
+            reuse_last=True, measure=lambda: {'jvm_startup': 0.1, 'kernel': 1.5})
+        self.assertNotIn('reused', remeasured)
+        self.assertAlmostEqual(remeasured['factor'], 1.0)
+
+    def test_jdk_mismatch_is_reported(self):
+        baseline = {'origin': '테스트 기준 머신', 'java_version': '11', 'jvm_startup': 0.1, 'kernel': 1.0}
+        calibration = SpeedCalibrator(self.cache_dir, baseline).calibrate(
+            measure=lambda: {'jvm_startup': 0.1, 'kernel': 1.0})
+        self.assertTrue(calibration['baseline_jdk_mismatch'])
+
+    def test_java_major_version(self):
+        self.assertEqual(java_major_version('openjdk version "11.0.20" 2023-07-18\nextra'), '11')
+        self.assertEqual(java_major_version('java version "1.8.0_381"'), '8')
+        self.assertEqual(java_major_version('openjdk 17.0.9'), '17')
+        self.assertIsNone(java_major_version(None))
+
+    def test_baseline_must_be_measured(self):
+        """기준 값 파일이 없으면 None 이고, 기준 머신에서 잰 값이 아니면 사용하지 않습니다"""
+        path = os.path.join(self.cache_dir, 'calibration_baseline.json')
+        self.assertIsNone(load_reference_baseline(path))
+
+        baseline = {'origin': '테스트 기준 머신', 'jvm_startup': 0.1, 'kernel': 1.0, 'measured_at': None}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f)
+        with self.assertRaises(RuntimeError):
+            load_reference_baseline(path)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({**baseline, 'measured_at': '2026-01-01T00:00:00+0000'}, f)
+        self.assertEqual(load_reference_baseline(path)['origin'], '테스트 기준 머신')
+
+
+if __name__ == '__main__':
+    unittest.main()
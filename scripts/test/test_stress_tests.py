@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+test/test_stress_tests.py
+스트레스 테스트 생성기 실행과 참고 풀이 다수결을 테스트하는 코드
+"""
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest import mock
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from resource_limits import ResourceProfile
+from stress_tests import ReferenceOracle, find_reference_solutions, run_generator
+
+GENERATOR = "import sys, random\nrandom.seed(int(sys.argv[1]))\nprint(random.randint(1, 10**9))\n"
+
+
+class TestStressTests(unittest.TestCase):
+    """스트레스 테스트 지원 기능 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _write(self, relative_path, content=''):
+        path = os.path.join(self.work_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_generator_is_deterministic(self):
+        first = run_generator(GENERATOR, 7, self.work_dir)
+        with open(first, 'rb') as f:
+            first_data = f.read()
+        os.remove(first)
+        with open(run_generator(GENERATOR, 7, self.work_dir), 'rb') as f:
+            self.assertEqual(f.read(), first_data)
+
+    def test_generator_failure(self):
+        with self.assertRaises(RuntimeError):
+            run_generator("raise SystemExit(1)", 1, self.work_dir)
+
+    def test_generator_does_not_see_runner_secrets(self):
+        """생성기에는 러너의 환경 변수(토큰 등)를 넘기지 않습니다"""
+        source = "import os\nprint(os.environ.get('GEMINI_API_KEY'), os.environ.get('PYTHONHASHSEED'))\n"
+        with mock.patch.dict(os.environ, {'GEMINI_API_KEY': 'secret'}):
+            path = run_generator(source, 1, self.work_dir, profile=ResourceProfile(cap_address_space=False))
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b"None 0\n")
+
+    def test_generator_output_is_capped(self):
+        """출력 상한을 넘는 생성기는 바로 종료하고 입력 파일을 남기지 않습니다"""
+        source = "import sys\nwhile True: sys.stdout.write('1' * 65536)\n"
+        with self.assertRaises(RuntimeError) as raised:
+            run_generator(source, 1, self.work_dir, timeout=10, output_limit=1 << 20)
+        self.assertIn('출력 크기 초과', str(raised.exception))
+        self.assertFalse([name for name in os.listdir(self.work_dir) if name.startswith('input_')])
+
+    def test_peer_solutions_exclude_own_code(self):
+        own = self._write('alice/1000/Main.java')
+        self._write('bob/1000/Main.java')
+        self._write('carol/1000.java')
+        self._write('dave/1001/Main.java')
+        peers, trusted = find_reference_solutions('1000', own, root=self.work_dir)
+        self.assertFalse(trusted)
+        self.assertEqual([os.path.relpath(p, self.work_dir) for p in peers],
+                         [os.path.join('bob', '1000', 'Main.java'), 'carol/1000.java'])
+
+    def test_reference_directory_is_trusted(self):
+        self._write('bob/1000/Main.java')
+        self._write('references/1000/Main.java')
+        references, trusted = find_reference_solutions('1000', 'alice/1000/Main.java', root=self.work_dir)
+        self.assertTrue(trusted)
+        self.assertEqual(len(references), 1)
+
+    def test_consensus(self):
+        outputs = {'a': b"42\n", 'b': b"42   \n\n", 'c': b"41\n"}
+
+        def run_solution(code_dir, class_name, input_path, output_path):
+            with open(output_path, 'wb') as f:
+                f.write(outputs[code_dir])
+            return True
+
+        input_path = self._write('input.txt', '1\n')
+        oracle = ReferenceOracle([('a', 'Main'), ('c', 'Main'), ('b', 'Main')], False, run_solution)
+        expected_path, note = oracle.expected_output(input_path)
+        with open(expected_path, 'rb') as f:
+            self.assertEqual(f.read().strip(), b"42")
+        self.assertEqual(note, "다수결 2/3")
+
+        oracle = ReferenceOracle([('a', 'Main'), ('c', 'Main')], False, run_solution)
+        self.assertIsNone(oracle.expected_output(input_path)[0])
+
+        # 두 풀이만 있어도 둘의 출력이 같으면 CONSENSUS_SIZE(3)의 과반입니다.
+        oracle = ReferenceOracle([('a', 'Main'), ('b', 'Main')], False, run_solution)
+        self.assertEqual(oracle.expected_output(input_path)[1], "다수결 2/2")
+
+    def test_single_surviving_peer_is_not_a_consensus(self):
+        """다른 풀이가 실행에 실패해도, 남은 풀이 하나의 출력을 예상 출력으로 쓰지 않습니다"""
+        def run_solution(code_dir, class_name, input_path, output_path):
+            with open(output_path, 'wb') as f:
+                f.write(b"42\n")
+            return code_dir == 'ok'
+
+        input_path = self._write('input.txt', '1\n')
+        oracle = ReferenceOracle([('ok', 'Main'), ('crash', 'Main'), ('crash', 'Main')], False, run_solution)
+        expected_path, note = oracle.expected_output(input_path)
+        self.assertIsNone(expected_path)
+        self.assertIn('합의 부족', note)
+        oracle = ReferenceOracle([('ok', 'Main')], False, run_solution)
+        self.assertIsNone(oracle.expected_output(input_path)[0])
+        # 신뢰하는 참고 풀이는 하나로 충분합니다.
+        oracle = ReferenceOracle([('ok', 'Main')], True, run_solution)
+        self.assertIsNotNone(oracle.expected_output(input_path)[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
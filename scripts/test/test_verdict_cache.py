@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+test/test_verdict_cache.py
+채점 결과 캐시를 테스트하는 코드
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from verdict_cache import VerdictCache, normalize_source, runner_version
+
+
+class TestVerdictCache(unittest.TestCase):
+    """결과 캐시 테스트"""
+
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.work_dir = tempfile.mkdtemp(prefix='verdict_cache_test_')
+        os.chdir(self.work_dir)
+        os.makedirs('alice')
+        self.code_file = os.path.join('alice', '1000.java')
+        self.write(self.code_file, "public class Main {\n}\n")
+        self.write('sample_1000_tests.json', json.dumps({'test_cases': [{'input': '1 2', 'output': '3'}]}))
+        self.cache = VerdictCache(os.path.join(self.work_dir, 'cache'), 'v1')
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        import shutil
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write(self, path, text):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_hit_after_store(self):
+        self.assertIsNone(self.cache.lookup('1000', self.code_file))
+        self.cache.store('1000', self.code_file, {'result': 'PASS'})
+        self.assertEqual(self.cache.lookup('1000', self.code_file), {'result': 'PASS'})
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1})
+
+    def test_whitespace_only_change_still_hits(self):
+        self.cache.store('1000', self.code_file, {'result': 'PASS'})
+        self.write(self.code_file, "public class Main {   \r\n}\r\n\r\n")
+        self.assertIsNotNone(self.cache.lookup('1000', self.code_file))
+
+    def test_source_test_and_version_changes_miss(self):
+        self.cache.store('1000', self.code_file, {'result': 'PASS'})
+        self.assertIsNone(VerdictCache(self.cache.root, 'v2').lookup('1000', self.code_file))
+        self.write('sample_1000_tests.json', json.dumps({'test_cases': [{'input': '2 2', 'output': '4'}]}))
+        self.assertIsNone(self.cache.lookup('1000', self.code_file))
+        self.write(self.code_file, "public class Main { int x; }\n")
+        self.assertIsNone(self.cache.lookup('1000', self.code_file))
+
+    def test_restores_stored_test_set(self):
+        self.cache.store('1000', self.code_file, {'result': 'FAIL'})
+        os.remove('sample_1000_tests.json')
+        self.assertEqual(self.cache.lookup('1000', self.code_file), {'result': 'FAIL'})
+        self.assertTrue(os.path.exists('sample_1000_tests.json'))
+
+    def test_error_results_are_not_stored(self):
+        self.cache.store('1000', self.code_file, {'result': 'ERROR'})
+        self.assertIsNone(self.cache.lookup('1000', self.code_file))
+
+    def test_normalize_and_runner_version(self):
+        self.assertEqual(normalize_source(b"a  \r\nb\n\n"), b"a\nb")
+        self.assertNotEqual(runner_version({'warm_jvm': False}), runner_version({'warm_jvm': True}))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
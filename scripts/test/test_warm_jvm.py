@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+test/test_warm_jvm.py
+웜 JVM 하네스와의 통신 규약(OK/RUNTIME_ERROR/EXIT/TIMEOUT/OUTPUT_LIMIT)을 테스트하는 코드
+
+java 가 없어도 실행되도록 같은 규약으로 응답하는 파이썬 가짜 하네스를 command_prefix 로 띄워 검사하고,
+javac 가 있으면 실제 WarmJudgeHarness.java 로도 같은 경우를 검사합니다.
+"""
+
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+# test 디렉토리에서 상위 디렉토리의 scripts 모듈을 import 할 수 있도록 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))  # test 디렉토리
+parent_dir = os.path.dirname(current_dir)  # scripts 디렉토리
+sys.path.insert(0, parent_dir)
+
+from process_runner import (
+    VERDICT_OK, VERDICT_OUTPUT_LIMIT, VERDICT_RUNTIME_ERROR, VERDICT_TIME_LIMIT
+)
+from resource_limits import ResourceProfile
+from warm_jvm import WarmJvmHarness, WarmJvmPool
+
+# WarmJudgeHarness 와 같은 규약으로 응답하는 가짜 하네스. 클래스 이름으로 풀이의 동작을 고릅니다.
+# (java 명령과 JVM 옵션은 인자로 넘어오지만 무시합니다)
+FAKE_HARNESS = textwrap.dedent('''
+    import os, sys
+
+    def report(status, code, out=b"", err=b""):
+        header = "RESULT %s %d 1000000 %d %d\\n" % (status, code, len(out), len(err))
+        sys.stdout.buffer.write(header.encode("ascii") + out + err)
+        sys.stdout.buffer.flush()
+
+    for line in sys.stdin:
+        parts = line.rstrip("\\n").split("\\t")
+        if len(parts) != 7 or parts[0] != "RUN":
+            continue
+        class_name, input_path, limit = parts[2], parts[3], int(parts[5])
+        with open(input_path, "rb") as f:
+            data = f.read()
+        if class_name == "Echo":
+            report("OK", 0, data[::-1])
+        elif class_name == "Pid":
+            report("OK", 0, str(os.getpid()).encode())
+        elif class_name == "Throw":
+            report("RUNTIME_ERROR", 1, b"", b"java.lang.RuntimeException: boom")
+        elif class_name == "Exit":
+            report("EXIT", -1, b"partial")
+            os._exit(3)
+        elif class_name == "Sleep":
+            report("TIMEOUT", -1)
+            os._exit(0)
+        elif class_name == "Flood":
+            assert limit > 0
+            report("OUTPUT_LIMIT", -1)
+            os._exit(0)
+        elif class_name == "Crash":
+            os._exit(1)
+''')
+
+
+class TestWarmJvmProtocol(unittest.TestCase):
+    """가짜 하네스로 검사하는 통신 규약 테스트"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix='warm_jvm_test_')
+        fake_path = os.path.join(self.work_dir, 'fake_harness.py')
+        with open(fake_path, 'w', encoding='utf-8') as f:
+            f.write(FAKE_HARNESS)
+        self.harness = WarmJvmHarness(self.work_dir, command_prefix=[sys.executable, fake_path])
+        self.profile = ResourceProfile(cap_address_space=False)
+
+    def tearDown(self):
+        self.harness.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def run_class(self, class_name, input_data=b'abc'):
+        return self.harness.run(self.work_dir, class_name, input_data, 2, self.profile)
+
+    def harness_pid(self):
+        return int(self.run_class('Pid').output)
+
+    def test_ok_keeps_the_same_process(self):
+        """정상 종료는 출력을 그대로 돌려주고 다음 테스트에서도 같은 하네스를 재사용합니다"""
+        result = self.run_class('Echo')
+        self.assertEqual(result.verdict, VERDICT_OK)
+        self.assertEqual(result.output, b'cba')
+        self.assertEqual(self.harness_pid(), self.harness_pid())
+
+    def test_runtime_error_reports_stderr(self):
+        result = self.run_class('Throw')
+        self.assertEqual(result.verdict, VERDICT_RUNTIME_ERROR)
+        self.assertIn('boom', result.error)
+
+    def test_exit_uses_process_exit_code_and_restarts(self):
+        """System.exit 는 하네스의 종료 코드로 판정하고, 다음 테스트는 새 하네스에서 실행합니다"""
+        before = self.harness_pid()
+        result = self.run_class('Exit')
+        self.assertEqual(result.verdict, VERDICT_RUNTIME_ERROR)
+        self.assertIsNone(self.harness.process)
+        self.assertNotEqual(self.harness_pid(), before)
+
+    def test_timeout_and_output_limit_restart_the_harness(self):
+        for class_name, verdict in (('Sleep', VERDICT_TIME_LIMIT), ('Flood', VERDICT_OUTPUT_LIMIT)):
+            with self.subTest(class_name=class_name):
+                before = self.harness_pid()
+                self.assertEqual(self.run_class(class_name).verdict, verdict)
+                self.assertIsNone(self.harness.process)
+                self.assertNotEqual(self.harness_pid(), before)
+
+    def test_harness_dying_without_response_is_a_runtime_error(self):
+        result = self.run_class('Crash')
+        self.assertEqual(result.verdict, VERDICT_RUNTIME_ERROR)
+        self.assertIn('비정상 종료', result.error)
+        self.assertEqual(self.run_class('Echo').output, b'cba')
+
+
+SOLUTIONS = {
+    'Echo': '''
+        import java.io.*;
+        public class Echo {
+            public static void main(String[] args) throws IOException {
+                BufferedReader br = new BufferedReader(new InputStreamReader(System.in));
+                System.out.println(new StringBuilder(br.readLine()).reverse());
+            }
+        }
+    ''',
+    'Exit': '''
+        public class Exit {
+            public static void main(String[] args) { System.out.print("partial"); System.exit(3); }
+        }
+    ''',
+    'Sleep': '''
+        public class Sleep {
+            public static void main(String[] args) throws Exception { Thread.sleep(60_000); }
+        }
+    ''',
+    'Flood': '''
+        public class Flood {
+            public static void main(String[] args) { while (true) System.out.println("yyyyyyyyyyyyyyyy"); }
+        }
+    ''',
+}
+
+
+@unittest.skipUnless(shutil.which('javac') and shutil.which('java'), "javac 가 필요합니다")
+class TestWarmJudgeHarness(unittest.TestCase):
+    """실제 WarmJudgeHarness.java 로 검사하는 통신 규약 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.mkdtemp(prefix='warm_jvm_java_test_')
+        sources = []
+        for class_name, source in SOLUTIONS.items():
+            path = os.path.join(cls.work_dir, f'{class_name}.java')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(textwrap.dedent(source))
+            sources.append(path)
+        subprocess.run(['javac', '-d', cls.work_dir, *sources], check=True, capture_output=True)
+        cls.pool = WarmJvmPool(build_dir=os.path.join(cls.work_dir, 'harness'))
+        cls.profile = ResourceProfile(cap_address_space=False, output_limit_mb=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+        shutil.rmtree(cls.work_dir, ignore_errors=True)
+
+    def run_class(self, class_name, timeout=5):
+        harness = self.pool.acquire(self.profile.jvm_options())
+        return harness.run(self.work_dir, class_name, b'hello\n', timeout, self.profile)
+
+    def test_protocol_statuses(self):
+        result = self.run_class('Echo')
+        self.assertEqual(result.verdict, VERDICT_OK)
+        self.assertEqual(result.output, b'olleh\n')
+        self.assertEqual(self.run_class('Exit').verdict, VERDICT_RUNTIME_ERROR)
+        self.assertEqual(self.run_class('Sleep', timeout=1).verdict, VERDICT_TIME_LIMIT)
+        self.assertEqual(self.run_class('Flood').verdict, VERDICT_OUTPUT_LIMIT)
+        # 하네스가 종료된 뒤에도 다음 테스트는 새 하네스에서 정상 실행됩니다.
+        self.assertEqual(self.run_class('Echo').output, b'olleh\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+scripts/verdict_cache.py
+(정규화한 소스 해시, 테스트 세트 해시, 러너 버전)을 키로 하는 채점 결과 캐시
+
+PR 에 커밋이 추가될 때마다 모든 문제를 처음부터 다시 채점하지 않도록,
+소스와 테스트 세트와 러너가 모두 그대로인 문제는 저장된 결과를 그대로 사용합니다.
+
+테스트 생성은 매번 결과가 달라지므로, 채점에 사용한 테스트 파일도 (문제 번호, 소스 해시) 별로 함께 저장해 두고
+다음 실행에서 같은 소스를 만나면 저장된 테스트 세트로 해시를 계산합니다.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from data_store import TEST_DATA_DIR, find_data_files
+from result_records import record_to_json
+from stress_tests import REFERENCE_DIR, find_reference_solutions
+
+# 캐시 항목 형식이나 채점 규칙이 바뀌면 올려서 이전 결과를 모두 무효화합니다.
+CACHE_FORMAT_VERSION = 1
+
+# 러너 버전 계산에 포함하는 파일 (scripts 디렉토리 기준)
+RUNNER_SOURCE_PATTERNS = ('*.py', os.path.join('java', '*.java'))
+
+# 저장된 결과를 다시 사용하지 않는 판정 (네트워크 오류 등 일시적인 실패일 수 있음)
+UNCACHEABLE_RESULTS = ('ERROR',)
+
+
+def normalize_source(data):
+    """줄바꿈 형식, 줄 끝 공백, 앞뒤 빈 줄 차이를 무시하도록 소스를 정규화합니다."""
+    text = data.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+    return '\n'.join(line.rstrip() for line in text.split('\n')).strip('\n').encode('utf-8')
+
+
+def source_digest(code_file):
+    """정규화한 소스의 해시"""
+    with open(code_file, 'rb') as f:
+        return hashlib.sha256(normalize_source(f.read())).hexdigest()
+
+
+def test_set_files(problem_id):
+    """문제의 테스트 세트를 이루는 파일 (문제 정보, 샘플 테스트, 생성 테스트)"""
+    return [f'problem_{problem_id}_info.json', f'sample_{problem_id}_tests.json', f'tests_{problem_id}.json']
+
+
+def read_test_set(problem_id):
+    """현재 디렉토리의 테스트 세트 파일 내용. {파일 이름: 내용 또는 None (파일 없음)}"""
+    snapshot = {}
+    for name in test_set_files(problem_id):
+        try:
+            with open(name, 'r', encoding='utf-8') as f:
+                snapshot[name] = f.read()
+        except OSError:
+            snapshot[name] = None
+    return snapshot
+
+
+def _update_with_files(digest, label, paths, root=None):
+    for path in sorted(paths):
+        name = os.path.relpath(path, root) if root else path
+        digest.update(f'\0{label}\0{name}\0'.encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(chunk)
+        except OSError:
+            digest.update(b'\0missing')
+
+
+def test_set_digest(problem_id, code_file, snapshot):
+    """테스트 세트 해시. snapshot 은 {파일 이름: 내용 또는 None} 이며,
+    채점기 설정, 스트레스 테스트의 참고 풀이, 파일 테스트 데이터도 판정을 바꾸므로 함께 포함합니다."""
+    digest = hashlib.sha256()
+    for name in sorted(snapshot):
+        content = snapshot[name]
+        digest.update(f'\0test\0{name}\0'.encode('utf-8'))
+        digest.update(b'\0missing' if content is None else content.encode('utf-8'))
+    _update_with_files(digest, 'checker', glob.glob(os.path.join('checkers', str(problem_id), '*')))
+    references, _ = find_reference_solutions(problem_id, code_file)
+    _update_with_files(digest, REFERENCE_DIR, references)
+    _update_with_files(digest, TEST_DATA_DIR, find_data_files(problem_id))
+    return digest.hexdigest()
+
+
+def runner_version(options, java_version=None):
+    """러너 소스, JDK 버전, 판정에 영향을 주는 실행 옵션으로 러너 버전을 만듭니다."""
+    digest = hashlib.sha256(f'format {CACHE_FORMAT_VERSION}\0{java_version}\0'.encode('utf-8'))
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode('utf-8'))
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    for pattern in RUNNER_SOURCE_PATTERNS:
+        _update_with_files(digest, 'runner', glob.glob(os.path.join(scripts_dir, pattern)), scripts_dir)
+    return digest.hexdigest()
+
+
+def _write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 이름을 바꿔서, 동시에 실행되는 러너가 반쯤 쓰인 파일을 읽지 않게 합니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{path.name}_', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=record_to_json)
+        os.replace(temp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def _read_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class VerdictCache:
+    """테스트 세트는 <캐시 디렉토리>/test_sets/<문제번호>/<소스 해시>.json,
+    결과는 <캐시 디렉토리>/verdicts/<키 앞 2자리>/<키>.json 에 저장됩니다."""
+
+    def __init__(self, cache_dir, version):
+        self.root = Path(cache_dir)
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def key_for(self, source_hash, test_hash):
+        """소스 해시, 테스트 세트 해시, 러너 버전으로 캐시 키를 만듭니다."""
+        return hashlib.sha256(f'{source_hash}\0{test_hash}\0{self.version}'.encode('utf-8')).hexdigest()
+
+    def _test_set_path(self, problem_id, source_hash):
+        return self.root / 'test_sets' / str(problem_id) / f'{source_hash}.json'
+
+    def _verdict_path(self, key):
+        return self.root / 'verdicts' / key[:2] / f'{key}.json'
+
+    def _snapshot(self, problem_id, source_hash):
+        """현재 디렉토리의 테스트 파일을 우선 사용하고, 없으면 같은 소스로 채점했을 때 저장한 테스트 세트를 사용합니다."""
+        stored = _read_json(self._test_set_path(problem_id, source_hash)) or {}
+        return {name: content if content is not None else stored.get(name)
+                for name, content in read_test_set(problem_id).items()}
+
+    def lookup(self, problem_id, code_file):
+        """저장된 결과를 반환합니다. 없으면 None 을 반환합니다.
+
+        결과를 사용할 때는 저장된 테스트 파일 중 현재 디렉토리에 없는 것을 복원하여
+        이후 단계(README 갱신, 퍼징 등)가 같은 파일을 볼 수 있게 합니다.
+        """
+        try:
+            source_hash = source_digest(code_file)
+        except OSError:
+            return None
+        snapshot = self._snapshot(problem_id, source_hash)
+        entry = None
+        if any(content is not None for content in snapshot.values()):
+            key = self.key_for(source_hash, test_set_digest(problem_id, code_file, snapshot))
+            entry = _read_json(self._verdict_path(key))
+        with self.lock:
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None:
+            return None
+        for name, content in snapshot.items():
+            if content is not None and not os.path.exists(name):
+                with open(name, 'w', encoding='utf-8') as f:
+                    f.write(content)
+        return entry['result']
+
+    def store(self, problem_id, code_file, result):
+        """채점에 사용한 테스트 세트와 결과를 저장합니다."""
+        if result.get('result') in UNCACHEABLE_RESULTS:
+            return
+        try:
+            source_hash = source_digest(code_file)
+        except OSError:
+            return
+        snapshot = self._snapshot(problem_id, source_hash)
+        key = self.key_for(source_hash, test_set_digest(problem_id, code_file, snapshot))
+        _write_json_atomic(self._test_set_path(problem_id, source_hash), snapshot)
+        _write_json_atomic(self._verdict_path(key), {'problem_id': problem_id, 'result': result})
+
+    def stats(self):
+        """캐시 적중/미스 횟수를 반환합니다."""
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+scripts/warm_jvm.py
+하나의 JVM을 재사용하여 여러 테스트케이스를 실행하는 웜 JVM 실행기
+(scripts/java/WarmJudgeHarness.java 와 파이프로 통신합니다)
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+from process_runner import (
+    rusage_to_kb, classify_execution, BoundedCapture, ExecutionResult, STDERR_RETAIN_BYTES, STDOUT_RETAIN_BYTES,
+    VERDICT_RUNTIME_ERROR
+)
+
+HARNESS_SOURCE = Path(__file__).resolve().parent / 'java' / 'WarmJudgeHarness.java'
+HARNESS_CLASS = 'WarmJudgeHarness'
+
+# 하네스 프로세스가 응답하지 않을 때를 대비한 여유 시간 (초)
+HARNESS_GRACE_SECONDS = 5
+
+
+def compile_harness(build_dir):
+    """하네스 소스를 build_dir 에 컴파일합니다."""
+    try:
+        result = subprocess.run(
+            ['javac', '-encoding', 'UTF-8', '-d', build_dir, str(HARNESS_SOURCE)],
+            capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return False, str(e)
+    if result.returncode != 0:
+        return False, result.stderr or result.stdout or "하네스 컴파일 실패"
+    return True, ""
+
+
+def read_proc_cpu_times(pid):
+    """/proc/<pid>/stat 에서 (사용자 CPU 시간, 시스템 CPU 시간) 을 초 단위로 읽습니다."""
+    try:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        ticks = os.sysconf('SC_CLK_TCK')
+        return int(fields[11]) / ticks, int(fields[12]) / ticks
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def reset_peak_rss(pid):
+    """/proc/<pid>/clear_refs 에 5를 써서 최대 RSS(VmHWM) 기록을 초기화합니다."""
+    try:
+        with open(f'/proc/{pid}/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def read_peak_rss_kb(pid):
+    """/proc/<pid>/status 의 VmHWM(최대 RSS) 값을 KB 단위로 읽습니다."""
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class WarmJvmHarness:
+    """WarmJudgeHarness 프로세스 하나를 관리합니다.
+
+    테스트가 시간 초과되거나 풀이 코드가 System.exit 를 호출하면 하네스가 종료되므로,
+    다음 실행 시 자동으로 새 프로세스를 띄웁니다.
+    """
+
+    def __init__(self, build_dir, java_options=None, command_prefix=None):
+        self.build_dir = build_dir
+        self.java_options = list(java_options or [])
+        self.command_prefix = list(command_prefix or [])
+        self.process = None
+        self.lock = threading.Lock()
+
+    def _start(self):
+        self.process = subprocess.Popen(
+            [*self.command_prefix, 'java', *self.java_options, '-cp', self.build_dir, HARNESS_CLASS],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def _read_exact(self, size, capture=None):
+        """응답 본문을 size 바이트 읽습니다. capture 가 주어지면 조각 단위로 넘깁니다."""
+        if capture is None:
+            capture = BoundedCapture()
+        remaining = size
+        while remaining > 0:
+            chunk = self.process.stdout.read(min(remaining, 1 << 16))
+            if not chunk:
+                raise EOFError("웜 JVM 하네스 응답이 중간에 끊겼습니다.")
+            capture.write(chunk)
+            remaining -= len(chunk)
+        return capture.getvalue()
+
+    def _release_process(self):
+        """종료된 하네스 프로세스의 파이프를 닫고 연결을 끊습니다."""
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self.process = None
+
+    def _discard_process(self):
+        if self.process is None:
+            return None
+        try:
+            self.process.kill()
+        except OSError:
+            pass
+        returncode = self.process.wait()
+        self._release_process()
+        return returncode
+
+    def run(self, code_dir, class_name, input_data, timeout, profile, stdout_sink=None, input_file=None):
+        """run_java_program 과 같은 ExecutionResult 를 반환합니다.
+
+        input_file 이 주어지면 input_data(바이트) 대신 해당 파일을 표준 입력으로 사용합니다.
+
+        CPU 시간은 테스트 전후 하네스 프로세스의 CPU 시간 차이이고, 최대 RSS 는 테스트 직전에
+        VmHWM 을 초기화한 뒤 측정한 값이므로 JVM 자체가 사용하는 메모리도 포함됩니다.
+        """
+        with self.lock:
+            if self.process is not None and self.process.poll() is not None:
+                self._release_process()
+            if self.process is None:
+                self._start()
+
+            if input_file is not None:
+                input_path = os.path.abspath(input_file)
+            else:
+                fd, input_path = tempfile.mkstemp(prefix='input_', suffix='.txt', dir=self.build_dir)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(input_data)
+
+            # 하네스가 멈춘 경우에도 러너가 영원히 기다리지 않도록 안전장치를 둡니다.
+            process = self.process
+            peak_rss_tracked = reset_peak_rss(process.pid)
+            cpu_before = read_proc_cpu_times(process.pid)
+            metrics = {'wall_time': None, 'user_time': None, 'sys_time': None, 'peak_rss_kb': None}
+            watchdog = threading.Timer(timeout + HARNESS_GRACE_SECONDS, process.kill)
+            watchdog.start()
+            try:
+                request = (f"RUN\t{os.path.abspath(code_dir)}\t{class_name}\t{input_path}\t{int(timeout * 1000)}"
+                           f"\t{profile.output_limit_bytes()}\t{profile.main_stack_bytes()}\n")
+                process.stdin.write(request.encode('utf-8'))
+                process.stdin.flush()
+
+                header = process.stdout.readline().decode('ascii', errors='replace').split()
+                if len(header) != 6 or header[0] != 'RESULT':
+                    self._discard_process()
+                    return ExecutionResult(VERDICT_RUNTIME_ERROR, b"", 0, "웜 JVM 하네스가 비정상 종료되었습니다.", metrics)
+                status, exit_code = header[1], int(header[2])
+                execution_time = int(header[3]) / 1e9
+                stdout_capture = BoundedCapture(stdout_sink, STDOUT_RETAIN_BYTES if stdout_sink else None)
+                stdout = self._read_exact(int(header[4]), stdout_capture)
+                stderr = self._read_exact(int(header[5]), BoundedCapture(None, STDERR_RETAIN_BYTES))
+            except (OSError, EOFError, ValueError) as e:
+                self._discard_process()
+                return ExecutionResult(VERDICT_RUNTIME_ERROR, b"", 0, f"웜 JVM 하네스 통신 오류: {e}", metrics)
+            finally:
+                watchdog.cancel()
+                if input_file is None:
+                    os.remove(input_path)
+
+            metrics['wall_time'] = execution_time
+            cpu_after = read_proc_cpu_times(process.pid)
+            if cpu_before is not None and cpu_after is not None:
+                metrics['user_time'] = cpu_after[0] - cpu_before[0]
+                metrics['sys_time'] = cpu_after[1] - cpu_before[1]
+            if peak_rss_tracked:
+                metrics['peak_rss_kb'] = read_peak_rss_kb(process.pid)
+
+            if status in ('TIMEOUT', 'OUTPUT_LIMIT'):
+                self._discard_process()
+            if status == 'EXIT':
+                # System.exit 로 하네스가 종료되므로 프로세스의 종료 코드가 곧 풀이의 종료 코드입니다.
+                exit_code = self._reap_exited(process, cpu_before, metrics)
+                self._release_process()
+
+            return classify_execution(profile, exit_code, status == 'TIMEOUT', stdout, stderr,
+                                      execution_time, timeout, metrics, status == 'OUTPUT_LIMIT')
+
+    @staticmethod
+    def _reap_exited(process, cpu_before, metrics):
+        """종료된 하네스를 회수하면서 rusage 로 마지막 테스트의 CPU 시간과 최대 RSS 를 보정합니다."""
+        if not hasattr(os, 'wait4'):
+            return process.wait()
+        _, status, rusage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if cpu_before is not None:
+            metrics['user_time'] = rusage.ru_utime - cpu_before[0]
+            metrics['sys_time'] = rusage.ru_stime - cpu_before[1]
+        if metrics['peak_rss_kb'] is None:
+            metrics['peak_rss_kb'] = rusage_to_kb(rusage.ru_maxrss)
+        return process.returncode
+
+    def close(self):
+        """하네스 프로세스를 종료합니다."""
+        with self.lock:
+            if self.process is not None:
+                try:
+                    self.process.stdin.close()
+                    self.process.wait(timeout=HARNESS_GRACE_SECONDS)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._discard_process()
+                if self.process is not None:
+                    self._release_process()
+
+
+class WarmJvmPool:
+    """실행 스레드마다 하나씩 웜 JVM 하네스를 제공합니다.
+
+    하네스 소스는 처음 한 번만 컴파일하고 모든 하네스가 같은 빌드 디렉토리를 공유합니다.
+    """
+
+    def __init__(self, java_options=None, build_dir=None):
+        self.java_options = list(java_options or [])
+        self.build_dir = build_dir or tempfile.mkdtemp(prefix='warm_jvm_')
+        self.compiled = False
+        self.harnesses = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, java_options=(), command_prefix=()):
+        """현재 스레드에서 주어진 JVM 옵션으로 실행되는 전용 하네스를 반환합니다."""
+        key = (threading.get_ident(), tuple(java_options), tuple(command_prefix))
+        with self.lock:
+            if not self.compiled:
+                ok, error_msg = compile_harness(self.build_dir)
+                if not ok:
+                    raise RuntimeError(f"웜 JVM 하네스 컴파일 실패: {error_msg}")
+                self.compiled = True
+            harness = self.harnesses.get(key)
+            if harness is None:
+                harness = WarmJvmHarness(self.build_dir, [*self.java_options, *java_options], command_prefix)
+                self.harnesses[key] = harness
+            return harness
+
+    def close(self):
+        """모든 하네스를 종료하고 빌드 디렉토리를 정리합니다."""
+        with self.lock:
+            harnesses = list(self.harnesses.values())
+            self.harnesses.clear()
+        for harness in harnesses:
+            harness.close()
+        shutil.rmtree(self.build_dir, ignore_errors=True)